@@ -2,7 +2,7 @@ import logging
 
 from defabipedia.types import Chain
 
-from .generic_method import GenericMethodTransaction, Transactable
+from .generic_method import EncodedTx, GenericMethodTransaction, Transactable, encode_batch, to_encoded_txs
 from .roles_modifier import Operation
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -12,6 +12,7 @@ from roles_royce.applications.EURe_rebalancing_bot.env import ENV
 from roles_royce.applications.EURe_rebalancing_bot.prometheus import Gauges
 from roles_royce.applications.EURe_rebalancing_bot.utils import log_initial_data
 from roles_royce.applications.utils import web3_connection_check
+from roles_royce.rpc_pool import hedged_web3
 from roles_royce.toolshed.alerting import LoggingLevel, Messenger, SlackMessenger, TelegramMessenger
 from roles_royce.toolshed.alerting.utils import get_tx_receipt_message_with_transfers
 
@@ -126,7 +127,8 @@ def bot_do(w3, w3_mev) -> int:
         max_slippage=env.MAX_SLIPPAGE,
     )
 
-    swaps_data_manager = SwapsDataManager(w3, env.FIXER_API_ACCESS_KEY)
+    # The Curve quotes and oracle prices are latency critical, they are hedged between the RPC endpoints
+    swaps_data_manager = SwapsDataManager(hedged_web3(w3), env.FIXER_API_ACCESS_KEY)
     data = swaps_data_manager.get_data(amount_WXDAI, amount_EURe)
 
     drift_EURe_to_WXDAI = data.drift_EURe_to_WXDAI
@@ -5,12 +5,14 @@ from dataclasses import dataclass
 
 from defabipedia.lido import ContractSpecs
 from defabipedia.swap_pools import SwapPoolInstances
-from defabipedia.tokens import EthereumTokenAddr, erc20_contract
+from defabipedia.tokens import EthereumTokenAddr
 from defabipedia.types import Blockchain, Chain, SwapPools
 from web3 import Web3
 from web3.types import Address
 
+from roles_royce.chain import get_blockchain
 from roles_royce.constants import StrEnum
+from roles_royce.metadata_cache import get_token_symbol
 from roles_royce.utils import to_checksum_address
 
 from .utils import (
@@ -221,7 +223,7 @@ def seed_dict(dao: DAO, blockchain: Blockchain, positions: list) -> dict:
 
 
 def get_wrapped_from_native(w3: Web3) -> str:
-    Blockchain = Chain.get_blockchain_from_web3(w3)
+    Blockchain = get_blockchain(w3)
     if Blockchain == Chain.ETHEREUM:
         wrapped_token = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
         wrapped_symbol = "WETH"
@@ -281,7 +283,7 @@ class BalancerPosition:
         """
         if pool_tokens is None:
             pool_tokens = get_tokens_from_bpt(w3, self.bpt_address)
-        result = f"{Chain.get_blockchain_from_web3(w3)}_Balancer"
+        result = f"{get_blockchain(w3)}_Balancer"
         for token in pool_tokens:
             result = result + f"_{token['symbol']}"
         if self.staked:
@@ -304,7 +306,7 @@ class AuraPosition:
     def position_id_human_readable(self, w3: Web3, pool_tokens: list[dict] = None) -> str:
         if pool_tokens is None:
             pool_tokens = get_tokens_from_bpt(w3, self.bpt_address)
-        result = f"{Chain.get_blockchain_from_web3(w3)}_Aura"
+        result = f"{get_blockchain(w3)}_Aura"
         for token in pool_tokens:
             result = result + f"_{token['symbol']}"
         return result
@@ -323,7 +325,7 @@ class LidoPosition:
         return self.lido_address
 
     def position_id_human_readable(self, w3: Web3) -> str:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         if self.lido_address == ContractSpecs[blockchain].wstETH.address:
             return f"{blockchain}_Lido_wstETH"
         else:
@@ -343,15 +345,14 @@ class WalletPosition:
         return self.token_in_address
 
     def position_id_human_readable(self, w3: Web3) -> str:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         if self.token_in_address == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
             if blockchain == Chain.GNOSIS:
                 return f"{blockchain}_WalletPosition_xDAI"
             else:
                 return f"{blockchain}_WalletPosition_ETH"
         else:
-            token_contract = erc20_contract(w3, self.token_in_address)
-            token_symbol = token_contract.functions.symbol().call()
+            token_symbol = get_token_symbol(w3, self.token_in_address)
             return f"{blockchain}_WalletPosition_{token_symbol}"
 
 
@@ -368,7 +369,7 @@ class MakerPosition:
         return self.address
 
     def position_id_human_readable(self, w3: Web3) -> str:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         return f"{blockchain}_MakerPosition_{self.address}"
 
 
@@ -385,7 +386,7 @@ class SparkPosition:
         return self.address
 
     def position_id_human_readable(self, w3: Web3) -> str:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         return f"{blockchain}_SparkPosition_{self.address}"
 
 
@@ -595,7 +596,7 @@ class DAOStrategiesBuilder:
         for lido_position in positions:
             print("        Adding: ", lido_position)
             position = copy.deepcopy(lido_template)
-            blockchain = Chain.get_blockchain_from_web3(w3)
+            blockchain = get_blockchain(w3)
             position["position_id"] = lido_position.position_id
             position["position_id_tech"] = lido_position.position_id_tech()
             position["position_id_human_readable"] = lido_position.position_id_human_readable(w3)
@@ -665,7 +666,7 @@ class DAOStrategiesBuilder:
 
         result = []
         for wallet_position in positions:
-            blockchain = Chain.get_blockchain_from_web3(w3)
+            blockchain = get_blockchain(w3)
             for blockchain_entry in wallet_tokens_swap:
                 if blockchain in blockchain_entry:
                     for swap_entry in blockchain_entry[blockchain]:
@@ -684,15 +685,13 @@ class DAOStrategiesBuilder:
                             if token_in_address == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
                                 x, y, token_in_symbol = get_wrapped_from_native(w3)
                             else:
-                                token_in_contract = erc20_contract(w3, token_in_address)
-                                token_in_symbol = token_in_contract.functions.symbol().call()
+                                token_in_symbol = get_token_symbol(w3, token_in_address)
                             position["exec_config"][0]["parameters"][0]["options"][0]["label"] = token_in_symbol
                             for token_out in swap_entry["token_out"]:
                                 if token_out == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
                                     x, y, token_out_symbol = get_wrapped_from_native(w3)
                                 else:
-                                    token_out_contract = erc20_contract(w3, token_out)
-                                    token_out_symbol = token_out_contract.functions.symbol().call()
+                                    token_out_symbol = get_token_symbol(w3, token_out)
 
                                 position["exec_config"][0]["parameters"][2]["options"].append(
                                     {"value": token_out, "label": token_out_symbol}
@@ -732,17 +731,13 @@ class DAOStrategiesBuilder:
                                     i = 3
                                 if instance["pair"][0] == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
                                     x, y, token_in_symbol = get_wrapped_from_native(w3)
-                                    token_out_contract = erc20_contract(w3, instance["pair"][1])
-                                    token_out_symbol = token_out_contract.functions.symbol().call()
+                                    token_out_symbol = get_token_symbol(w3, instance["pair"][1])
                                 elif instance["pair"][1] == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
                                     x, y, token_out_symbol = get_wrapped_from_native(w3)
-                                    token_in_contract = erc20_contract(w3, instance["pair"][0])
-                                    token_in_symbol = token_in_contract.functions.symbol().call()
+                                    token_in_symbol = get_token_symbol(w3, instance["pair"][0])
                                 else:
-                                    token_in_contract = erc20_contract(w3, instance["pair"][0])
-                                    token_in_symbol = token_in_contract.functions.symbol().call()
-                                    token_out_contract = erc20_contract(w3, instance["pair"][1])
-                                    token_out_symbol = token_out_contract.functions.symbol().call()
+                                    token_in_symbol = get_token_symbol(w3, instance["pair"][0])
+                                    token_out_symbol = get_token_symbol(w3, instance["pair"][1])
                                 if (
                                     position["exec_config"][i]["parameters"][0]["options"][0]["value"]
                                     == "FillMewithTokenAddress"
@@ -797,7 +792,7 @@ class DAOStrategiesBuilder:
         for maker_position in positions:
             print("        Adding: ", maker_position)
             position = copy.deepcopy(maker_template)
-            blockchain = Chain.get_blockchain_from_web3(w3)
+            blockchain = get_blockchain(w3)
             position["position_id"] = maker_position.position_id
             position["position_id_tech"] = maker_position.position_id_tech()
             position["position_id_human_readable"] = maker_position.position_id_human_readable(w3)
@@ -825,7 +820,7 @@ class DAOStrategiesBuilder:
         for spark_position in positions:
             print("        Adding: ", spark_position)
             position = copy.deepcopy(spark_template)
-            blockchain = Chain.get_blockchain_from_web3(w3)
+            blockchain = get_blockchain(w3)
             position["position_id"] = spark_position.position_id
             position["position_id_tech"] = spark_position.position_id_tech()
             position["position_id_human_readable"] = spark_position.position_id_human_readable(w3)
@@ -2,10 +2,10 @@ import json
 import os
 
 from defabipedia import aura, balancer
-from defabipedia.types import Chain
 from web3 import Web3
 from web3.types import Address
 
+from roles_royce.chain import get_blockchain
 from roles_royce.utils import to_checksum_address
 
 
@@ -25,7 +25,7 @@ def update_aura_db(w3: Web3) -> list[dict]:
                     "bpt_address": "0xBpt_address"
               }]
     """
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     booster_ctr = aura.ContractSpecs[blockchain].Booster.contract(w3)
     pool_length = booster_ctr.functions.poolLength().call()
     result = []
@@ -63,7 +63,7 @@ def update_gauge_db(w3: Web3) -> list[dict]:
                     "bpt_address": "0xBpt_address"
               }]
     """
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     # lgf2_addr = balancer.ContractSpecs[blockchain].LiquidityGaugeFactory2.address
     lgf2_addr = "0xf1665E19bc105BE4EDD3739F88315cC699cc5b65"
     event_filter = w3.eth.filter(
@@ -2,19 +2,19 @@ import json
 import os
 
 from defabipedia import aura, balancer
-from defabipedia.tokens import erc20_contract
-from defabipedia.types import Chain
 from web3 import Web3
 from web3.types import Address
 
-from roles_royce.protocols.balancer.utils import Pool, PoolKind
+from roles_royce.chain import get_blockchain
+from roles_royce.metadata_cache import cached_metadata, get_token_symbol
+from roles_royce.protocols.balancer.utils import Pool, PoolKind, get_bpt_pool_id
 from roles_royce.utils import to_checksum_address
 
 
 def get_bpt_from_aura_address(w3: Web3, aura_address: Address) -> Address:
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     aura_contract = w3.eth.contract(address=aura_address, abi=aura.Abis[blockchain].BaseRewardPool.abi)
-    bpt_address = aura_contract.functions.asset().call()
+    bpt_address = cached_metadata(w3, "aura_asset", aura_address, aura_contract.functions.asset().call)
     return bpt_address
 
 
@@ -30,9 +30,7 @@ def get_aura_gauge_from_bpt(w3: Web3, bpt_address: Address) -> Address:
     Returns:
         Address of the Aura gauge token
     """
-    with open(
-        os.path.join(os.path.dirname(__file__), "db", f"aura_db_{Chain.get_blockchain_from_web3(w3)}.json"), "r"
-    ) as f:
+    with open(os.path.join(os.path.dirname(__file__), "db", f"aura_db_{get_blockchain(w3)}.json"), "r") as f:
         aura_db = json.load(f)
     for item in aura_db:
         if to_checksum_address(item.get("bpt_address")) == bpt_address:
@@ -55,19 +53,16 @@ def get_tokens_from_bpt(w3: Web3, bpt_address: Address) -> list[dict]:
                     "symbol": token_symbol
                 }]
     """
-    bpt_contract = w3.eth.contract(
-        address=bpt_address, abi=balancer.Abis[Chain.get_blockchain_from_web3(w3)].UniversalBPT.abi
-    )
+    bpt_contract = w3.eth.contract(address=bpt_address, abi=balancer.Abis[get_blockchain(w3)].UniversalBPT.abi)
     pool_id = bpt_contract.functions.getPoolId().call()
-    vault_contract = balancer.ContractSpecs[Chain.get_blockchain_from_web3(w3)].Vault.contract(w3)
+    vault_contract = balancer.ContractSpecs[get_blockchain(w3)].Vault.contract(w3)
     pool_tokens = vault_contract.functions.getPoolTokens(pool_id).call()[0]
     pool = Pool(w3=w3, pool_id=pool_id)
     if pool.pool_kind() == PoolKind.ComposableStablePool:
         del pool_tokens[pool.bpt_index_from_composable()]  # Remove the BPT if it is a composable stable
     result = []
     for token_address in pool_tokens:
-        token_contract = erc20_contract(w3, token_address)
-        token_symbol = token_contract.functions.symbol().call()
+        token_symbol = get_token_symbol(w3, token_address)
         result.append({"address": token_address, "symbol": token_symbol})
     return result
 
@@ -83,13 +78,11 @@ def get_gauge_address_from_bpt(w3: Web3, bpt_address: Address) -> Address:
         Address: The gauge address
     """
 
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     get_gauge_contract = balancer.ContractSpecs[blockchain].LiquidityGaugeFactory.contract(w3)
     gauge_address = get_gauge_contract.functions.getPoolGauge(bpt_address).call()
     if gauge_address == "0x0000000000000000000000000000000000000000":
-        with open(
-            os.path.join(os.path.dirname(__file__), "db", f"gauge_db_{Chain.get_blockchain_from_web3(w3)}.json"), "r"
-        ) as f:
+        with open(os.path.join(os.path.dirname(__file__), "db", f"gauge_db_{get_blockchain(w3)}.json"), "r") as f:
             gauge_db = json.load(f)
         for item in gauge_db:
             if to_checksum_address(item.get("bpt_address")) == bpt_address:
@@ -109,8 +102,4 @@ def get_pool_id_from_bpt(w3: Web3, bpt_address: Address) -> int:
     Returns:
         int: the pool_id of the pool
     """
-    bpt_contract = w3.eth.contract(
-        address=bpt_address, abi=balancer.Abis[Chain.get_blockchain_from_web3(w3)].UniversalBPT.abi
-    )
-    pool_id = "0x" + bpt_contract.functions.getPoolId().call().hex()
-    return pool_id
+    return get_bpt_pool_id(w3, bpt_address)
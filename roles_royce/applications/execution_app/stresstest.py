@@ -6,7 +6,6 @@ from dataclasses import dataclass
 
 from decouple import config
 from defabipedia.aura import Abis as AuraAbis
-from defabipedia.balancer import Abis as BalancerAbis
 from defabipedia.types import Chain
 from joblib import Parallel, delayed
 from web3 import Web3
@@ -15,6 +14,7 @@ from roles_royce.applications.execution_app.execute import execute_env
 from roles_royce.applications.execution_app.pulley_fork import PulleyFork
 from roles_royce.applications.execution_app.transaction_builder import build_transaction_env
 from roles_royce.applications.execution_app.utils import ENV, recovery_mode_balancer, start_the_engine
+from roles_royce.protocols.balancer.utils import get_gauge_bpt_address
 
 logging.basicConfig(
     level=logging.INFO,
@@ -61,8 +61,7 @@ def run_with_args(dao, protocol, blockchain, exit_strategy, percentage, exit_arg
 
     elif protocol == "Balancer" and (function_name == "exit_2_1" or function_name == "exit_2_3"):
         gauge_address = exit_arguments_dict["gauge_address"]
-        gauge_contract = w3.eth.contract(address=gauge_address, abi=BalancerAbis[bc].Gauge.abi)
-        bpt_address = gauge_contract.functions.lp_token().call()
+        bpt_address = get_gauge_bpt_address(w3, gauge_address)
         test = recovery_mode_balancer(w3, bpt_address, function_name, blockchain=bc)
         if test:
             if function_name == "exit_2_1":
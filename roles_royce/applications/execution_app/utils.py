@@ -1,6 +1,5 @@
 import json
 import logging
-import time
 from dataclasses import dataclass, field
 
 from decouple import config
@@ -12,9 +11,12 @@ from web3 import Web3
 from web3.exceptions import ContractLogicError
 from web3.types import Address
 
+from roles_royce.chain import get_blockchain
 from roles_royce.constants import StrEnum
 from roles_royce.generic_method import Transactable
 from roles_royce.protocols.base import Address, ContractMethod
+from roles_royce.roles import preload_roles_mod_multisend
+from roles_royce.rpc_pool import get_pooled_web3
 from roles_royce.toolshed.disassembling import (
     AuraDisassembler,
     BalancerDisassembler,
@@ -55,6 +57,7 @@ class ENV:
 
     AVATAR_SAFE_ADDRESS: Address = field(init=False)
     ROLES_MOD_ADDRESS: Address = field(init=False)
+    ROLES_MOD_MULTISEND_ADDRESS: Address | str = field(init=False)
     ROLE: int | str = field(init=False)
     PRIVATE_KEY: str = field(init=False)
     DISASSEMBLER_ADDRESS: Address = field(init=False)
@@ -98,6 +101,11 @@ class ENV:
             self.DAO.upper() + "_" + self.BLOCKCHAIN.upper() + "_ROLES_MOD_ADDRESS",
             default="",
         )
+        # Optional, the multisend of a roles v1 modifier, so it doesn't need to be read from the contract
+        self.ROLES_MOD_MULTISEND_ADDRESS: Address | str = config(
+            self.DAO.upper() + "_" + self.BLOCKCHAIN.upper() + "_ROLES_MOD_MULTISEND_ADDRESS",
+            default="",
+        )
         self.ROLE: str = config(self.DAO.upper() + "_" + self.BLOCKCHAIN.upper() + "_ROLE", default="0")
         try:
             self.ROLE = int(self.ROLE)
@@ -109,6 +117,8 @@ class ENV:
         )
         self.AVATAR_SAFE_ADDRESS = to_checksum_address(self.AVATAR_SAFE_ADDRESS)
         self.ROLES_MOD_ADDRESS = to_checksum_address(self.ROLES_MOD_ADDRESS)
+        if self.ROLES_MOD_MULTISEND_ADDRESS != "":
+            self.ROLES_MOD_MULTISEND_ADDRESS = to_checksum_address(self.ROLES_MOD_MULTISEND_ADDRESS)
         if self.PRIVATE_KEY != "":
             self.DISASSEMBLER_ADDRESS = Account.from_key(self.PRIVATE_KEY).address
         else:
@@ -163,29 +173,23 @@ class ExecConfig:
 
 
 def start_the_engine(env: ENV) -> tuple[Web3, Web3]:
+    if env.ROLES_MOD_MULTISEND_ADDRESS:
+        blockchain = Chain.ETHEREUM if env.BLOCKCHAIN == "ethereum" else Chain.GNOSIS
+        preload_roles_mod_multisend(env.ROLES_MOD_ADDRESS, env.ROLES_MOD_MULTISEND_ADDRESS, blockchain)
     if env.MODE == Modes.DEVELOPMENT:
         w3 = Web3(Web3.HTTPProvider(env.LOCAL_FORK_URL or f"http://{env.LOCAL_FORK_HOST}:{env.LOCAL_FORK_PORT}"))
         fork_unlock_account(w3, env.DISASSEMBLER_ADDRESS)
         top_up_address(w3, env.DISASSEMBLER_ADDRESS, 1)
         w3_MEV = w3
     else:
-        w3 = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT))
+        # The pools are shared by the process, the endpoints' health is checked in the background
+        w3 = get_pooled_web3([env.RPC_ENDPOINT, env.RPC_ENDPOINT_FALLBACK])
         if not w3.is_connected():
-            w3 = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT_FALLBACK))
-            if not w3.is_connected():
-                time.sleep(2)
-                w3 = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT))
-                if not w3.is_connected():
-                    w3 = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT_FALLBACK))
-                    if not w3.is_connected():
-                        raise Exception("No connection to RPC endpoint")
-        w3_MEV = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT_MEV))
-        if not w3_MEV.is_connected():
-            w3_MEV = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT))
-            if not w3_MEV.is_connected():
-                w3_MEV = Web3(Web3.HTTPProvider(env.RPC_ENDPOINT_FALLBACK))
-                if not w3_MEV.is_connected():
-                    raise Exception("No connection to RPC endpoint")
+            raise Exception("No connection to RPC endpoint")
+        # The MEV endpoint is preferred when it works, regardless of its latency
+        w3_MEV = get_pooled_web3(
+            [env.RPC_ENDPOINT_MEV, env.RPC_ENDPOINT, env.RPC_ENDPOINT_FALLBACK], latency_ranked=False
+        )
 
     return w3, w3_MEV
 
@@ -266,7 +270,7 @@ Holders = {
 
 def top_up_address(w3: Web3, address: str, amount: int) -> None:
     """Top up an address with ETH"""
-    holder = Holders[Chain.get_blockchain_from_web3(w3)]
+    holder = Holders[get_blockchain(w3)]
     if amount > (w3.eth.get_balance(holder) * 1e18) * 0.99:
         raise ValueError("Not enough ETH in the faucet account")
     fork_unlock_account(w3, holder)
@@ -299,7 +303,7 @@ def fork_reset_state(w3: Web3, url: str, block: int | str = "latest"):
 
 
 def recovery_mode_balancer(w3, bpt_address: str, exit_strategy: str, blockchain=None):
-    blockchain = blockchain or Chain.get_blockchain_from_web3(w3)
+    blockchain = blockchain or get_blockchain(w3)
     try:
         bpt_contract = w3.eth.contract(address=bpt_address, abi=BalancerAbis[blockchain].UniversalBPT.abi)
         bpt_pool_recovery_mode = bpt_contract.functions.inRecoveryMode().call()
@@ -17,6 +17,7 @@ from roles_royce.applications.utils import web3_connection_check
 from roles_royce.constants import ETHAddr
 from roles_royce.evm_utils import erc20_abi
 from roles_royce.protocols.eth import spark
+from roles_royce.rpc_pool import hedged_web3
 from roles_royce.toolshed.alerting import LoggingLevel, Messenger, SlackMessenger, TelegramMessenger
 from roles_royce.toolshed.alerting.utils import get_tx_receipt_message_with_transfers
 from roles_royce.toolshed.anti_liquidation.spark import CDPData, SparkCDPManager
@@ -85,7 +86,8 @@ def bot_do(w3: Web3, w3_execution: Web3) -> int:
 
     # -----------------------------------------------------------------------------------------------------------------------
 
-    cdp_manager = SparkCDPManager(w3, env.AVATAR_SAFE_ADDRESS)
+    # The health factor and prices are latency critical, the reads are hedged between the RPC endpoints
+    cdp_manager = SparkCDPManager(hedged_web3(w3), env.AVATAR_SAFE_ADDRESS)
     cdp = cdp_manager.get_cdp_data()
 
     if send_status_flag.is_set():
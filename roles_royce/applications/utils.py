@@ -6,6 +6,7 @@ from decouple import config
 from web3 import Web3
 from web3.middleware import geth_poa_middleware
 
+from roles_royce.rpc_pool import get_pooled_provider
 from roles_royce.toolshed.alerting import LoggingLevel, Messenger
 
 
@@ -76,47 +77,35 @@ def web3_connection_check(
         RPC endpoint failure counter if there was any connection error. If no rpc_endpoint_mev_url is provided both Web3
         objects are the same. If the maximum number of RPC endpoint failures is reached, the program exits.
     """
-    w3 = Web3(Web3.HTTPProvider(rpc_endpoint_url))
-    if not w3.is_connected(show_traceback=True):
-        time.sleep(5)
-        # Second attempt
-        if not w3.is_connected(show_traceback=True):
-            # Case where a fallback RPC endpoint is provided
-            if rpc_endpoint_fallback_url != "":
-                messenger.log_and_alert(
-                    LoggingLevel.Warning, title="Warning", message=f"  RPC endpoint {rpc_endpoint_url} is not working."
-                )
-                w3 = Web3(Web3.HTTPProvider(rpc_endpoint_fallback_url))
-                if not w3.is_connected(show_traceback=True):
-                    time.sleep(5)
-                    # Second attempt with fallback RPC endpoint
-                    if not w3.is_connected(show_traceback=True):
-                        messenger.log_and_alert(
-                            LoggingLevel.Warning,
-                            title="Warning",
-                            message=f"  RPC endpoint {rpc_endpoint_url} and fallback RPC "
-                            f"endpoint {rpc_endpoint_fallback_url} are both not "
-                            f"working.",
-                        )
-                        rpc_endpoint_failure_counter += 1
-                    else:
-                        rpc_endpoint_failure_counter = 0
-                else:
-                    rpc_endpoint_failure_counter = 0
-            # Case where no fallback RPC endpoint is provided
-            else:
-                messenger.log_and_alert(
-                    LoggingLevel.Warning, title="Warning", message=f"  RPC endpoint {rpc_endpoint_url} is not working."
-                )
-                rpc_endpoint_failure_counter += 1
-        else:
-            rpc_endpoint_failure_counter = 0
-    else:
+    # The pooled providers are shared between calls, so the connections are reused and the endpoints' health is
+    # checked in the background instead of sleeping between attempts
+    provider = get_pooled_provider([rpc_endpoint_url, rpc_endpoint_fallback_url])
+    w3 = Web3(provider)
+    if w3.is_connected(show_traceback=False):
         rpc_endpoint_failure_counter = 0
+        # Alert as soon as the last request to the primary endpoint failed, even if it is not ejected yet
+        if provider.endpoints[0].failures > 0:
+            messenger.log_and_alert(
+                LoggingLevel.Warning, title="Warning", message=f"  RPC endpoint {rpc_endpoint_url} is not working."
+            )
+    elif rpc_endpoint_fallback_url != "":
+        messenger.log_and_alert(
+            LoggingLevel.Warning,
+            title="Warning",
+            message=f"  RPC endpoint {rpc_endpoint_url} and fallback RPC "
+            f"endpoint {rpc_endpoint_fallback_url} are both not "
+            f"working.",
+        )
+        rpc_endpoint_failure_counter += 1
+    else:
+        messenger.log_and_alert(
+            LoggingLevel.Warning, title="Warning", message=f"  RPC endpoint {rpc_endpoint_url} is not working."
+        )
+        rpc_endpoint_failure_counter += 1
 
     if rpc_endpoint_execution_url != "":
-        w3_execution = Web3(Web3.HTTPProvider(rpc_endpoint_execution_url))
-        if not w3_execution.is_connected(show_traceback=True):
+        w3_execution = Web3(get_pooled_provider([rpc_endpoint_execution_url], health_check_interval=None))
+        if not w3_execution.is_connected(show_traceback=False):
             messenger.log_and_alert(
                 LoggingLevel.Warning,
                 title="Warning",
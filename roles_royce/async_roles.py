@@ -0,0 +1,392 @@
+"""Async counterparts of :mod:`roles_royce.roles` and :class:`~roles_royce.roles_modifier.RolesMod` built on
+``AsyncWeb3``, so a single event loop can build, check and send role transactions for many DAOs and chains."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List
+
+from defabipedia.multisend import ContractSpecs
+from defabipedia.types import Chain
+from web3 import AsyncWeb3, exceptions
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import TxParams, TxReceipt
+
+from roles_royce import evm_utils
+from roles_royce.chain import async_get_blockchain, async_get_chain_id
+from roles_royce.fee_oracle import BlockFees, get_fee_oracle
+from roles_royce.generic_method import Transactable
+from roles_royce.nonce_manager import NonceManager
+from roles_royce.roles import CheckResult, _cached_roles_mod_multisend, _store_roles_mod_multisend
+from roles_royce.roles_modifier import (
+    FeeHistoryGasStrategy,
+    GasStrategies,
+    RolesMod,
+    TransactionWouldBeReverted,
+    _fees,
+    get_gas_strategy,
+    raise_transaction_would_be_reverted,
+)
+from roles_royce.utils import multi_or_one
+
+logger = logging.getLogger(__name__)
+
+
+async def gather_dict(calls: dict[str, Callable[[], Awaitable[Any]]]) -> dict[str, Any]:
+    """Await independent calls concurrently and return their results by key."""
+    results = await asyncio.gather(*(call() for call in calls.values()))
+    return dict(zip(calls.keys(), results))
+
+
+class AsyncRolesMod(RolesMod):
+    """Async version of :class:`~roles_royce.roles_modifier.RolesMod`, ``w3`` must be an ``AsyncWeb3`` instance.
+
+    It has the same methods as ``RolesMod``, the ones that talk to the node are coroutines.
+    """
+
+    w3: AsyncWeb3
+
+    async def get_base_fee_per_gas(self) -> int:
+        reads, fees = self._fee_reads(GasStrategies.NORMAL)
+        if fees is None:
+            fees = get_fee_oracle().update(self.w3, **(await gather_dict(reads)))
+        return fees.base_fee_per_gas
+
+    def _fee_reads(self, gas_strategy: GasStrategies | FeeHistoryGasStrategy) -> tuple[dict, BlockFees | None]:
+        """Async version of :func:`roles_royce.roles_modifier._fee_reads`."""
+        if isinstance(gas_strategy, FeeHistoryGasStrategy):
+            return {
+                "fee_history": lambda: self.w3.eth.fee_history(
+                    gas_strategy.block_count, "latest", [gas_strategy.reward_percentile]
+                )
+            }, None
+        fees = get_fee_oracle().cached(self.w3)
+        if fees is not None:
+            return {}, fees
+        return {
+            "latest_block": lambda: self.w3.eth.get_block("latest"),
+            "max_priority_fee": lambda: self.w3.eth.max_priority_fee,
+        }, None
+
+    async def build(
+        self, contract_address: str, data: str, max_priority_fee: int | None = None, max_fee_per_gas: int | None = None
+    ) -> TxParams:
+        """Creates a transaction ready to be sent"""
+        return await self._build(
+            self.encode(contract_address, data),
+            max_priority_fee,
+            max_fee_per_gas,
+            estimate_gas=lambda: self.estimate_gas(contract_address, data),
+        )
+
+    async def build_encoded(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None = None,
+        max_fee_per_gas: int | None = None,
+        gas_limit: int | None = None,
+    ) -> TxParams:
+        """Creates a transaction ready to be sent from an already encoded ``execTransactionWithRole`` calldata."""
+        return await self._build(
+            exec_calldata,
+            max_priority_fee,
+            max_fee_per_gas,
+            gas_limit=gas_limit,
+            estimate_gas=lambda: self.estimate_gas_encoded(exec_calldata),
+        )
+
+    async def _build(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None,
+        max_fee_per_gas: int | None,
+        estimate_gas: Callable[[], Awaitable[int]],
+        gas_limit: int | None = None,
+        nonce: int | None = None,
+    ) -> TxParams:
+        gas_strategy = self.gas_strategy or get_gas_strategy()
+        chain_id = await async_get_chain_id(self.w3)
+        reads = {}
+        fees_needed = not max_priority_fee or not max_fee_per_gas
+        if fees_needed:
+            fee_reads, fees = self._fee_reads(gas_strategy)
+            reads.update(fee_reads)
+        if gas_limit is None:
+            reads["estimated_gas"] = estimate_gas
+        if nonce is None and not self.nonce:
+            reads["nonce"] = lambda: self.w3.eth.get_transaction_count(self.account)
+        results = await gather_dict(reads)
+
+        if fees_needed:
+            max_priority_fee, strategy_max_fee_per_gas = _fees(self.w3, gas_strategy, results, fees, max_priority_fee)
+            max_fee_per_gas = max_fee_per_gas or strategy_max_fee_per_gas
+        if gas_limit is None:
+            gas_limit = int(results["estimated_gas"] * gas_strategy.limit_multiplier)
+        if nonce is None:
+            nonce = self.nonce or results["nonce"]
+
+        return self._build_transaction(exec_calldata, gas_limit, max_priority_fee, max_fee_per_gas, nonce, chain_id)
+
+    async def check(self, contract_address: str, data: str, block="latest") -> bool:
+        """Make a static call to validate a transaction."""
+        return await self.check_encoded(self.encode(contract_address, data), block=block)
+
+    async def check_encoded(self, exec_calldata: str, block="latest") -> bool:
+        """Make a static call to validate an already encoded ``execTransactionWithRole`` calldata."""
+        try:
+            await self.w3.eth.call(
+                {"from": self.account, "to": self.contract_address, "data": exec_calldata}, block_identifier=block
+            )
+            return True
+        except exceptions.ContractCustomError as e:
+            raise_transaction_would_be_reverted(e)
+
+    async def estimate_gas(self, contract_address: str, data: str, block="latest") -> int:
+        """Estimate the gas that would be needed."""
+        return await self.estimate_gas_encoded(self.encode(contract_address, data), block=block)
+
+    async def estimate_gas_encoded(self, exec_calldata: str, block="latest") -> int:
+        """Estimate the gas that an already encoded ``execTransactionWithRole`` calldata would need."""
+        return await self.w3.eth.estimate_gas(
+            {"from": self.account, "to": self.contract_address, "data": exec_calldata}, block_identifier=block
+        )
+
+    async def check_and_estimate_gas(self, contract_address: str, data: str, block="latest") -> int:
+        """Validate a transaction and estimate its gas with a single execution on the node."""
+        return await self.check_and_estimate_gas_encoded(self.encode(contract_address, data), block=block)
+
+    async def check_and_estimate_gas_encoded(self, exec_calldata: str, block="latest") -> int:
+        """Same as :meth:`check_and_estimate_gas` for an already encoded ``execTransactionWithRole`` calldata."""
+        try:
+            return await self.estimate_gas_encoded(exec_calldata, block=block)
+        except exceptions.ContractCustomError as e:
+            raise_transaction_would_be_reverted(e)
+
+    async def execute(
+        self,
+        contract_address: str,
+        data: str,
+        max_priority_fee: int | None = None,
+        max_fee_per_gas: int | None = None,
+        check: bool = True,
+    ) -> str:
+        """Execute a role-based transaction. Returns the transaction hash as a str."""
+        estimate_gas = self.check_and_estimate_gas if check else self.estimate_gas
+        return await self._execute(
+            self.encode(contract_address, data),
+            max_priority_fee,
+            max_fee_per_gas,
+            estimate_gas=lambda: estimate_gas(contract_address, data),
+        )
+
+    async def execute_encoded(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None = None,
+        max_fee_per_gas: int | None = None,
+        check: bool = True,
+    ) -> str:
+        """Execute an already encoded ``execTransactionWithRole`` calldata. Returns the transaction hash as a str."""
+        estimate_gas = self.check_and_estimate_gas_encoded if check else self.estimate_gas_encoded
+        return await self._execute(
+            exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas=lambda: estimate_gas(exec_calldata)
+        )
+
+    async def _execute(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None,
+        max_fee_per_gas: int | None,
+        estimate_gas: Callable[[], Awaitable[int]],
+    ) -> str:
+        if self.nonce_manager is None:
+            tx = await self._build(exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas)
+            return await self._sign_and_send(tx)
+        async with self.nonce_manager.async_reserve(self.w3) as nonce:
+            tx = await self._build(exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas, nonce=nonce)
+            signed_txn = self._sign(tx)
+        try:
+            return await self._send(signed_txn)
+        except Exception:
+            # The transaction may have been broadcast or the nonce may be used already, only the node can tell
+            self.nonce_manager.resync()
+            raise
+
+    async def _sign_and_send(self, tx: TxParams) -> str:
+        return await self._send(self._sign(tx))
+
+    async def _send(self, signed_txn) -> str:
+        executed_txn = await self._send_raw_transaction(signed_txn.rawTransaction)
+        return executed_txn.hex()
+
+    async def _send_raw_transaction(self, raw_transaction):
+        return await self.w3.eth.send_raw_transaction(raw_transaction)
+
+    async def get_tx_receipt(self, tx_hash: str) -> TxReceipt:
+        """Get the transaction receipt from the blockchain."""
+        try:
+            return await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        except exceptions.TransactionNotFound:
+            return "Transaction not yet on blockchain"
+        except exceptions.TimeExhausted:
+            if self.nonce_manager is not None:
+                self.nonce_manager.resync()
+            raise
+
+
+async def use_old_multisend_if_needed(w3: AsyncWeb3, roles_mod_address: str, address: str) -> str:
+    """Async version of :func:`roles_royce.roles.use_old_multisend_if_needed`, sharing its cache."""
+    if address != ContractSpecs[Chain.GNOSIS].MultiSend.address:
+        return address
+    chain_id = await async_get_chain_id(w3)
+    multisend = _cached_roles_mod_multisend(chain_id, roles_mod_address)
+    if multisend is not None:
+        return multisend
+    contract = w3.eth.contract(roles_mod_address, abi=evm_utils.get_abi("roles_v1_abi"))
+    try:
+        multisend = await contract.functions.multisend().call()
+    except (ContractLogicError, BadFunctionCallOutput):
+        multisend = address
+    except Exception as e:
+        logger.warning(f"Unable to read the multisend of the roles modifier {roles_mod_address}: {e}")
+        return address
+    _store_roles_mod_multisend(chain_id, roles_mod_address, multisend)
+    return multisend
+
+
+class AsyncPreparedRoleTx:
+    """Async version of :class:`roles_royce.roles.PreparedRoleTx`, created with :meth:`create`.
+
+    Args:
+        roles_mod: The roles modifier set up for the transaction.
+        to: Target of the ``execTransactionWithRole`` call.
+        data: Calldata executed on the target.
+    """
+
+    def __init__(self, roles_mod: AsyncRolesMod, to: str, data: str):
+        self.roles_mod = roles_mod
+        self.to = to
+        self.data = data
+        self.calldata = roles_mod.encode(to, data)
+
+    @classmethod
+    async def create(
+        cls,
+        txs: List[Transactable],
+        role: int | str,
+        roles_mod_address: str,
+        web3: AsyncWeb3,
+        account: str | None = None,
+        private_key: str | None = None,
+        nonce_manager: NonceManager | None = None,
+        gas_strategy: GasStrategies | FeeHistoryGasStrategy | None = None,
+    ) -> "AsyncPreparedRoleTx":
+        tx_data = multi_or_one(txs, await async_get_blockchain(web3))
+        roles_mod = AsyncRolesMod(
+            role=role,
+            contract_address=roles_mod_address,
+            account=account,
+            private_key=private_key,
+            operation=tx_data.operation,
+            w3=web3,
+            value=tx_data.value,
+            nonce_manager=nonce_manager,
+            gas_strategy=gas_strategy,
+        )
+        to = await use_old_multisend_if_needed(web3, roles_mod_address, tx_data.contract_address)
+        return cls(roles_mod, to, tx_data.data)
+
+    @property
+    def account(self) -> str:
+        return self.roles_mod.account
+
+    async def check(self, block: int | str = "latest") -> bool:
+        """Test the transaction with a static call."""
+        return await self.roles_mod.check_encoded(self.calldata, block=block)
+
+    async def estimate_gas(self, block: int | str = "latest") -> int:
+        """Estimate the gas that the transaction would need."""
+        return await self.roles_mod.estimate_gas_encoded(self.calldata, block=block)
+
+    async def check_and_estimate_gas(self, block: int | str = "latest") -> int:
+        """Test the transaction and estimate its gas with a single execution on the node."""
+        return await self.roles_mod.check_and_estimate_gas_encoded(self.calldata, block=block)
+
+    async def build(self, tx_kwargs: dict | None = None) -> dict:
+        """Create the transaction dict, ``tx_kwargs`` are passed to :meth:`AsyncRolesMod.build_encoded`."""
+        tx = await self.roles_mod.build_encoded(self.calldata, **(tx_kwargs or {}))
+        tx["from"] = self.account
+        return tx
+
+    async def execute(self, tx_kwargs: dict | None = None) -> str:
+        """Send the transaction without waiting for it to be mined. Returns the transaction hash."""
+        return await self.roles_mod.execute_encoded(self.calldata, **(tx_kwargs or {}))
+
+    async def send(self, tx_kwargs: dict | None = None) -> TxReceipt:
+        """Send the transaction and wait for its receipt."""
+        return await self.roles_mod.get_tx_receipt(await self.execute(tx_kwargs))
+
+
+async def build(
+    txs: List[Transactable],
+    role: int | str,
+    account: str,
+    roles_mod_address: str,
+    web3: AsyncWeb3,
+    tx_kwargs: dict | None = None,
+) -> dict:
+    """Async version of :func:`roles_royce.roles.build`."""
+    prepared = await AsyncPreparedRoleTx.create(txs, role, roles_mod_address, web3, account=account)
+    return await prepared.build(tx_kwargs)
+
+
+async def check(
+    txs: List[Transactable],
+    role: int | str,
+    account: str,
+    roles_mod_address: str,
+    web3: AsyncWeb3,
+    block: int | str = "latest",
+) -> bool:
+    """Async version of :func:`roles_royce.roles.check`."""
+    prepared = await AsyncPreparedRoleTx.create(txs, role, roles_mod_address, web3, account=account)
+    return await prepared.check(block=block)
+
+
+async def check_many(
+    txs_list: List[List[Transactable]],
+    role: int | str,
+    account: str,
+    roles_mod_address: str,
+    web3: AsyncWeb3,
+    block: int | str = "latest",
+) -> List[CheckResult]:
+    """Async version of :func:`roles_royce.roles.check_many`."""
+
+    async def check_one(txs: List[Transactable]) -> CheckResult:
+        try:
+            prepared = await AsyncPreparedRoleTx.create(txs, role, roles_mod_address, web3, account=account)
+            await prepared.check(block=block)
+        except (TransactionWouldBeReverted, ContractLogicError) as e:
+            return CheckResult(passed=False, error=e)
+        return CheckResult(passed=True)
+
+    return list(await asyncio.gather(*(check_one(txs) for txs in txs_list)))
+
+
+async def send(
+    txs: List[Transactable],
+    role: int | str,
+    private_key: str,
+    roles_mod_address: str,
+    web3: AsyncWeb3,
+    tx_kwargs: dict | None = None,
+    nonce_manager: NonceManager | None = None,
+    wait_for_receipt: bool = True,
+) -> TxReceipt | str:
+    """Async version of :func:`roles_royce.roles.send`."""
+    prepared = await AsyncPreparedRoleTx.create(
+        txs, role, roles_mod_address, web3, private_key=private_key, nonce_manager=nonce_manager
+    )
+    if not wait_for_receipt:
+        return await prepared.execute(tx_kwargs)
+    return await prepared.send(tx_kwargs)
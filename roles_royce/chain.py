@@ -0,0 +1,69 @@
+import threading
+import weakref
+
+from defabipedia.types import Blockchain, Chain
+from web3 import AsyncWeb3, Web3
+
+_chain_ids_by_uri: dict[str, int] = {}
+_chain_ids_by_provider: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _provider_uri(provider) -> str | None:
+    uri = getattr(provider, "endpoint_uri", None) or getattr(provider, "ipc_path", None)
+    return str(uri) if uri else None
+
+
+def _cached_chain_id(provider) -> int | None:
+    uri = _provider_uri(provider)
+    if uri is not None:
+        return _chain_ids_by_uri.get(uri)
+    return _chain_ids_by_provider.get(provider)
+
+
+def _store_chain_id(provider, chain_id: int):
+    uri = _provider_uri(provider)
+    with _lock:
+        if uri is not None:
+            _chain_ids_by_uri[uri] = chain_id
+        else:
+            _chain_ids_by_provider[provider] = chain_id
+
+
+def get_chain_id(w3: Web3) -> int:
+    """Chain id of the Web3 instance, ``eth_chainId`` is only requested once per provider URL.
+
+    Providers without URL are memoized per provider instance. If the URL of a provider changes the chain id is
+    requested again.
+    """
+    chain_id = _cached_chain_id(w3.provider)
+    if chain_id is None:
+        chain_id = w3.eth.chain_id
+        _store_chain_id(w3.provider, chain_id)
+    return chain_id
+
+
+async def async_get_chain_id(w3: AsyncWeb3) -> int:
+    """Async version of :func:`get_chain_id`, sharing the same memoization."""
+    chain_id = _cached_chain_id(w3.provider)
+    if chain_id is None:
+        chain_id = await w3.eth.chain_id
+        _store_chain_id(w3.provider, chain_id)
+    return chain_id
+
+
+def get_blockchain(w3: Web3) -> Blockchain:
+    """Memoized version of ``Chain.get_blockchain_from_web3``."""
+    return Chain.get_blockchain_by_chain_id(get_chain_id(w3))
+
+
+async def async_get_blockchain(w3: AsyncWeb3) -> Blockchain:
+    """Async version of :func:`get_blockchain`."""
+    return Chain.get_blockchain_by_chain_id(await async_get_chain_id(w3))
+
+
+def clear_chain_cache():
+    """Forget the memoized chain ids, e.g. when a local fork is restarted on the same URL with another chain."""
+    with _lock:
+        _chain_ids_by_uri.clear()
+        _chain_ids_by_provider.clear()
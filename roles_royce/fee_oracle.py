@@ -0,0 +1,123 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Hashable
+
+from web3 import Web3
+
+from roles_royce.utils import run_concurrently
+
+# Used until the block time of an endpoint is learnt from two consecutive heads
+DEFAULT_BLOCK_TIME = 5
+
+
+@dataclass(frozen=True)
+class BlockFees:
+    """Fee market data of a block."""
+
+    block_number: int
+    timestamp: int
+    base_fee_per_gas: int
+    max_priority_fee: int
+
+    def max_fee_per_gas(self, fee_multiplier: float) -> int:
+        """Max fee per gas for a gas strategy fee multiplier, the priority fee plus the multiplied base fee."""
+        return self.max_priority_fee + int(self.base_fee_per_gas * fee_multiplier)
+
+
+class FeeOracle:
+    """Block scoped cache of the fee market data, shared by all the transaction builders of the process.
+
+    The latest block and the node's ``eth_maxPriorityFeePerGas`` are fetched once per block and endpoint. The data is
+    served from the cache until the next block head is expected, using the block time learnt from the heads seen, or
+    until :meth:`on_new_head` reports a newer block, e.g. from a :class:`~roles_royce.receipt_watcher.ReceiptWatcher`.
+
+    Args:
+        block_time: Seconds between blocks to use before it is learnt from the endpoint.
+    """
+
+    def __init__(self, block_time: float = DEFAULT_BLOCK_TIME):
+        self.block_time = block_time
+        self._fees: dict[Hashable, BlockFees] = {}
+        self._block_times: dict[Hashable, float] = {}
+        self._heads: dict[Hashable, int] = {}
+        self._locks: dict[Hashable, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    @staticmethod
+    def _key(w3: Web3) -> Hashable:
+        return getattr(w3.provider, "endpoint_uri", None) or id(w3.provider)
+
+    def _lock(self, key: Hashable) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _is_fresh(self, key: Hashable, fees: BlockFees) -> bool:
+        if fees.block_number < self._heads.get(key, 0):
+            return False
+        return time.time() < fees.timestamp + self._block_times.get(key, self.block_time)
+
+    def cached(self, w3: Web3) -> BlockFees | None:
+        """Fee data of the latest block if it is in the cache and still current."""
+        key = self._key(w3)
+        fees = self._fees.get(key)
+        if fees is not None and self._is_fresh(key, fees):
+            return fees
+        return None
+
+    def get(self, w3: Web3) -> BlockFees:
+        """Fee data of the latest block, fetched only if the cached one may be outdated."""
+        fees = self.cached(w3)
+        if fees is not None:
+            return fees
+        # Concurrent builders wait for the fetch in progress instead of repeating it
+        with self._lock(self._key(w3)):
+            fees = self.cached(w3)
+            if fees is not None:
+                return fees
+            return self.update(w3, **run_concurrently(self.reads(w3)))
+
+    @staticmethod
+    def reads(w3: Web3) -> dict:
+        """The calls that fetch the fee data, to be run together with other reads and passed to :meth:`update`."""
+        return {
+            "latest_block": lambda: w3.eth.get_block("latest"),
+            "max_priority_fee": lambda: w3.eth.max_priority_fee,
+        }
+
+    def update(self, w3: Web3, latest_block: dict, max_priority_fee: int) -> BlockFees:
+        """Store the fee data fetched with :meth:`reads`."""
+        key = self._key(w3)
+        new_fees = BlockFees(
+            block_number=latest_block["number"],
+            timestamp=latest_block["timestamp"],
+            base_fee_per_gas=latest_block["baseFeePerGas"],
+            max_priority_fee=max_priority_fee,
+        )
+        fees = self._fees.get(key)
+        if fees is not None and new_fees.block_number > fees.block_number:
+            block_time = (new_fees.timestamp - fees.timestamp) / (new_fees.block_number - fees.block_number)
+            if block_time > 0:
+                self._block_times[key] = block_time
+        if fees is None or new_fees.block_number >= fees.block_number:
+            self._fees[key] = new_fees
+        return new_fees
+
+    def on_new_head(self, w3: Web3, block_number: int):
+        """Report a new block head of the endpoint, cached data of older blocks is not served anymore."""
+        key = self._key(w3)
+        with self._lock(key):
+            self._heads[key] = max(self._heads.get(key, 0), block_number)
+
+    def clear(self):
+        self._fees.clear()
+        self._block_times.clear()
+        self._heads.clear()
+
+
+_fee_oracle = FeeOracle()
+
+
+def get_fee_oracle() -> FeeOracle:
+    """Get the process wide fee oracle"""
+    return _fee_oracle
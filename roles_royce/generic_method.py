@@ -1,10 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 from web3 import Web3
 from web3.types import HexStr
 
-from .protocols.base import Operation
+from .protocols.base import ContractMethod, Operation
 
 
 class TransactableWithProperties(Protocol):
@@ -42,7 +42,7 @@ class TransactableWithValues(Protocol):
 Transactable = TransactableWithProperties | TransactableWithValues
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TxData:
     """Implements the Transactable protocol as a dataclass"""
 
@@ -52,7 +52,7 @@ class TxData:
     value: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GenericMethodTransaction:
     function_name: str
     function_args: list
@@ -70,3 +70,42 @@ class GenericMethodTransaction:
         contract = Web3().eth.contract(address=None, abi=self.contract_abi)
         result = contract.encode_abi(fn_name=self.function_name, args=self.function_args)
         return result
+
+
+class EncodedTx(NamedTuple):
+    """Immutable, tuple-backed Transactable with the calldata already encoded.
+
+    It takes a fraction of the memory of a :class:`~roles_royce.protocols.base.ContractMethod`, so it is the
+    shape to use to hold large plans in memory.
+    """
+
+    contract_address: str
+    data: str
+    operation: Operation = Operation.CALL
+    value: int = 0
+
+    @classmethod
+    def from_transactable(cls, tx: Transactable) -> "EncodedTx":
+        return cls(tx.contract_address, tx.data, Operation(tx.operation), tx.value)
+
+
+def to_encoded_txs(txs: list[Transactable]) -> list[EncodedTx]:
+    """Convert transactables to :class:`EncodedTx`, encoding the calldata in bulk with :func:`encode_batch`."""
+    return [
+        EncodedTx(tx.contract_address, data, Operation(tx.operation), tx.value)
+        for tx, data in zip(txs, encode_batch(txs))
+    ]
+
+
+def encode_batch(txs: list[Transactable]) -> list[str]:
+    """Calldata of many transactables.
+
+    The :class:`~roles_royce.protocols.base.ContractMethod` instances are encoded with
+    :meth:`~roles_royce.protocols.base.ContractMethod.encode_many`, the rest of transactables provide their own data.
+
+    Returns:
+        The calldata of each transactable, in the same order.
+    """
+    methods = [tx for tx in txs if isinstance(tx, ContractMethod)]
+    encoded = iter(ContractMethod.encode_many(methods))
+    return [next(encoded) if isinstance(tx, ContractMethod) else tx.data for tx in txs]
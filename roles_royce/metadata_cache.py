@@ -0,0 +1,164 @@
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from web3 import Web3
+
+from roles_royce import evm_utils
+from roles_royce.chain import get_chain_id
+from roles_royce.utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+_MISSING = object()
+
+
+def _encode(value: Any) -> str:
+    def default(obj):
+        if isinstance(obj, bytes):
+            return {"__bytes__": obj.hex()}
+        raise TypeError(f"{type(obj).__name__} values can't be cached")
+
+    return json.dumps(value, default=default)
+
+
+def _decode(text: str) -> Any:
+    def object_hook(obj: dict):
+        if obj.keys() == {"__bytes__"}:
+            return bytes.fromhex(obj["__bytes__"])
+        return obj
+
+    return json.loads(text, object_hook=object_hook)
+
+
+class MetadataCache:
+    """Persistent store of immutable on-chain facts, like token decimals or Balancer pool ids, per chain.
+
+    The values are kept in a SQLite database shared by all the processes using the same file, so restarted bots and
+    new workers don't read them from the chain again. Values must be JSON serializable or bytes, tuples are returned
+    as lists.
+
+    Only facts that can never change must be stored, e.g. ``decimals()`` of a token but not its balance.
+
+    Args:
+        path: Database file, ``None`` keeps the cache in memory only.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        self.path = path
+        # Encoded values, decoded on each read so callers can't modify the cached ones
+        self._memory: dict[tuple[int, str, str], str] = {}
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False, timeout=10)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS metadata "
+                "(chain_id INTEGER, kind TEXT, key TEXT, value TEXT, PRIMARY KEY (chain_id, kind, key))"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _key(chain_id: int, kind: str, key: str) -> tuple[int, str, str]:
+        return chain_id, kind, str(key).lower()
+
+    def get(self, chain_id: int, kind: str, key: str, default: Any = None) -> Any:
+        """Cached value of ``kind`` for ``key``, e.g. ``("decimals", token_address)``."""
+        full_key = self._key(chain_id, kind, key)
+        encoded = self._memory.get(full_key)
+        if encoded is None and self._db is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT value FROM metadata WHERE chain_id = ? AND kind = ? AND key = ?", full_key
+                ).fetchone()
+            if row is not None:
+                encoded = self._memory[full_key] = row[0]
+        return default if encoded is None else _decode(encoded)
+
+    def set(self, chain_id: int, kind: str, key: str, value: Any):
+        full_key = self._key(chain_id, kind, key)
+        encoded = self._memory[full_key] = _encode(value)
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute("INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?)", full_key + (encoded,))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Unable to store {kind} of {key} in the metadata cache: {e}")
+
+    def clear(self):
+        """Remove all the cached values."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM metadata")
+                self._db.commit()
+
+
+_cache: MetadataCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache_path() -> Path:
+    return get_cache_dir() / "metadata.sqlite"
+
+
+def get_metadata_cache() -> MetadataCache:
+    """The global metadata cache, stored in the roles_royce cache directory.
+
+    If the database can't be opened, e.g. in a read-only file system, the values are only cached in memory.
+    """
+    global _cache
+    if _cache is not None:
+        return _cache
+    with _cache_lock:
+        if _cache is None:
+            path = get_metadata_cache_path()
+            try:
+                _cache = MetadataCache(path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Unable to open the metadata cache in {path}, using a memory cache: {e}")
+                _cache = MetadataCache()
+    return _cache
+
+
+def cached_metadata(w3: Web3, kind: str, key: str, fetch: Callable[[], T]) -> T:
+    """Value of an immutable fact of the chain of ``w3``, read with ``fetch`` only if it is not cached.
+
+    If ``fetch`` raises the exception is propagated and nothing is cached.
+    """
+    cache = get_metadata_cache()
+    chain_id = get_chain_id(w3)
+    value = cache.get(chain_id, kind, key, _MISSING)
+    if value is _MISSING:
+        cache.set(chain_id, kind, key, fetch())
+        # Read back, so the value is the same whether it was cached or not, e.g. lists instead of tuples
+        value = cache.get(chain_id, kind, key)
+    return value
+
+
+def get_token_decimals(w3: Web3, token_address: str) -> int:
+    """Decimals of an ERC20 token."""
+    return cached_metadata(
+        w3,
+        "decimals",
+        token_address,
+        lambda: w3.eth.contract(address=token_address, abi=evm_utils.get_abi("erc20_abi")).functions.decimals().call(),
+    )
+
+
+def get_token_symbol(w3: Web3, token_address: str) -> str:
+    """Symbol of an ERC20 token."""
+    return cached_metadata(
+        w3,
+        "symbol",
+        token_address,
+        lambda: w3.eth.contract(address=token_address, abi=evm_utils.get_abi("erc20_abi")).functions.symbol().call(),
+    )
@@ -0,0 +1,201 @@
+import threading
+from typing import Any, Callable
+
+from eth_abi import abi
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+# Multicall3 is deployed at the same address in all the chains, see https://www.multicall3.com
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+# aggregate3((address,bool,bytes)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+MAX_CALLS_PER_MULTICALL = 500
+
+_state = threading.local()
+
+
+def get_active_batch(w3: Web3) -> "MulticallBatch | None":
+    """The innermost :class:`MulticallBatch` context of ``w3`` open in the current thread, if any."""
+    for batch in reversed(getattr(_state, "batches", ())):
+        if batch.w3 is w3:
+            return batch
+    return None
+
+
+class MulticallResult:
+    """Placeholder for the result of a call queued in a :class:`MulticallBatch`.
+
+    The result is available in :attr:`value` once the batch is flushed, reading it before flushes the batch. Iterating
+    and indexing are delegated to the value, so multiple return values can be unpacked as usual.
+    """
+
+    def __init__(self, batch: "MulticallBatch", description: str, decode: Callable[[bytes], Any]):
+        self._batch = batch
+        self._description = description
+        self._decode = decode
+        self._done = False
+        self._value = None
+        self._error: Exception | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def value(self) -> Any:
+        """The decoded result, raises the error of the call if it failed."""
+        if not self._done:
+            self._batch.flush()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _set(self, success: bool, return_data: bytes):
+        self._done = True
+        if not success:
+            self._error = ContractLogicError(f"{self._description} reverted", data="0x" + return_data.hex())
+            return
+        try:
+            self._value = self._decode(return_data)
+        except Exception as e:
+            self._error = BadFunctionCallOutput(f"Could not decode the output of {self._description}: {e}")
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __getitem__(self, item):
+        return self.value[item]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        if not self._done:
+            return f"<MulticallResult {self._description} pending>"
+        return f"<MulticallResult {self._description} {self._error or self._value!r}>"
+
+
+class MulticallBatch:
+    """Queues read calls and makes them with Multicall3 ``aggregate3`` calls, one per ``MAX_CALLS_PER_MULTICALL`` reads.
+
+    Inside the context, :meth:`ContractMethod.call <roles_royce.protocols.base.ContractMethod.call>` on the same
+    ``w3`` is queued and returns a :class:`MulticallResult`, other calls can be queued with :meth:`add_function`
+    (Web3 contract functions) and :meth:`add`. The queued calls are made when the context exits, when :meth:`flush`
+    is called or when the value of any pending result is read.
+
+    Each call may fail without affecting the others, its result then raises a ``ContractLogicError``. If the request
+    itself fails, all the results of its calls raise the error.
+
+    Example::
+
+        with MulticallBatch(w3) as batch:
+            balances = [BalanceOf(token, avatar).call(w3) for token in tokens]
+            supply = batch.add_function(bpt_contract.functions.totalSupply())
+        balances = [balance.value for balance in balances]
+
+    Args:
+        w3: Web3 object.
+        block_identifier: Block where all the calls are made.
+        max_calls: Maximum number of calls in each ``aggregate3`` call.
+    """
+
+    def __init__(self, w3: Web3, block_identifier: int | str = "latest", max_calls: int = MAX_CALLS_PER_MULTICALL):
+        self.w3 = w3
+        self.block_identifier = block_identifier
+        self.max_calls = max_calls
+        self._queue: list[tuple[str, bytes, MulticallResult]] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "MulticallBatch":
+        if not hasattr(_state, "batches"):
+            _state.batches = []
+        _state.batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _state.batches.remove(self)
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        """Number of queued calls."""
+        return len(self._queue)
+
+    def accepts(self, block_identifier: int | str | None = None, **kwargs) -> bool:
+        """Whether a call with these ``call()`` kwargs can be made as part of the batch."""
+        return not kwargs and block_identifier in (None, self.block_identifier)
+
+    def add(
+        self, target: str, calldata: str | bytes, decode: Callable[[bytes], Any], description: str = ""
+    ) -> MulticallResult:
+        """Queue a call to ``target`` with ``calldata``, its return data is decoded with ``decode``."""
+        if isinstance(calldata, str):
+            calldata = bytes.fromhex(calldata.removeprefix("0x"))
+        result = MulticallResult(self, description or f"call to {target}", decode)
+        with self._lock:
+            self._queue.append((target, calldata, result))
+        return result
+
+    def add_method(self, method) -> MulticallResult:
+        """Queue the read call of a :class:`~roles_royce.protocols.base.ContractMethod`."""
+        encoder = method.get_encoder()
+        return self.add(
+            method.target_address,
+            method.data,
+            encoder.decode_output,
+            f"{encoder.short_signature} on {method.target_address}",
+        )
+
+    def add_function(self, function) -> MulticallResult:
+        """Queue the call of a Web3 contract function, e.g. ``contract.functions.totalSupply()``."""
+        output_types = get_abi_output_types(function.abi)
+
+        def decode(data: bytes):
+            decoded = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, self.w3.codec.decode(output_types, data))
+            return decoded[0] if len(decoded) == 1 else decoded
+
+        return self.add(
+            function.address, function._encode_transaction_data(), decode, f"{function.fn_name} on {function.address}"
+        )
+
+    def flush(self):
+        """Make the queued calls.
+
+        If a request fails, e.g. because of the RPC endpoint, the results of its calls raise the error, the other
+        requests are still made and the first error is raised.
+        """
+        with self._lock:
+            queue, self._queue = self._queue, []
+        error = None
+        for start in range(0, len(queue), self.max_calls):
+            calls = queue[start : start + self.max_calls]
+            try:
+                self._aggregate(calls)
+            except Exception as e:
+                for _, _, result in calls:
+                    if not result._done:
+                        result._done, result._error = True, e
+                error = error or e
+        if error is not None:
+            raise error
+
+    def _aggregate(self, calls: list[tuple[str, bytes, MulticallResult]]):
+        if len(calls) == 1:
+            # A single call doesn't need the Multicall3 overhead
+            target, calldata, result = calls[0]
+            try:
+                return_data = self.w3.eth.call({"to": target, "data": calldata}, block_identifier=self.block_identifier)
+            except ContractLogicError as e:
+                result._done, result._error = True, e
+                return
+            result._set(True, bytes(return_data))
+            return
+
+        encoded_calls = [(target, True, calldata) for target, calldata, _ in calls]
+        data = AGGREGATE3_SELECTOR + abi.encode(["(address,bool,bytes)[]"], [encoded_calls])
+        return_data = self.w3.eth.call({"to": MULTICALL3_ADDRESS, "data": data}, block_identifier=self.block_identifier)
+        (results,) = abi.decode(["(bool,bytes)[]"], bytes(return_data))
+        for (_, _, result), (success, result_data) in zip(calls, results):
+            result._set(success, result_data)
@@ -0,0 +1,99 @@
+import logging
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator
+
+from web3 import AsyncWeb3, Web3
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager:
+    """Hands out increasing nonces for a signer without querying the node for every transaction.
+
+    The first nonce is synced from the pending transaction count of the signer, the following ones are incremented
+    locally, so several transactions can be in flight at the same time. It is thread safe: a manager can be shared by
+    all the threads sending transactions from the same signer in the same chain.
+
+    Use :meth:`reserve` around the build and sign steps: if any of them fails the nonce is given back and handed out
+    again before any new one, so no gap is left even if later nonces are already in use. Once the transaction is sent
+    the nonce must not be given back, the node may have broadcast it even if the request failed: call :meth:`resync`
+    when a send fails or a transaction is known to be dropped or replaced.
+
+    Args:
+        address: Address of the signer.
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self._next_nonce: int | None = None
+        # Nonces given back below the counter, reused lowest first
+        self._released: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _take(self) -> int:
+        if self._released:
+            nonce = min(self._released)
+            self._released.remove(nonce)
+            return nonce
+        nonce = self._next_nonce
+        self._next_nonce += 1
+        return nonce
+
+    def next_nonce(self, w3: Web3) -> int:
+        """Return the nonce to use for the next transaction and move the counter forward."""
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = w3.eth.get_transaction_count(self.address, "pending")
+                logger.debug(f"Nonce of {self.address} synced to {self._next_nonce}")
+            return self._take()
+
+    async def async_next_nonce(self, w3: AsyncWeb3) -> int:
+        """Async version of :meth:`next_nonce`."""
+        while True:
+            with self._lock:
+                if self._next_nonce is not None:
+                    return self._take()
+            # The lock can't be held while awaiting, the first coroutine to get the count syncs the manager
+            pending_count = await w3.eth.get_transaction_count(self.address, "pending")
+            with self._lock:
+                if self._next_nonce is None:
+                    self._next_nonce = pending_count
+                    logger.debug(f"Nonce of {self.address} synced to {self._next_nonce}")
+
+    def release(self, nonce: int):
+        """Give back a nonce that was not used to send a transaction."""
+        with self._lock:
+            if self._next_nonce is None or nonce >= self._next_nonce:
+                return
+            self._released.add(nonce)
+            # Move the counter back over the released nonces at its top
+            while self._next_nonce - 1 in self._released:
+                self._next_nonce -= 1
+                self._released.remove(self._next_nonce)
+
+    def resync(self):
+        """Forget the local counter, the next nonce is fetched again from the node."""
+        with self._lock:
+            self._next_nonce = None
+            self._released.clear()
+
+    @contextmanager
+    def reserve(self, w3: Web3) -> Iterator[int]:
+        """Context manager that yields the next nonce and releases it if the block raises."""
+        nonce = self.next_nonce(w3)
+        try:
+            yield nonce
+        except Exception:
+            self.release(nonce)
+            raise
+
+    @asynccontextmanager
+    async def async_reserve(self, w3: AsyncWeb3) -> AsyncIterator[int]:
+        """Async version of :meth:`reserve`."""
+        nonce = await self.async_next_nonce(w3)
+        try:
+            yield nonce
+        except Exception:
+            self.release(nonce)
+            raise
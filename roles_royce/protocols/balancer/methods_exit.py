@@ -1,8 +1,9 @@
 from decimal import Decimal
 
-from defabipedia.types import Blockchain, Chain
+from defabipedia.types import Blockchain
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
 from roles_royce.constants import MAX_UINT256, ZERO
 from roles_royce.protocols.balancer.types_and_enums import (
     ComposableStablePoolExitKind,
@@ -79,7 +80,7 @@ class ExactBptSingleTokenExit(_ExactBptSingleTokenExit):
             exit_token_index_up = exit_token_index
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_kind=pool_kind,
             pool_id=pool_id,
             avatar=avatar,
@@ -143,7 +144,7 @@ class ExactBptProportionalExit(_ExactBptProportionalExit):
         pool_kind = pool.pool_kind()
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_kind=pool_kind,
             pool_id=pool_id,
             avatar=avatar,
@@ -208,7 +209,7 @@ class ExactTokensExit(_ExactTokensExit):
         pool_kind = pool.pool_kind()
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_kind=pool_kind,
             pool_id=pool_id,
             avatar=avatar,
@@ -280,7 +281,7 @@ class ExactBptRecoveryModeExit(_ExactBptRecoveryModeExit):
         min_amounts_out = [0] * len(assets)
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             assets=assets,
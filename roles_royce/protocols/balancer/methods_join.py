@@ -1,8 +1,9 @@
 from decimal import Decimal
 
-from defabipedia.types import Blockchain, Chain
+from defabipedia.types import Blockchain
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
 from roles_royce.constants import MAX_UINT256, ZERO
 from roles_royce.protocols.balancer.types_and_enums import StablePoolJoinKind
 from roles_royce.protocols.base import Address
@@ -62,7 +63,7 @@ class ExactBptSingleTokenJoin(_ExactBptSingleTokenJoin):
         max_amounts_in = [0] * join_token_index + [max_amount_in] + [0] * (len(assets) - join_token_index - 1)
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             assets=assets,
@@ -120,7 +121,7 @@ class ProportionalJoin(_ProportionalJoin):
             assets = Pool(w3, pool_id).assets()
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             assets=assets,
@@ -171,7 +172,7 @@ class ExactTokensJoin(_ExactTokensJoin):
             assets = Pool(w3, pool_id).assets()
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             assets=assets,
@@ -200,7 +201,7 @@ class ExactSingleTokenJoin(_ExactTokensJoin):
         amounts_in = [0] * join_token_index + [amount_in] + [0] * (len(assets) - join_token_index - 1)
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             assets=assets,
@@ -1,7 +1,8 @@
 from defabipedia.balancer import ContractSpecs
-from defabipedia.types import Blockchain, Chain
+from defabipedia.types import Blockchain
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
 from roles_royce.constants import MAX_UINT256
 from roles_royce.protocols.balancer.types_and_enums import SwapKind
 from roles_royce.protocols.base import Address, AvatarAddress, ContractMethod
@@ -100,7 +101,7 @@ class ExactTokenInSingleSwap(SingleSwap):
     ):
         swap_kind = SwapKind.OutGivenExactIn
         super().__init__(
-            blockchain=Chain.get_blockchain_by_chain_id(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             swap_kind=swap_kind,
@@ -124,7 +125,7 @@ class ExactTokenOutSingleSwap(SingleSwap):
     ):
         swap_kind = SwapKind.InGivenExactOut
         super().__init__(
-            blockchain=Chain.get_blockchain_by_chain_id(w3),
+            blockchain=get_blockchain(w3),
             pool_id=pool_id,
             avatar=avatar,
             swap_kind=swap_kind,
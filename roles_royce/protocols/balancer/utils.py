@@ -1,43 +1,89 @@
 from defabipedia.balancer import Abis, ContractSpecs
-from defabipedia.types import Chain
 from web3 import Web3
 from web3.exceptions import ContractLogicError
 
+from roles_royce.chain import get_blockchain, get_chain_id
+from roles_royce.metadata_cache import cached_metadata, get_metadata_cache
+
 from .types_and_enums import PoolKind
 
 
+def get_bpt_pool_id(w3: Web3, bpt_address: str) -> str:
+    """
+    Returns the pool id of a BPT as a hex string
+    """
+    bpt_contract = w3.eth.contract(address=bpt_address, abi=Abis[get_blockchain(w3)].UniversalBPT.abi)
+    return cached_metadata(
+        w3, "balancer_pool_id", bpt_address, lambda: "0x" + bpt_contract.functions.getPoolId().call().hex()
+    )
+
+
+def get_gauge_bpt_address(w3: Web3, gauge_address: str) -> str:
+    """
+    Returns the address of the BPT staked in a gauge
+    """
+    gauge_contract = w3.eth.contract(address=gauge_address, abi=Abis[get_blockchain(w3)].Gauge.abi)
+    return cached_metadata(w3, "gauge_lp_token", gauge_address, gauge_contract.functions.lp_token().call)
+
+
 class Pool:
     def __init__(self, w3: Web3, pool_id: str):
         self.w3 = w3
         self.pool_id = pool_id
-        blockchain = Chain.get_blockchain_from_web3(self.w3)
+        blockchain = get_blockchain(self.w3)
         self.vault_contract = ContractSpecs[blockchain].Vault.contract(self.w3)
-        bpt_address = self.vault_contract.functions.getPool(self.pool_id).call()[0]
+        bpt_address = cached_metadata(
+            self.w3, "balancer_pool_address", pool_id, lambda: self.vault_contract.functions.getPool(pool_id).call()[0]
+        )
         self.bpt_contract = self.w3.eth.contract(address=bpt_address, abi=Abis[blockchain].UniversalBPT.abi)
 
     def pool_kind(self) -> PoolKind:
         """
         Returns the kind of pool
         """
+        cache = get_metadata_cache()
+        chain_id = get_chain_id(self.w3)
+        kind = cache.get(chain_id, "balancer_pool_kind", self.pool_id)
+        if kind is None:
+            kind, cacheable = self._fetch_pool_kind()
+            if cacheable:
+                cache.set(chain_id, "balancer_pool_kind", self.pool_id, kind.value)
+        return PoolKind(kind)
+
+    def _fetch_pool_kind(self) -> tuple[PoolKind, bool]:
+        """The kind of pool, and whether it can be cached.
+
+        A ValueError (e.g. an error of the RPC endpoint) may be transient, so a kind decided after one is not cached.
+        """
+        errors = []
         try:
             self.bpt_contract.functions.getNormalizedWeights().call()
-            return PoolKind.WeightedPool
-        except (ContractLogicError, ValueError):
+            kind = PoolKind.WeightedPool
+        except (ContractLogicError, ValueError) as e:
+            errors.append(e)
             try:
                 self.bpt_contract.functions.getBptIndex().call()
-                return PoolKind.ComposableStablePool
-            except (ContractLogicError, ValueError):
+                kind = PoolKind.ComposableStablePool
+            except (ContractLogicError, ValueError) as e:
+                errors.append(e)
                 try:
                     self.bpt_contract.functions.inRecoveryMode().call()
-                    return PoolKind.StablePool
-                except (ContractLogicError, ValueError):
-                    return PoolKind.MetaStablePool
+                    kind = PoolKind.StablePool
+                except (ContractLogicError, ValueError) as e:
+                    errors.append(e)
+                    kind = PoolKind.MetaStablePool
+        return kind, all(isinstance(e, ContractLogicError) for e in errors)
 
     def assets(self) -> list[str]:
         """
         Returns the assets of a pool given a pool id
         """
-        return self.vault_contract.functions.getPoolTokens(self.pool_id).call()[0]
+        return cached_metadata(
+            self.w3,
+            "balancer_pool_assets",
+            self.pool_id,
+            lambda: self.vault_contract.functions.getPoolTokens(self.pool_id).call()[0],
+        )
 
     def pool_balances(self) -> list[int]:
         """
@@ -53,7 +99,9 @@ class Pool:
         if pool_kind != PoolKind.ComposableStablePool:
             raise ValueError("Pool is not a composable stable pool")
         else:
-            return self.bpt_contract.functions.getBptIndex().call()
+            return cached_metadata(
+                self.w3, "balancer_bpt_index", self.pool_id, self.bpt_contract.functions.getBptIndex().call
+            )
 
     def bpt_balance(self, address: str) -> int:
         return self.bpt_contract.functions.balanceOf(address).call()
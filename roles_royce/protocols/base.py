@@ -2,7 +2,15 @@ import json
 from enum import IntEnum
 from types import SimpleNamespace
 
-from web3 import Web3
+from eth_abi.codec import ABICodec
+from eth_abi.exceptions import EncodingError
+from eth_abi.grammar import parse
+from eth_abi.registry import registry as default_registry
+from eth_utils import function_signature_to_4byte_selector, hexstr_if_str, to_bytes, to_checksum_address, to_text
+from web3._utils.abi import build_strict_registry, map_abi_data, named_tree
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS, abi_address_to_hex, abi_bytes_to_bytes, abi_string_to_text
+
+from roles_royce.multicall import get_active_batch
 
 Address = str
 
@@ -31,6 +39,119 @@ class Operation(IntEnum):
     DELEGATE_CALL = 1
 
 
+# Same codecs that Web3 uses to encode (strict bytes checking) and to decode function inputs
+_encoding_codec = ABICodec(build_strict_registry())
+_decoding_codec = ABICodec(default_registry)
+_INPUT_NORMALIZERS = [abi_address_to_hex, abi_bytes_to_bytes, abi_string_to_text]
+
+
+def _abi_for(element) -> dict:
+    name, _type = element
+    if type(_type) in (list, tuple):
+        value = {
+            "name": name,
+            "type": _type[1],  # tuple or tuple[]
+            "components": [_abi_for(e) for e in _type[0]],
+        }
+    else:
+        value = {"name": name, "type": _type}
+    return value
+
+
+def _get_arg_type(element) -> str:
+    _type = element[1]
+    if type(_type) in (list, tuple):
+        types = ",".join([_get_arg_type(e) for e in _type[0]])
+        value = f"({types}){_type[1].removeprefix('tuple')}"  # keep the array suffix of tuple[]
+    else:
+        value = _type
+    return value
+
+
+def _compile_normalizer(param: dict):
+    """Returns a function that normalizes a python value of the abi param the same way as decoding it would do."""
+    _type = param["type"]
+    if _type.endswith("]"):
+        normalize_item = _compile_normalizer({**param, "type": _type[: _type.rindex("[")]})
+        return lambda value: [normalize_item(item) for item in value]
+    if _type == "tuple":
+        return _compile_tuple_normalizer(param["components"])
+    base = parse(_type).base
+    if base == "address":
+        return to_checksum_address
+    if base == "bytes":
+        return lambda value: hexstr_if_str(to_bytes, value)
+    if base == "string":
+        return lambda value: value if isinstance(value, str) else to_text(value)
+    if base in ("int", "uint"):
+        return int
+    if base == "bool":
+        return bool
+    return lambda value: value
+
+
+def _compile_tuple_normalizer(params: list[dict]):
+    names = [param["name"] for param in params]
+    normalizers = [_compile_normalizer(param) for param in params]
+    return lambda values: {name: normalize(value) for name, normalize, value in zip(names, normalizers, values)}
+
+
+class MethodEncoder:
+    """Compiled encoding plan of a contract function.
+
+    Holds the abi, the 4 bytes selector and the eth_abi types of a function so that they are computed once
+    and then reused to encode the calldata of every call, without creating Web3 contracts.
+    """
+
+    def __init__(self, name: str, in_signature, out_signature):
+        self.name = name
+        self.types = tuple(_get_arg_type(e) for e in in_signature)
+        self.short_signature = f"{name}({','.join(self.types)})"
+        self.selector = function_signature_to_4byte_selector(self.short_signature)
+        self.abi = {
+            "name": name,
+            "type": "function",
+            "inputs": [_abi_for(e) for e in in_signature],
+            "outputs": [_abi_for(e) for e in out_signature],
+        }
+        self.abi_json = json.dumps([self.abi])
+        self.output_types = tuple(_get_arg_type(e) for e in out_signature)
+        self._normalize_inputs = _compile_tuple_normalizer(self.abi["inputs"])
+
+    def encode_args(self, args: list) -> bytes:
+        """ABI encode the arguments, without the selector."""
+        try:
+            normalized = map_abi_data(_INPUT_NORMALIZERS, self.types, args)
+            return _encoding_codec.encode(self.types, normalized)
+        except EncodingError as e:
+            raise TypeError(
+                f"One or more arguments of {self.short_signature} could not be encoded to the necessary ABI type: {e}"
+            ) from e
+
+    def encode(self, args: list) -> str:
+        """Calldata of the function called with ``args`` as a hex str."""
+        return "0x" + (self.selector + self.encode_args(args)).hex()
+
+    def inputs(self, args: list) -> dict:
+        """The arguments as a dict normalized like Web3's ``decode_function_input`` does, without encoding them."""
+        return self._normalize_inputs(args)
+
+    def decode(self, data: str | bytes) -> dict:
+        """Decode the calldata into a dict with the arguments, the same as Web3's ``decode_function_input``."""
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix("0x"))
+        decoded = _decoding_codec.decode(self.types, data[4:])
+        decoded = map_abi_data(BASE_RETURN_NORMALIZERS, self.types, decoded)
+        return named_tree(self.abi["inputs"], decoded)
+
+    def decode_output(self, data: bytes):
+        """Decode the return data of a call, the same as Web3's contract function ``call`` does."""
+        decoded = map_abi_data(
+            BASE_RETURN_NORMALIZERS, self.output_types, _decoding_codec.decode(self.output_types, data)
+        )
+        return decoded[0] if len(decoded) == 1 else decoded
+
+
 class ContractMethod:
     """Inherit this class to declare a contract function.
 
@@ -59,9 +180,7 @@ class ContractMethod:
         self.value = value  # Eg: amount of ETH in mainnet, xDai in GC
         self.avatar = avatar
         self.args = Args()
-        self._initialized = True
         self.operation: Operation = Operation.CALL
-        self._inputs = None
 
     @property
     def contract_address(self) -> str:
@@ -71,43 +190,68 @@ class ContractMethod:
     def args_list(self):
         return [self._get_arg_value(e) for e in self.in_signature]
 
+    @classmethod
+    def get_encoder(cls) -> MethodEncoder:
+        """The compiled encoding plan of the method, built on first use and cached in the class."""
+        # Look only in the class' own namespace, a subclass may change the name or the signatures
+        encoder = cls.__dict__.get("_encoder")
+        if encoder is None:
+            encoder = MethodEncoder(cls.name, cls.in_signature, cls.out_signature)
+            cls._encoder = encoder
+        return encoder
+
+    @classmethod
+    def encode_many(cls, methods: list["ContractMethod"]) -> list[str]:
+        """Calldata of many methods.
+
+        A convenience wrapper over :attr:`data`, it gives no extra speedup: the encoding plan of each class
+        is already compiled once and cached by :meth:`get_encoder`.
+
+        Args:
+            methods: ContractMethod instances, of any subclass.
+
+        Returns:
+            The calldata of each method, in the same order.
+        """
+        return [method.data for method in methods]
+
+    def _check_initialized(self):
+        if "args" not in self.__dict__:
+            raise ValueError(f"Missing super().__init__() call in {self.__class__.__name__}.__init__ method")
+
     @property
     def data(self) -> str:
         """Calldata of the method."""
-        if not hasattr(self, "_initialized"):
-            raise ValueError(f"Missing super().__init__() call in {self.__class__.__name__}.__init__ method")
-        contract = Web3().eth.contract(address=None, abi=self.abi)
-        result = contract.encode_abi(fn_name=self.name, args=self.args_list)
-        # Decode what we encoded to re-use the web3py normalizers
-        self._inputs = contract.decode_function_input(result)[1]
-        return result
+        self._check_initialized()
+        return self.get_encoder().encode(self.args_list)
 
     @property
     def short_signature(self):
         """Something like 'deposit(address,uint256,address,uint16)'"""
-        types = ",".join([self._get_arg_type(e) for e in self.in_signature])
-        return f"{self.name}({types})"
+        return self.get_encoder().short_signature
 
     @property
     def abi(self):
         """The abi of the method, for example to be used with Web3."""
-        inputs = [self._abi_for(e) for e in self.in_signature]
-        outputs = [self._abi_for(e) for e in self.out_signature]
-        abi = {"name": self.name, "type": "function", "inputs": inputs, "outputs": outputs}
-        return json.dumps([abi])
+        return self.get_encoder().abi_json
 
     @property
     def inputs(self):
         """Return a dict with the arguments of the method"""
-        if self._inputs is None:
-            _ = self.data  # Calc the inputs
-        return self._inputs
+        self._check_initialized()
+        return self.get_encoder().inputs(self.args_list)
 
     def call(self, web3, *args, **kwargs):
         """Does a read call on the method.
 
         To use it the ``out_signature`` must be defined if the method's output is not empty.
+
+        Inside a :class:`~roles_royce.multicall.MulticallBatch` context of the same ``web3`` the call is queued and a
+        :class:`~roles_royce.multicall.MulticallResult` is returned instead.
         """
+        batch = get_active_batch(web3)
+        if batch is not None and not args and batch.accepts(**kwargs):
+            return batch.add_method(self)
         contract = web3.eth.contract(address=self.target_address, abi=self.abi)
         return contract.functions[self.name](*self.args_list).call(*args, **kwargs)
 
@@ -132,27 +276,6 @@ class ContractMethod:
                 value = getattr(self.args, arg_name)
         return value
 
-    def _abi_for(self, element):
-        name, _type = element
-        if type(_type) in (list, tuple):
-            value = {
-                "name": name,
-                "type": _type[1],  # tuple or tuple[]
-                "components": [self._abi_for(e) for e in _type[0]],
-            }
-        else:
-            value = {"name": name, "type": _type}
-        return value
-
-    def _get_arg_type(self, element):
-        _type = element[1]
-        if type(_type) in (list, tuple):
-            types = ",".join([self._get_arg_type(e) for e in _type[0]])
-            value = f"({types})"
-        else:
-            value = _type
-        return value
-
 
 class BaseApprove(ContractMethod):
     """Inherit from this class to define an approval where the token is fixed.
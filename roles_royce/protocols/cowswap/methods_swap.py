@@ -1,8 +1,8 @@
 from defabipedia.cowswap_signer import ContractSpecs
-from defabipedia.types import Chain
 from web3 import Web3
 from web3.types import Address
 
+from roles_royce.chain import get_blockchain
 from roles_royce.generic_method import Transactable
 from roles_royce.protocols.base import AvatarAddress
 from roles_royce.protocols.cowswap.contract_methods import SignOrder
@@ -43,7 +43,7 @@ def create_order_and_swap(
     """
 
     order = quote_order_api(
-        blockchain=Chain.get_blockchain_from_web3(w3),
+        blockchain=get_blockchain(w3),
         sell_token=sell_token,
         buy_token=buy_token,
         receiver=avatar,
@@ -57,7 +57,7 @@ def create_order_and_swap(
     order.sell_amount = order.sell_amount if kind == SwapKind.SELL else int(order.sell_amount * (1 + max_slippage))
 
     response_create_order = create_order_api(
-        blockchain=Chain.get_blockchain_from_web3(w3),
+        blockchain=get_blockchain(w3),
         sell_token=order.sell_token,
         buy_token=order.buy_token,
         receiver=order.receiver,
@@ -76,14 +76,14 @@ def create_order_and_swap(
         w3=w3,
         avatar=avatar,
         token=sell_token,
-        spender=ContractSpecs[Chain.get_blockchain_from_web3(w3)].CowswapRelayer.address,
+        spender=ContractSpecs[get_blockchain(w3)].CowswapRelayer.address,
         amount=order.sell_amount,
     )
     if approve_transactable:
         result.append(approve_transactable)
 
     sign_order_transactable = SignOrder(
-        blockchain=Chain.get_blockchain_from_web3(w3),
+        blockchain=get_blockchain(w3),
         avatar=avatar,
         sell_token=order.sell_token,
         buy_token=order.buy_token,
@@ -129,14 +129,14 @@ def swap(w3: Web3, order: Order, valid_duration: int = 10 * 60) -> list[Transact
         w3=w3,
         avatar=order.from_address,
         token=order.sell_token,
-        spender=ContractSpecs[Chain.get_blockchain_from_web3(w3)].CowswapRelayer.address,
+        spender=ContractSpecs[get_blockchain(w3)].CowswapRelayer.address,
         amount=order.sell_amount,
     )
     if approve_transactable:
         result.append(approve_transactable)
 
     sign_order_transactable = SignOrder(
-        blockchain=Chain.get_blockchain_from_web3(w3),
+        blockchain=get_blockchain(w3),
         avatar=order.receiver,
         sell_token=order.sell_token,
         buy_token=order.buy_token,
@@ -1 +1 @@
-from .contract_methods import MultiSend
+from .contract_methods import MultiSend, MultiSendBuilder, encode_multisend_tx
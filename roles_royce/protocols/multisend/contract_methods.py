@@ -1,18 +1,77 @@
+from typing import Iterable
+
 from defabipedia import Blockchain
 from defabipedia.multisend import ContractSpecs
-from hexbytes import HexBytes
 
 from roles_royce import Transactable
 from roles_royce.protocols.base import ContractMethod, Operation
 
 
+def _data_to_bytes(data: str | bytes | None) -> bytes:
+    if not data:
+        return b""
+    if isinstance(data, str):
+        return bytes.fromhex(data.removeprefix("0x"))
+    return data
+
+
 def encode_multisend_tx(operation: int, to, value: int, data: str):
-    data = HexBytes(data) if data else b""
-    operation = HexBytes("{:0>2x}".format(operation))  # Operation 1 byte
-    to = HexBytes("{:0>40x}".format(int(to, 16)))  # Address 20 bytes
-    value = HexBytes("{:0>64x}".format(value))  # Value 32 bytes
-    data_length = HexBytes("{:0>64x}".format(len(data)))  # Data length 32 bytes
-    return operation + to + value + data_length + data
+    data = _data_to_bytes(data)
+    return (
+        int(operation).to_bytes(1, "big")  # Operation 1 byte
+        + int(to, 16).to_bytes(20, "big")  # Address 20 bytes
+        + value.to_bytes(32, "big")  # Value 32 bytes
+        + len(data).to_bytes(32, "big")  # Data length 32 bytes
+        + data
+    )
+
+
+class MultiSendBuilder:
+    """Packs transactions for the MultiSend contract incrementally.
+
+    The packed records are appended to a single growable buffer, so batches of any size, even fed from a
+    generator, are packed in linear time.
+    """
+
+    def __init__(self, txns: Iterable[Transactable] = ()):
+        self._buffer = bytearray()
+        self._count = 0
+        self.extend(txns)
+
+    def __len__(self) -> int:
+        """Number of transactions added."""
+        return self._count
+
+    def add(self, operation: int, to: str, value: int, data: str | bytes | None) -> "MultiSendBuilder":
+        """Append a transaction to the batch."""
+        data = _data_to_bytes(data)
+        buffer = self._buffer
+        buffer.append(int(operation))
+        buffer += int(to, 16).to_bytes(20, "big")
+        buffer += value.to_bytes(32, "big")
+        buffer += len(data).to_bytes(32, "big")
+        buffer += data
+        self._count += 1
+        return self
+
+    def add_transactable(self, tx: Transactable) -> "MultiSendBuilder":
+        """Append a transactable to the batch."""
+        return self.add(tx.operation, tx.contract_address, tx.value, tx.data)
+
+    def extend(self, txns: Iterable[Transactable]) -> "MultiSendBuilder":
+        """Append all the transactables of an iterable to the batch."""
+        for tx in txns:
+            self.add_transactable(tx)
+        return self
+
+    @property
+    def encoded_txns(self) -> bytes:
+        """The packed transactions, to be used as the ``transactions`` argument of ``multiSend``."""
+        return bytes(self._buffer)
+
+    def build(self, blockchain: Blockchain, target_address: str | None = None) -> "MultiSend":
+        """Create the MultiSend method with the packed transactions."""
+        return MultiSend(blockchain, self.encoded_txns, target_address)
 
 
 class MultiSend(ContractMethod):
@@ -38,8 +97,7 @@ class MultiSend(ContractMethod):
         self.target_address = target_address or ContractSpecs[blockchain].MultiSend.address
 
     @classmethod
-    def from_transactables(cls, blockchain: Blockchain, txns: list[Transactable], target_address: str | None = None):
-        encoded_data = b"".join(
-            [encode_multisend_tx(tx.operation, tx.contract_address, tx.value, tx.data) for tx in txns]
-        )
-        return MultiSend(blockchain, encoded_data, target_address)
+    def from_transactables(
+        cls, blockchain: Blockchain, txns: Iterable[Transactable], target_address: str | None = None
+    ):
+        return MultiSendBuilder(txns).build(blockchain, target_address)
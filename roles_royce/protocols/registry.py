@@ -0,0 +1,199 @@
+"""Global index of the ContractMethod classes of all the protocol modules by selector and target address.
+
+The index is generated once by importing every module of :mod:`roles_royce.protocols`, then it is cached on disk
+so later processes load it without importing the modules. Classes are only imported when they are looked up.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from roles_royce.protocols.base import BaseApprove, ContractMethod
+from roles_royce.utils import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FORMAT_VERSION = 1
+PROTOCOLS_PATH = Path(__file__).parent
+
+
+def all_subclasses(cls: type) -> list[type]:
+    """All the subclasses of ``cls``, recursively."""
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(all_subclasses(subclass))
+    return subclasses
+
+
+def _protocol_module_names() -> list[str]:
+    names = []
+    for path in sorted(PROTOCOLS_PATH.rglob("*.py")):
+        parts = path.relative_to(PROTOCOLS_PATH).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        names.append(".".join((__package__,) + parts))
+    return names
+
+
+def _sources_fingerprint() -> str:
+    """Fingerprint of the protocol sources, to invalidate the cache when they change."""
+    digest = hashlib.sha256(str(REGISTRY_FORMAT_VERSION).encode())
+    for path in sorted(PROTOCOLS_PATH.rglob("*.py")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(PROTOCOLS_PATH)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _class_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _static_target(method: type[ContractMethod]) -> str | None:
+    """The target address of the method when it is fixed in the class."""
+    if isinstance(method.target_address, str) and method.target_address:
+        return str(method.target_address)
+    if issubclass(method, BaseApprove) and isinstance(method.token, str):
+        return str(method.token)
+    return None
+
+
+def _import_class(path: str) -> type[ContractMethod]:
+    module_name, qualname = path.split(":")
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class SelectorRegistry:
+    """Index of ContractMethod classes by 4 bytes selector (as "0x" hex str) and target address.
+
+    Implements the same ``lookup`` as :class:`~roles_royce.toolshed.decoding.SelectorIndex`, so it can be used
+    by the decoder.
+    """
+
+    def __init__(self, entries: dict[str, list[tuple[str, str | None]]], fingerprint: str = ""):
+        """
+        Args:
+            entries: For each selector, the list of ``(class path, target address or None)`` of its methods,
+                where the class path is ``"module:qualname"``.
+            fingerprint: Fingerprint of the sources the entries were generated from.
+        """
+        self.entries = entries
+        self.fingerprint = fingerprint
+        self._by_target = {
+            (selector, target.lower()): path
+            for selector, methods in entries.items()
+            for path, target in reversed(methods)  # the first one wins
+            if target
+        }
+        self._classes: dict[str, type[ContractMethod]] = {}
+
+    @classmethod
+    def generate(cls) -> "SelectorRegistry":
+        """Import all the protocol modules and index their ContractMethod classes."""
+        for module_name in _protocol_module_names():
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                logger.warning(f"Skipping {module_name} in the selector registry: {e}")
+
+        entries = defaultdict(list)
+        for method in all_subclasses(ContractMethod):
+            if not method.name or not method.__module__.startswith(__package__) or "<locals>" in method.__qualname__:
+                continue
+            try:
+                selector = "0x" + method.get_encoder().selector.hex()
+            except Exception as e:
+                logger.debug(f"Unable to index {method.__name__}: {e}")
+                continue
+            entry = (_class_path(method), _static_target(method))
+            if entry not in entries[selector]:
+                entries[selector].append(entry)
+        return cls(dict(entries), _sources_fingerprint())
+
+    @classmethod
+    def load(cls, path: Path) -> "SelectorRegistry":
+        with open(path) as f:
+            content = json.load(f)
+        entries = {selector: [tuple(entry) for entry in methods] for selector, methods in content["entries"].items()}
+        return cls(entries, content["fingerprint"])
+
+    def save(self, path: Path):
+        """Write the registry to ``path`` atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"fingerprint": self.fingerprint, "entries": self.entries}, f)
+        os.replace(tmp_path, path)
+
+    def _resolve(self, path: str) -> type[ContractMethod]:
+        method = self._classes.get(path)
+        if method is None:
+            method = self._classes[path] = _import_class(path)
+        return method
+
+    def lookup(self, selector: str, target: str | None = None) -> type[ContractMethod] | None:
+        """The ContractMethod class for the selector.
+
+        If ``target`` is given, a class with that fixed target address is preferred over other classes
+        with the same selector.
+        """
+        if target:
+            path = self._by_target.get((selector, target.lower()))
+            if path:
+                return self._resolve(path)
+        methods = self.entries.get(selector)
+        return self._resolve(methods[0][0]) if methods else None
+
+    def methods(self, selector: str) -> list[type[ContractMethod]]:
+        """All the ContractMethod classes with the selector."""
+        return [self._resolve(path) for path, _ in self.entries.get(selector, [])]
+
+    def __contains__(self, selector: str) -> bool:
+        return selector in self.entries
+
+    def __len__(self):
+        return sum(len(methods) for methods in self.entries.values())
+
+
+_registry: SelectorRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry_path() -> Path:
+    return get_cache_dir() / "selector_registry.json"
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """The global selector registry.
+
+    It is loaded on first use from the disk cache, or generated and then saved to the cache if the cache is missing
+    or was generated from different sources.
+    """
+    global _registry
+    if _registry is not None:
+        return _registry
+    with _registry_lock:
+        if _registry is None:
+            path = get_registry_path()
+            fingerprint = _sources_fingerprint()
+            registry = None
+            try:
+                registry = SelectorRegistry.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.debug(f"Selector registry cache not available: {e}")
+            if registry is None or registry.fingerprint != fingerprint:
+                registry = SelectorRegistry.generate()
+                try:
+                    registry.save(path)
+                except OSError as e:
+                    logger.warning(f"Unable to cache the selector registry in {path}: {e}")
+            _registry = registry
+    return _registry
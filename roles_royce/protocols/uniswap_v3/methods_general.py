@@ -4,11 +4,11 @@ from decimal import Decimal
 
 from defabipedia.tokens import NATIVE
 from defabipedia.tokens import EthereumTokenAddr as ETHAddr
-from defabipedia.types import Chain
 from defabipedia.uniswap_v3 import ContractSpecs
 from karpatkit.constants import Address as GenAddr
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
 from roles_royce.generic_method import Transactable
 from roles_royce.protocols.base import Address
 from roles_royce.protocols.uniswap_v3.contract_methods import (
@@ -95,7 +95,7 @@ def mint_nft(
         amount1_min_slippage,
     )
 
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     if mint.value > 0:
         if mint.token0 != ETHAddr.WETH:
             if not check_allowance(
@@ -190,7 +190,7 @@ def increase_liquidity_nft(
         send_eth,
     )
 
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     if increase_liquidity.value > 0:
         if increase_liquidity.nft_position.pool.token0 != ETHAddr.WETH:
             if not check_allowance(
@@ -298,7 +298,7 @@ def decrease_liquidity_nft(
         amount1_min_slippage,
     )
 
-    blockchain = Chain.get_blockchain_from_web3(w3)
+    blockchain = get_blockchain(w3)
     if withdraw_eth:
         amount_minimum_unwrap = 0
         amount_minimum_sweep = 0
@@ -417,7 +417,7 @@ class MintNFT(Mint):
             value = amount1_desired
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             avatar=avatar,
             token0=pool.token0,
             token1=pool.token1,
@@ -476,7 +476,7 @@ class IncreaseLiquidityNFT(IncreaseLiquidity):
             value = amount1_desired
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             token_id=nft_id,
             amount0_desired=int(amount0_desired),
             amount1_desired=int(amount1_desired),
@@ -513,7 +513,7 @@ class DecreaseLiquidityNFT(DecreaseLiquidity):
         amount1_min = amount1_desired * Decimal((100 - amount1_min_slippage) / 100)
 
         super().__init__(
-            blockchain=Chain.get_blockchain_from_web3(w3),
+            blockchain=get_blockchain(w3),
             token_id=nft_id,
             liquidity=int(liquidity),
             amount0_min=int(amount0_min),
@@ -3,11 +3,12 @@ from decimal import Decimal
 from defabipedia.tokens import NATIVE
 from defabipedia.tokens import Abis as TokenAbis
 from defabipedia.tokens import EthereumTokenAddr as ETHAddr
-from defabipedia.types import Chain
 from defabipedia.uniswap_v3 import Abis, ContractSpecs
 from karpatkit.constants import Address as GenAddr
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
+from roles_royce.metadata_cache import cached_metadata, get_token_decimals
 from roles_royce.protocols.base import Address
 from roles_royce.protocols.uniswap_v3.types_and_enums import FeeAmount
 
@@ -70,7 +71,7 @@ def check_allowance(w3: Web3, owner: Address, spender: Address, token: Address,
 class Pool:
     def __init__(self, w3: Web3, token0: Address, token1: Address, fee: FeeAmount):
         self.fee = fee
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         factory = ContractSpecs[blockchain].Factory.contract(w3)
 
         if token0 == NATIVE or token0 == GenAddr.ZERO:
@@ -83,23 +84,28 @@ class Pool:
             if token1 < token0:
                 token0, token1 = token1, token0
 
-        self.addr = factory.functions.getPool(token0, token1, self.fee).call()
-        if self.addr == GenAddr.ZERO:
-            raise ValueError("Pool does not exist")
+        def get_pool_address() -> Address:
+            pool_address = factory.functions.getPool(token0, token1, self.fee).call()
+            # Not cached, the pool could be created later
+            if pool_address == GenAddr.ZERO:
+                raise ValueError("Pool does not exist")
+            return pool_address
+
+        self.addr = cached_metadata(w3, "uniswap_v3_pool", f"{token0}-{token1}-{int(self.fee)}", get_pool_address)
         self.pool_contract = w3.eth.contract(address=self.addr, abi=Abis[blockchain].Pool.abi)
         self.sqrt_price_x96, self.ic = self.pool_contract.functions.slot0().call()[0:2]
         self.sqrt_price = Decimal(self.sqrt_price_x96) / Decimal(2**96)
         self.token0 = self.pool_contract.functions.token0().call()
-        self.token0_decimals = w3.eth.contract(address=self.token0, abi=TokenAbis.ERC20.abi).functions.decimals().call()
+        self.token0_decimals = get_token_decimals(w3, self.token0)
         self.token1 = self.pool_contract.functions.token1().call()
-        self.token1_decimals = w3.eth.contract(address=self.token1, abi=TokenAbis.ERC20.abi).functions.decimals().call()
+        self.token1_decimals = get_token_decimals(w3, self.token1)
         self.price = (self.sqrt_price**2) / 10 ** (self.token1_decimals - self.token0_decimals)
         self.tick_spacing = self.pool_contract.functions.tickSpacing().call()
 
 
 class NFTPosition:
     def __init__(self, w3: Web3, nft_id: int):
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         try:
             position_data = (
                 w3.eth.contract(
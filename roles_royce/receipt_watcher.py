@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt
+
+from roles_royce.fee_oracle import FeeOracle, get_fee_oracle
+from roles_royce.utils import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 1
+DEFAULT_TIMEOUT = 120
+# Above this number of unseen blocks, e.g. after a long pause, the pending receipts are requested directly instead of
+# scanning every block
+MAX_BLOCKS_PER_POLL = 20
+
+
+class _Pending:
+    def __init__(self, timeout: float):
+        self.future: Future = Future()
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+
+
+class ReceiptWatcher:
+    """Waits for the receipts of any number of pending transactions from a single polling loop.
+
+    The watcher reads each new block once to find the watched transactions included in it. A transaction whose receipt
+    is not available yet, e.g. because the node hasn't indexed it, is checked again on the next polls. Transactions are resolved through
+    :class:`~concurrent.futures.Future` objects, so a bot can send several transactions and handle each receipt as it
+    lands, with callbacks or by waiting on them.
+
+    The polling runs in a background thread that is started when a transaction is watched and stops when there is
+    nothing left to watch. The new blocks it sees are reported to the fee oracle, so the fee data of older blocks is
+    not used to build the next transactions.
+
+    Args:
+        w3: Web3 object.
+        poll_interval: Seconds between polls.
+        timeout: Seconds to wait for a transaction, after it the future fails with ``TimeExhausted``.
+        fee_oracle: Fee oracle to report the new blocks to, the shared one by default.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+        fee_oracle: FeeOracle | None = None,
+    ):
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.fee_oracle = get_fee_oracle() if fee_oracle is None else fee_oracle
+        self._pending: dict[HexBytes, _Pending] = {}
+        self._unchecked: set[HexBytes] = set()
+        self._last_block: int | None = None
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def watch(
+        self, tx_hash: str | bytes, callback: Callable[[TxReceipt], None] | None = None, timeout: float | None = None
+    ) -> Future:
+        """Start watching a transaction. Returns a future resolved with its receipt.
+
+        Args:
+            tx_hash: Hash of the sent transaction.
+            callback: Called with the receipt when the transaction is mined.
+            timeout: Seconds to wait for this transaction instead of the watcher's timeout.
+        """
+        tx_hash = HexBytes(tx_hash)
+        with self._lock:
+            pending = self._pending.get(tx_hash)
+            if pending is None:
+                pending = _Pending(self.timeout if timeout is None else timeout)
+                self._pending[tx_hash] = pending
+                # It may be already mined in a block the watcher won't scan
+                self._unchecked.add(tx_hash)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="roles_royce-receipts", daemon=True)
+                self._thread.start()
+        if callback is not None:
+
+            def on_done(future: Future):
+                if future.exception() is None:
+                    callback(future.result())
+
+            pending.future.add_done_callback(on_done)
+        return pending.future
+
+    def wait(self, tx_hash: str | bytes, timeout: float | None = None) -> TxReceipt:
+        """Watch a transaction and block until its receipt is available."""
+        return self.watch(tx_hash, timeout=timeout).result()
+
+    @property
+    def pending(self) -> int:
+        """Number of transactions being watched."""
+        return len(self._pending)
+
+    def _run(self):
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Error polling the transaction receipts: {e}")
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+            time.sleep(self.poll_interval)
+
+    def poll(self):
+        """Look for the receipts of the watched transactions once, normally called by the polling thread."""
+        with self._lock:
+            unchecked, self._unchecked = self._unchecked, set()
+            watched = set(self._pending)
+        if not watched:
+            return
+        try:
+            receipts = self._find_receipts(watched, unchecked)
+        except Exception:
+            with self._lock:
+                self._unchecked.update(unchecked)
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            mined = [
+                (self._pending.pop(tx_hash), receipt)
+                for tx_hash, receipt in receipts.items()
+                if receipt is not None and tx_hash in self._pending
+            ]
+            expired = [(tx_hash, pending) for tx_hash, pending in self._pending.items() if now > pending.deadline]
+            for tx_hash, _ in expired:
+                del self._pending[tx_hash]
+            # A transaction of a scanned block may not have its receipt indexed yet, e.g. behind a load balancer, and
+            # its block won't be scanned again
+            self._unchecked.update(
+                tx_hash for tx_hash, receipt in receipts.items() if receipt is None and tx_hash in self._pending
+            )
+        # The futures run their callbacks, without holding the lock
+        for pending, receipt in mined:
+            pending.future.set_result(receipt)
+        for tx_hash, pending in expired:
+            pending.future.set_exception(
+                TimeExhausted(f"Transaction {tx_hash.hex()} is not in the chain after {pending.timeout} seconds")
+            )
+
+    def _find_receipts(self, watched: set[HexBytes], unchecked: set[HexBytes]) -> dict[HexBytes, TxReceipt | None]:
+        """Receipts of the watched transactions in the new blocks and of the ones not checked yet."""
+        block_number = self.w3.eth.block_number
+        if self._last_block is not None and block_number - self._last_block > MAX_BLOCKS_PER_POLL:
+            unchecked.update(watched)
+        elif self._last_block is not None and block_number > self._last_block:
+            blocks = run_concurrently(
+                {n: lambda n=n: self.w3.eth.get_block(n) for n in range(self._last_block + 1, block_number + 1)}
+            )
+            for block in blocks.values():
+                unchecked.update(watched.intersection(HexBytes(tx_hash) for tx_hash in block["transactions"]))
+        if self._last_block is None or block_number > self._last_block:
+            self._last_block = block_number
+            self.fee_oracle.on_new_head(self.w3, block_number)
+        return run_concurrently({tx_hash: lambda h=tx_hash: self._get_receipt(h) for tx_hash in unchecked})
+
+    def _get_receipt(self, tx_hash: HexBytes) -> TxReceipt | None:
+        try:
+            return self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
@@ -1,31 +1,149 @@
 import logging
+import threading
+from dataclasses import dataclass
 from typing import List
 
-from defabipedia.types import Chain
 from defabipedia.multisend import ContractSpecs
+from defabipedia.types import Blockchain, Chain
 from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 from web3.types import TxReceipt
 
+from roles_royce import evm_utils
+
+from .chain import get_blockchain, get_chain_id
 from .generic_method import Transactable
-from .roles_modifier import RolesMod
-from .utils import multi_or_one
-from roles_royce.evm_utils import roles_v1_abi
+from .nonce_manager import NonceManager
+from .roles_modifier import FeeHistoryGasStrategy, GasStrategies, RolesMod, TransactionWouldBeReverted
+from .utils import multi_or_one, run_concurrently
 
 logger = logging.getLogger(__name__)
 
+# Resolved target of the Gnosis MultiSend for each (chain id, roles modifier address)
+_roles_mod_multisends: dict[tuple[int, str], str] = {}
+_roles_mod_multisends_lock = threading.Lock()
+
+
+def preload_roles_mod_multisend(roles_mod_address: str, multisend_address: str, blockchain: Blockchain = Chain.GNOSIS):
+    """Set the multisend that ``use_old_multisend_if_needed`` resolves for a roles modifier, e.g. from the bot config,
+    so it doesn't need to be read from the contract. For roles v2 modifiers pass the MultiSend address itself."""
+    _store_roles_mod_multisend(blockchain.chain_id, roles_mod_address, multisend_address)
+
+
+def _cached_roles_mod_multisend(chain_id: int, roles_mod_address: str) -> str | None:
+    return _roles_mod_multisends.get((chain_id, roles_mod_address.lower()))
+
+
+def _store_roles_mod_multisend(chain_id: int, roles_mod_address: str, multisend_address: str):
+    with _roles_mod_multisends_lock:
+        _roles_mod_multisends[(chain_id, roles_mod_address.lower())] = multisend_address
+
+
 # FIXME, the following function should be removed when roles v1 is no longer supported by Roles Royce. This function is
 #  only used in this script
-def use_old_multisend_if_needed(w3: Web3, roles_mod_address: str, address: str)-> str:
+def use_old_multisend_if_needed(w3: Web3, roles_mod_address: str, address: str) -> str:
     """Returns the roles modifier contract's multisend address if the roles modifier contract is v1 and the address
     is the (new) multisend contract. To be used as a hacky patch in the 'build', 'check' and 'send' functions for roles
-    v1 contract instances that use the old multisend contract, not the one in defabipedia."""
-    if address == ContractSpecs[Chain.GNOSIS].MultiSend.address:
-        try:
-            return w3.eth.contract(roles_mod_address, abi=roles_v1_abi).functions.multisend().call()
-        except:
-            pass
-    else:
+    v1 contract instances that use the old multisend contract, not the one in defabipedia.
+
+    The answer is cached per chain and roles modifier, and can be set beforehand with
+    :func:`preload_roles_mod_multisend`."""
+    if address != ContractSpecs[Chain.GNOSIS].MultiSend.address:
+        return address
+    chain_id = get_chain_id(w3)
+    multisend = _cached_roles_mod_multisend(chain_id, roles_mod_address)
+    if multisend is not None:
+        return multisend
+    try:
+        multisend = (
+            w3.eth.contract(roles_mod_address, abi=evm_utils.get_abi("roles_v1_abi")).functions.multisend().call()
+        )
+    except (ContractLogicError, BadFunctionCallOutput):
+        # Roles v2 modifiers don't have a multisend() getter, they use the MultiSend itself
+        multisend = address
+    except Exception as e:
+        # Don't cache the answer of a failing endpoint
+        logger.warning(f"Unable to read the multisend of the roles modifier {roles_mod_address}: {e}")
         return address
+    _store_roles_mod_multisend(chain_id, roles_mod_address, multisend)
+    return multisend
+
+
+class PreparedRoleTx:
+    """Transactables packed and wrapped in ``execTransactionWithRole`` once, ready to be checked, estimated, built
+    and sent.
+
+    The MultiSend packing, the chain detection, the roles v1 multisend lookup and the ``execTransactionWithRole``
+    encoding are done when the object is created, so the same calldata is reused by every step of the pipeline.
+
+    Args:
+        txs: List of transactable items, usually :class:`~roles_royce.protocols.base.ContractMethod` instances.
+        role: Role of the execution. A str for roles v2 or an int for the legacy roles contracts.
+        roles_mod_address: Address to call execTransactionWithRole.
+        web3: Web3 object.
+        account: Account that wants to execute. Not needed if ``private_key`` is given.
+        private_key: The private key, only needed to :meth:`send`.
+        nonce_manager: Nonce manager of the signer, to send several transactions without waiting for the receipts.
+        gas_strategy: Gas strategy to use instead of the global one.
+    """
+
+    def __init__(
+        self,
+        txs: List[Transactable],
+        role: int | str,
+        roles_mod_address: str,
+        web3: Web3,
+        account: str | None = None,
+        private_key: str | None = None,
+        nonce_manager: NonceManager | None = None,
+        gas_strategy: GasStrategies | FeeHistoryGasStrategy | None = None,
+    ):
+        tx_data = multi_or_one(txs, get_blockchain(web3))
+        self.roles_mod = RolesMod(
+            role=role,
+            contract_address=roles_mod_address,
+            account=account,
+            private_key=private_key,
+            operation=tx_data.operation,
+            w3=web3,
+            value=tx_data.value,
+            nonce_manager=nonce_manager,
+            gas_strategy=gas_strategy,
+        )
+        self.to = use_old_multisend_if_needed(web3, roles_mod_address, tx_data.contract_address)
+        self.data = tx_data.data
+        self.calldata = self.roles_mod.encode(self.to, self.data)
+
+    @property
+    def account(self) -> str:
+        return self.roles_mod.account
+
+    def check(self, block: int | str = "latest") -> bool:
+        """Test the transaction with a static call."""
+        return self.roles_mod.check_encoded(self.calldata, block=block)
+
+    def estimate_gas(self, block: int | str = "latest") -> int:
+        """Estimate the gas that the transaction would need."""
+        return self.roles_mod.estimate_gas_encoded(self.calldata, block=block)
+
+    def check_and_estimate_gas(self, block: int | str = "latest") -> int:
+        """Test the transaction and estimate its gas with a single execution on the node."""
+        return self.roles_mod.check_and_estimate_gas_encoded(self.calldata, block=block)
+
+    def build(self, tx_kwargs: dict | None = None) -> dict:
+        """Create the transaction dict, ``tx_kwargs`` are passed to :meth:`RolesMod.build_encoded`."""
+        tx = self.roles_mod.build_encoded(self.calldata, **(tx_kwargs or {}))
+        tx["from"] = self.account
+        return tx
+
+    def execute(self, tx_kwargs: dict | None = None) -> str:
+        """Send the transaction without waiting for it to be mined. Returns the transaction hash."""
+        return self.roles_mod.execute_encoded(self.calldata, **(tx_kwargs or {}))
+
+    def send(self, tx_kwargs: dict | None = None) -> TxReceipt:
+        """Send the transaction and wait for its receipt."""
+        return self.roles_mod.get_tx_receipt(self.execute(tx_kwargs))
+
 
 def build(
     txs: List[Transactable],
@@ -49,20 +167,7 @@ def build(
     Returns:
         Transaction dict.
     """
-    tx_data = multi_or_one(txs, Chain.get_blockchain_from_web3(web3))
-    roles_mod = RolesMod(
-        role=role,
-        contract_address=roles_mod_address,
-        account=account,
-        operation=tx_data.operation,
-        w3=web3,
-        value=tx_data.value,
-    )
-    tx_kwargs = tx_kwargs or {}
-    tx = roles_mod.build(use_old_multisend_if_needed(web3, roles_mod_address, tx_data.contract_address), tx_data.data, **tx_kwargs)
-    tx["from"] = account
-    return tx
-
+    return PreparedRoleTx(txs, role, roles_mod_address, web3, account=account).build(tx_kwargs)
 
 
 def check(
@@ -86,17 +191,57 @@ def check(
     Returns:
         Status.
     """
-    tx_data = multi_or_one(txs, Chain.get_blockchain_from_web3(web3))
-    roles_mod = RolesMod(
-        role=role,
-        contract_address=roles_mod_address,
-        account=account,
-        operation=tx_data.operation,
-        w3=web3,
-        value=tx_data.value,
-    )
+    return PreparedRoleTx(txs, role, roles_mod_address, web3, account=account).check(block=block)
+
+
+@dataclass
+class CheckResult:
+    """Outcome of checking one of the transaction sets passed to :func:`check_many`.
+
+    Attributes:
+        passed: Whether the static call succeeded.
+        error: The :class:`~roles_royce.roles_modifier.TransactionWouldBeReverted` error with the decoded Roles error,
+            or the contract logic error, if it didn't.
+    """
+
+    passed: bool
+    error: Exception | None = None
+
+
+def check_many(
+    txs_list: List[List[Transactable]],
+    role: int | str,
+    account: str,
+    roles_mod_address: str,
+    web3: Web3,
+    block: int | str = "latest",
+) -> List[CheckResult]:
+    """Test many independent transaction sets with static calls made concurrently.
+
+    Each set is checked as :func:`check` would do. A set that would revert doesn't stop the others, its result holds
+    the decoded Roles error instead. Errors that are not reverts, e.g. connection errors, are raised.
+
+    Args:
+        txs_list: List of transaction sets, each of them a list of transactables.
+        role: Role of the execution. A str for roles v2 or an int for the legacy roles contracts.
+        account: Account that wants to execute.
+        roles_mod_address: Address to call execTransactionWithRole.
+        web3: Web3 object.
+        block: Block number or 'latest'.
+
+    Returns:
+        A result for each transaction set, in the same order.
+    """
+
+    def check_one(txs: List[Transactable]) -> CheckResult:
+        try:
+            PreparedRoleTx(txs, role, roles_mod_address, web3, account=account).check(block=block)
+        except (TransactionWouldBeReverted, ContractLogicError) as e:
+            return CheckResult(passed=False, error=e)
+        return CheckResult(passed=True)
 
-    return roles_mod.check(use_old_multisend_if_needed(web3, roles_mod_address, tx_data.contract_address), tx_data.data, block=block)
+    results = run_concurrently({i: lambda txs=txs: check_one(txs) for i, txs in enumerate(txs_list)})
+    return [results[i] for i in range(len(txs_list))]
 
 
 def send(
@@ -106,7 +251,9 @@ def send(
     roles_mod_address: str,
     web3: Web3,
     tx_kwargs: dict | None = None,
-) -> TxReceipt:
+    nonce_manager: NonceManager | None = None,
+    wait_for_receipt: bool = True,
+) -> TxReceipt | str:
     """Send Transactables to the blockchain.
 
     Args:
@@ -116,20 +263,14 @@ def send(
         roles_mod_address: Address to call execTransactionWithRole.
         web3: Web3 object.
         tx_kwargs: Kwargs for the transaction, for example ``max_priority_fee``.
+        nonce_manager: Nonce manager of the signer. Together with ``wait_for_receipt=False`` it allows to pipeline
+            several executions from the same signer.
+        wait_for_receipt: Wait for the transaction to be mined.
 
     Returns:
-        Tx receipt.
+        Tx receipt, or the tx hash if ``wait_for_receipt`` is False.
     """
-    tx_data = multi_or_one(txs, Chain.get_blockchain_from_web3(web3))
-    roles_mod = RolesMod(
-        role=role,
-        contract_address=roles_mod_address,
-        private_key=private_key,
-        operation=tx_data.operation,
-        w3=web3,
-        value=tx_data.value,
-    )
-    tx_kwargs = tx_kwargs or {}
-    roles_mod_execute = roles_mod.execute(use_old_multisend_if_needed(web3, roles_mod_address, tx_data.contract_address), tx_data.data, **tx_kwargs)
-    roles_mod_tx1 = roles_mod.get_tx_receipt(roles_mod_execute)
-    return roles_mod_tx1
+    prepared = PreparedRoleTx(txs, role, roles_mod_address, web3, private_key=private_key, nonce_manager=nonce_manager)
+    if not wait_for_receipt:
+        return prepared.execute(tx_kwargs)
+    return prepared.send(tx_kwargs)
@@ -1,14 +1,21 @@
 import logging
 from dataclasses import dataclass
 from enum import Enum
+from typing import Callable
 
 import eth_abi
 from eth_account import Account
 from web3 import Web3, exceptions
-from web3.types import Address, ChecksumAddress, TxParams, TxReceipt
+from web3.types import Address, ChecksumAddress, FeeHistory, TxParams, TxReceipt
 
+from roles_royce.chain import get_chain_id
+from roles_royce.fee_oracle import BlockFees, get_fee_oracle
+from roles_royce.nonce_manager import NonceManager
 from roles_royce.protocols.base import Operation
+from roles_royce.protocols.roles_modifier import get_exec_transaction_with_role_method
 from roles_royce.protocols.utils import format_bytes32_string
+from roles_royce.receipt_watcher import ReceiptWatcher
+from roles_royce.utils import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +23,8 @@ NORMAL_GAS_LIMIT_MULTIPLIER = 1.4
 AGGRESIVE_GAS_LIMIT_MULTIPLIER = 3
 NORMAL_FEE_MULTIPLER = 1.2
 AGGRESIVE_FEE_MULTIPLER = 2
+# EIP-1559: the base fee can increase at most 12.5% from one block to the next
+BASE_FEE_MAX_CHANGE = 1.125
 
 ROLES_V1_ABI = (
     '[{"inputs":[{"internalType":"address","name":"to","type":"address"},{"internalType":"uint256","name":"value","type":"uint256"},'
@@ -82,6 +91,19 @@ class TransactionWouldBeReverted(Exception):
     """It is used to indicate that if a transaction is executed, it will be reverted."""
 
 
+def raise_transaction_would_be_reverted(error: exceptions.ContractCustomError):
+    """Raise a TransactionWouldBeReverted with the Roles custom error decoded from the revert data, if it is one."""
+    custom_roles_error = ROLES_ERRORS_SELECTORS.get(error.data[:10], None)
+    if custom_roles_error:
+        if "()" not in custom_roles_error:
+            types = custom_roles_error[custom_roles_error.index("(") :]
+            decoded_values = eth_abi.decode([types], bytes.fromhex(error.data[10:]))[0]
+        else:
+            decoded_values = None
+        raise TransactionWouldBeReverted(custom_roles_error, decoded_values) from error
+    raise TransactionWouldBeReverted(error) from error
+
+
 @dataclass
 class GasStrategy:
     limit_multiplier: float
@@ -93,6 +115,39 @@ class GasStrategies(GasStrategy, Enum):
     AGGRESIVE = (AGGRESIVE_GAS_LIMIT_MULTIPLIER, AGGRESIVE_FEE_MULTIPLER)
 
 
+@dataclass(frozen=True)
+class FeeHistoryGasStrategy:
+    """Gas strategy that derives the fees from the last blocks with a single ``eth_feeHistory`` call.
+
+    The priority fee is the median, over the last ``block_count`` blocks, of the ``reward_percentile`` percentile of
+    the priority fees paid in each block. The max fee per gas covers the priority fee plus the next block base fee
+    after ``max_base_fee_increases`` full blocks in a row, so the transaction stays includable without a fixed
+    multiplier on the base fee.
+    """
+
+    limit_multiplier: float = NORMAL_GAS_LIMIT_MULTIPLIER
+    block_count: int = 20
+    reward_percentile: float = 50
+    max_base_fee_increases: int = 2
+    min_priority_fee: int = 0
+
+    def fetch_fee_history(self, w3: Web3) -> FeeHistory:
+        return w3.eth.fee_history(self.block_count, "latest", [self.reward_percentile])
+
+    def fees(self, fee_history: FeeHistory, max_priority_fee: int | None = None) -> tuple[int, int]:
+        """Returns the max priority fee and the max fee per gas."""
+        if not max_priority_fee:
+            # Empty blocks report a zero reward, they say nothing about the fee market
+            rewards = sorted(reward[0] for reward in fee_history["reward"] if reward[0] > 0)
+            median_reward = rewards[len(rewards) // 2] if rewards else 0
+            max_priority_fee = max(median_reward, self.min_priority_fee)
+        next_base_fee_per_gas = fee_history["baseFeePerGas"][-1]
+        max_fee_per_gas = max_priority_fee + int(
+            next_base_fee_per_gas * BASE_FEE_MAX_CHANGE**self.max_base_fee_increases
+        )
+        return max_priority_fee, max_fee_per_gas
+
+
 _gas_strategy = GasStrategies.NORMAL
 
 
@@ -101,12 +156,37 @@ def get_gas_strategy():
     return _gas_strategy
 
 
-def set_gas_strategy(strategy: GasStrategies):
+def set_gas_strategy(strategy: GasStrategies | FeeHistoryGasStrategy):
     """Set a global default gas strategy"""
     global _gas_strategy
     _gas_strategy = strategy
 
 
+def _fee_reads(w3: Web3, gas_strategy: GasStrategy | FeeHistoryGasStrategy) -> tuple[dict, BlockFees | None]:
+    """Reads needed to compute the fees of a strategy, and the cached fee data if there is no need to read it."""
+    if isinstance(gas_strategy, FeeHistoryGasStrategy):
+        return {"fee_history": lambda: gas_strategy.fetch_fee_history(w3)}, None
+    fee_oracle = get_fee_oracle()
+    fees = fee_oracle.cached(w3)
+    return (fee_oracle.reads(w3) if fees is None else {}), fees
+
+
+def _fees(
+    w3: Web3,
+    gas_strategy: GasStrategy | FeeHistoryGasStrategy,
+    results: dict,
+    fees: BlockFees | None,
+    max_priority_fee: int | None = None,
+) -> tuple[int, int]:
+    """Max priority fee and max fee per gas from the results of the :func:`_fee_reads` reads."""
+    if isinstance(gas_strategy, FeeHistoryGasStrategy):
+        return gas_strategy.fees(results["fee_history"], max_priority_fee)
+    if fees is None:
+        fees = get_fee_oracle().update(w3, results["latest_block"], results["max_priority_fee"])
+    max_priority_fee = max_priority_fee or fees.max_priority_fee
+    return max_priority_fee, max_priority_fee + int(fees.base_fee_per_gas * gas_strategy.fee_multiplier)
+
+
 class RolesMod:
     """A class to handle role-based transactions on a blockchain."""
 
@@ -121,6 +201,9 @@ class RolesMod:
         operation: Operation = Operation.CALL,
         should_revert: bool = True,
         nonce: int | None = None,
+        nonce_manager: NonceManager | None = None,
+        gas_strategy: GasStrategies | FeeHistoryGasStrategy | None = None,
+        receipt_watcher: ReceiptWatcher | None = None,
     ):
         self.role = role
         if type(role) is str:
@@ -142,6 +225,9 @@ class RolesMod:
         self.operation = operation
         self.should_revert = should_revert
         self.nonce = nonce
+        self.nonce_manager = nonce_manager
+        self.gas_strategy = gas_strategy
+        self.receipt_watcher = receipt_watcher
 
         if not self.private_key and not self.account:
             raise ValueError("Either 'private_key' or 'account' must be filled.")
@@ -151,50 +237,120 @@ class RolesMod:
         self.contract = self.w3.eth.contract(address=self.contract_address, abi=self.contract_abi)
 
     def get_base_fee_per_gas(self) -> int:
-        latest_block = self.w3.eth.get_block("latest")
-        base_fee_per_gas = latest_block["baseFeePerGas"]
-        return base_fee_per_gas
+        return get_fee_oracle().get(self.w3).base_fee_per_gas
+
+    def encode(self, contract_address: str, data: str) -> str:
+        """Calldata of the ``execTransactionWithRole`` call that executes ``data`` on ``contract_address``."""
+        return get_exec_transaction_with_role_method(
+            roles_mod_address=self.contract_address,
+            role=self.role,
+            to=contract_address,
+            data=data,
+            operation=self.operation,
+            value=self.value,
+            should_revert=self.should_revert,
+        ).data
 
     def build(
         self, contract_address: str, data: str, max_priority_fee: int | None = None, max_fee_per_gas: int | None = None
     ):
         """Creates a transaction ready to be sent"""
-        gas_strategy = get_gas_strategy()
-        if not max_priority_fee:
-            max_priority_fee = self.w3.eth.max_priority_fee
-        if not max_fee_per_gas:
-            max_fee_per_gas = max_priority_fee + int(self.get_base_fee_per_gas() * gas_strategy.fee_multiplier)
-
-        gas_limit = int(self.estimate_gas(contract_address, data) * gas_strategy.limit_multiplier)
+        return self._build(
+            self.encode(contract_address, data),
+            max_priority_fee,
+            max_fee_per_gas,
+            estimate_gas=lambda: self.estimate_gas(contract_address, data),
+        )
 
-        nonce = self.nonce or self.w3.eth.get_transaction_count(self.account)
+    def build_encoded(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None = None,
+        max_fee_per_gas: int | None = None,
+        gas_limit: int | None = None,
+    ) -> TxParams:
+        """Creates a transaction ready to be sent from an already encoded ``execTransactionWithRole`` calldata."""
+        return self._build(
+            exec_calldata,
+            max_priority_fee,
+            max_fee_per_gas,
+            gas_limit=gas_limit,
+            estimate_gas=lambda: self.estimate_gas_encoded(exec_calldata),
+        )
 
-        tx = self._build_transaction(contract_address, data, gas_limit, max_priority_fee, max_fee_per_gas, nonce)
-        return tx
+    def _build(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None,
+        max_fee_per_gas: int | None,
+        estimate_gas: Callable[[], int],
+        gas_limit: int | None = None,
+        nonce: int | None = None,
+    ) -> TxParams:
+        # The chain reads are independent from each other, they are made concurrently so building a transaction
+        # takes about one round trip instead of one per read. The chain id is memoized per provider, not read.
+        gas_strategy = self.gas_strategy or get_gas_strategy()
+        chain_id = get_chain_id(self.w3)
+        reads = {}
+        fees_needed = not max_priority_fee or not max_fee_per_gas
+        if fees_needed:
+            fee_reads, fees = _fee_reads(self.w3, gas_strategy)
+            reads.update(fee_reads)
+        if gas_limit is None:
+            reads["estimated_gas"] = estimate_gas
+        if nonce is None and not self.nonce:
+            reads["nonce"] = lambda: self.w3.eth.get_transaction_count(self.account)
+        results = run_concurrently(reads)
+
+        if fees_needed:
+            max_priority_fee, strategy_max_fee_per_gas = _fees(self.w3, gas_strategy, results, fees, max_priority_fee)
+            max_fee_per_gas = max_fee_per_gas or strategy_max_fee_per_gas
+        if gas_limit is None:
+            gas_limit = int(results["estimated_gas"] * gas_strategy.limit_multiplier)
+        if nonce is None:
+            nonce = self.nonce or results["nonce"]
+
+        return self._build_transaction(exec_calldata, gas_limit, max_priority_fee, max_fee_per_gas, nonce, chain_id)
 
     def check(self, contract_address: str, data: str, block="latest") -> bool:
         """Make a static call to validate a transaction."""
+        return self.check_encoded(self.encode(contract_address, data), block=block)
+
+    def check_encoded(self, exec_calldata: str, block="latest") -> bool:
+        """Make a static call to validate an already encoded ``execTransactionWithRole`` calldata."""
         try:
-            self._build_exec_transaction(contract_address, data).call({"from": self.account}, block_identifier=block)
+            self.w3.eth.call(
+                {"from": self.account, "to": self.contract_address, "data": exec_calldata}, block_identifier=block
+            )
             return True
         except exceptions.ContractCustomError as e:
-            custom_roles_error = ROLES_ERRORS_SELECTORS.get(e.data[:10], None)
-            if custom_roles_error:
-                if "()" not in custom_roles_error:
-                    types = custom_roles_error[custom_roles_error.index("(") :]
-                    decoded_values = eth_abi.decode([types], bytes.fromhex(e.data[10:]))[0]
-                else:
-                    decoded_values = None
-                raise TransactionWouldBeReverted(custom_roles_error, decoded_values)
-            else:
-                raise TransactionWouldBeReverted(e)
+            raise_transaction_would_be_reverted(e)
 
     def estimate_gas(self, contract_address: str, data: str, block="latest") -> int:
         """Estimate the gas that would be needed."""
-        return self._build_exec_transaction(contract_address, data).estimate_gas(
-            {"from": self.account}, block_identifier=block
+        return self.estimate_gas_encoded(self.encode(contract_address, data), block=block)
+
+    def estimate_gas_encoded(self, exec_calldata: str, block="latest") -> int:
+        """Estimate the gas that an already encoded ``execTransactionWithRole`` calldata would need."""
+        return self.w3.eth.estimate_gas(
+            {"from": self.account, "to": self.contract_address, "data": exec_calldata}, block_identifier=block
         )
 
+    def check_and_estimate_gas(self, contract_address: str, data: str, block="latest") -> int:
+        """Validate a transaction and estimate its gas with a single execution on the node.
+
+        Raises:
+            TransactionWouldBeReverted: The same errors as :meth:`check`, decoded from the gas estimation revert.
+        """
+        return self.check_and_estimate_gas_encoded(self.encode(contract_address, data), block=block)
+
+    def check_and_estimate_gas_encoded(self, exec_calldata: str, block="latest") -> int:
+        """Same as :meth:`check_and_estimate_gas` for an already encoded ``execTransactionWithRole`` calldata."""
+        try:
+            return self.estimate_gas_encoded(exec_calldata, block=block)
+        except exceptions.ContractCustomError as e:
+            raise_transaction_would_be_reverted(e)
+
     def execute(
         self,
         contract_address: str,
@@ -203,46 +359,80 @@ class RolesMod:
         max_fee_per_gas: int | None = None,
         check: bool = True,
     ) -> str:
-        """Execute a role-based transaction. Returns the transaction hash as a str."""
+        """Execute a role-based transaction. Returns the transaction hash as a str.
 
-        if check:
-            self.check(contract_address, data)
+        The check is done by the gas estimation, so the transaction is executed only once on the node.
+        """
+        estimate_gas = self.check_and_estimate_gas if check else self.estimate_gas
+        return self._execute(
+            self.encode(contract_address, data),
+            max_priority_fee,
+            max_fee_per_gas,
+            estimate_gas=lambda: estimate_gas(contract_address, data),
+        )
 
-        tx = self.build(contract_address, data, max_priority_fee, max_fee_per_gas)
-        logger.debug(f"Executing tx: {tx}")
-        signed_txn = self._sign_transaction(tx)
-        executed_txn = self._send_raw_transaction(signed_txn.rawTransaction)
-        return executed_txn.hex()
-
-    def _build_exec_transaction(self, contract_address: str, data: str):
-        return self.contract.functions.execTransactionWithRole(
-            contract_address,
-            self.value,
-            data,
-            self.operation,
-            self.role,
-            self.should_revert,
+    def execute_encoded(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None = None,
+        max_fee_per_gas: int | None = None,
+        check: bool = True,
+    ) -> str:
+        """Execute an already encoded ``execTransactionWithRole`` calldata. Returns the transaction hash as a str."""
+        estimate_gas = self.check_and_estimate_gas_encoded if check else self.estimate_gas_encoded
+        return self._execute(
+            exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas=lambda: estimate_gas(exec_calldata)
         )
 
+    def _execute(
+        self,
+        exec_calldata: str,
+        max_priority_fee: int | None,
+        max_fee_per_gas: int | None,
+        estimate_gas: Callable[[], int],
+    ) -> str:
+        if self.nonce_manager is None:
+            return self._sign_and_send(self._build(exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas))
+        # The nonce is given back to the manager if building or signing the transaction fails
+        with self.nonce_manager.reserve(self.w3) as nonce:
+            tx = self._build(exec_calldata, max_priority_fee, max_fee_per_gas, estimate_gas, nonce=nonce)
+            signed_txn = self._sign(tx)
+        try:
+            return self._send(signed_txn)
+        except Exception:
+            # The transaction may have been broadcast or the nonce may be used already, only the node can tell
+            self.nonce_manager.resync()
+            raise
+
+    def _sign_and_send(self, tx: TxParams) -> str:
+        return self._send(self._sign(tx))
+
+    def _sign(self, tx: TxParams):
+        logger.debug(f"Executing tx: {tx}")
+        return self._sign_transaction(tx)
+
+    def _send(self, signed_txn) -> str:
+        return self._send_raw_transaction(signed_txn.rawTransaction).hex()
+
     def _build_transaction(
         self,
-        contract_address: str,
-        data: str,
+        exec_calldata: str,
         gas_limit: int,
         max_priority_fee_per_gas: int,
         max_fee_per_gas: int,
         nonce: int,
-    ):
-        tx = self._build_exec_transaction(contract_address, data).build_transaction(
-            {
-                "chainId": self.w3.eth.chain_id,
-                "gas": gas_limit,
-                "maxFeePerGas": max_fee_per_gas,  # base + priority. The base is always 12.5% higher than the last block
-                "maxPriorityFeePerGas": max_priority_fee_per_gas,
-                "nonce": nonce,
-            }
-        )
-        return tx
+        chain_id: int,
+    ) -> TxParams:
+        return {
+            "value": 0,
+            "chainId": chain_id,
+            "gas": gas_limit,
+            "maxFeePerGas": max_fee_per_gas,  # base + priority. The base is always 12.5% higher than the last block
+            "maxPriorityFeePerGas": max_priority_fee_per_gas,
+            "nonce": nonce,
+            "to": self.contract_address,
+            "data": exec_calldata,
+        }
 
     def _sign_transaction(self, tx):
         return self.w3.eth.account.sign_transaction(tx, self.private_key)
@@ -253,6 +443,9 @@ class RolesMod:
     def get_tx_receipt(self, tx_hash: str) -> TxReceipt:
         """Get the transaction receipt from the blockchain.
 
+        If the RolesMod has a receipt watcher, the receipt is waited for through it, so several threads waiting for
+        their transactions share the same polling.
+
         Args:
             tx_hash (str): Transaction hash.
 
@@ -260,28 +453,43 @@ class RolesMod:
             Transaction receipt as a TxReceipt object.
         """
         try:
+            if self.receipt_watcher is not None:
+                return self.receipt_watcher.wait(tx_hash)
             transaction_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
             return transaction_receipt
         except exceptions.TransactionNotFound:
             return "Transaction not yet on blockchain"
-
-
-def update_gas_fees_parameters_and_nonce(w3: Web3, tx: dict) -> TxParams:
+        except exceptions.TimeExhausted:
+            # The transaction may have been dropped or replaced, the local nonces can't be trusted anymore
+            if self.nonce_manager is not None:
+                self.nonce_manager.resync()
+            raise
+
+
+def update_gas_fees_parameters_and_nonce(
+    w3: Web3,
+    tx: dict,
+    nonce_manager: NonceManager | None = None,
+    gas_strategy: GasStrategies | FeeHistoryGasStrategy | None = None,
+) -> TxParams:
     """Updates the gas fees parameters and the nonce of a transaction fetching the data from the blockchain and using the global gas strategy multipliers
 
     Args:
         w3 (Web3): Web3 instance.
         tx (dict): Transaction dictionary as a TxParams object.
+        nonce_manager (NonceManager): Optional nonce manager of the signer, the nonce is taken from it instead of the
+            blockchain. If the transaction is not sent, the caller must give the nonce back with
+            ``nonce_manager.release(tx["nonce"])``, and if sending it fails call ``nonce_manager.resync()``.
+        gas_strategy (GasStrategies | FeeHistoryGasStrategy): Gas strategy to use instead of the global one.
 
     Returns:
             Transaction dictionary as a TxParams object.
     """
-    gas_strategy = get_gas_strategy()
-    max_priority_fee = w3.eth.max_priority_fee
-    latest_block = w3.eth.get_block("latest")
-    base_fee_per_gas = latest_block["baseFeePerGas"]
-    max_fee_per_gas = max_priority_fee + int(base_fee_per_gas * gas_strategy.fee_multiplier)
-    tx["maxFeePerGas"] = max_fee_per_gas
-    tx["maxPriorityFeePerGas"] = max_priority_fee
-    tx["nonce"] = w3.eth.get_transaction_count(tx["from"])
+    gas_strategy = gas_strategy or get_gas_strategy()
+    reads, fees = _fee_reads(w3, gas_strategy)
+    if nonce_manager is None:
+        reads["nonce"] = lambda: w3.eth.get_transaction_count(tx["from"])
+    results = run_concurrently(reads)
+    tx["maxPriorityFeePerGas"], tx["maxFeePerGas"] = _fees(w3, gas_strategy, results, fees)
+    tx["nonce"] = results["nonce"] if nonce_manager is None else nonce_manager.next_nonce(w3)
     return tx
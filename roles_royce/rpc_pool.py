@@ -0,0 +1,298 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.providers import HTTPProvider, JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+# Consecutive failures after which an endpoint is ejected
+DEFAULT_MAX_FAILURES = 3
+# Seconds an ejected endpoint is only used if all the others fail, unless a health check succeeds before
+DEFAULT_EJECTION_TIME = 60
+# Weight of the last measure in the moving average of the latency
+LATENCY_SMOOTHING = 0.3
+# Latencies kept per endpoint to compute the hedging deadlines
+LATENCY_SAMPLES = 200
+# Below this number of samples the default hedging delay is used
+MIN_LATENCY_SAMPLES = 20
+DEFAULT_HEDGE_PERCENTILE = 95
+DEFAULT_HEDGE_DELAY = 0.5
+# Reads that are safe to send to several endpoints at the same time
+HEDGED_METHODS = {
+    "eth_blockNumber",
+    "eth_call",
+    "eth_chainId",
+    "eth_estimateGas",
+    "eth_gasPrice",
+    "eth_getBalance",
+    "eth_getBlockByNumber",
+    "eth_getCode",
+    "eth_getLogs",
+    "eth_getStorageAt",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_maxPriorityFeePerGas",
+}
+# Requests that must not be sent again to another endpoint when they fail, e.g. a transaction that may have been
+# broadcast before the connection failed
+NON_RETRIED_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+
+
+class Endpoint:
+    """An RPC endpoint of a :class:`PooledHTTPProvider` with its health data."""
+
+    def __init__(self, url: str, request_timeout: float):
+        self.url = url
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=32))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=32))
+        self.provider = HTTPProvider(url, request_kwargs={"timeout": request_timeout}, session=self.session)
+        self.latency: float | None = None
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def ejected(self) -> bool:
+        return time.monotonic() < self.ejected_until
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        """Percentile of the latencies of the last requests, ``None`` without enough samples."""
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100))]
+
+    def record_success(self, latency: float):
+        self.latencies.append(latency)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    def record_failure(self, max_failures: int, ejection_time: float):
+        self.failures += 1
+        if self.failures >= max_failures and not self.ejected:
+            logger.warning(f"Ejecting RPC endpoint {self.url} after {self.failures} consecutive failures")
+            self.ejected_until = time.monotonic() + ejection_time
+
+    def __repr__(self):
+        return f"<Endpoint {self.url} latency={self.latency} failures={self.failures} ejected={self.ejected}>"
+
+
+class PooledHTTPProvider(JSONBaseProvider):
+    """HTTP provider routing the requests to a pool of endpoints of the same chain.
+
+    Each endpoint keeps its HTTP session, so connections are reused between requests and Web3 objects. Requests go to
+    the healthy endpoint with the lowest latency, or to the first healthy one in the given order when
+    ``latency_ranked`` is False, e.g. for an execution endpoint that must be preferred. When a request fails because of
+    the connection, it is retried in the next endpoint, except for the transactions being sent. Endpoints failing ``max_failures`` consecutive times are ejected
+    and only used as a last resort until a health check succeeds or the ``ejection_time`` passes.
+
+    A background thread checks the latency and health of all the endpoints every ``health_check_interval`` seconds.
+
+    Use :func:`get_pooled_provider` to share the pools in the process.
+
+    Args:
+        urls: RPC endpoint URLs, the primary one first.
+        latency_ranked: Route by latency instead of by order.
+        request_timeout: Timeout of each HTTP request, in seconds.
+        health_check_interval: Seconds between health checks, ``None`` disables them.
+        max_failures: Consecutive failures to eject an endpoint.
+        ejection_time: Seconds an endpoint stays ejected.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        latency_ranked: bool = True,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        health_check_interval: float | None = DEFAULT_HEALTH_CHECK_INTERVAL,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        ejection_time: float = DEFAULT_EJECTION_TIME,
+    ):
+        super().__init__()
+        if not urls:
+            raise ValueError("At least one RPC endpoint URL is needed")
+        self.endpoints = [Endpoint(url, request_timeout) for url in urls]
+        self.latency_ranked = latency_ranked
+        self.health_check_interval = health_check_interval
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+        self._lock = threading.Lock()
+        self._health_thread: threading.Thread | None = None
+
+    @property
+    def endpoint_uri(self) -> str:
+        """URL of the primary endpoint, all the endpoints are for the same chain."""
+        return self.endpoints[0].url
+
+    def ranked_endpoints(self) -> list[Endpoint]:
+        """Endpoints in the order they are tried, the ejected ones last."""
+
+        def key(index_endpoint: tuple[int, Endpoint]):
+            index, endpoint = index_endpoint
+            latency = (endpoint.latency or 0) if self.latency_ranked else 0
+            return endpoint.ejected, latency, index
+
+        return [endpoint for _, endpoint in sorted(enumerate(self.endpoints), key=key)]
+
+    def is_healthy(self, url: str) -> bool:
+        """Whether the endpoint with this URL is not ejected."""
+        return any(endpoint.url == url and not endpoint.ejected for endpoint in self.endpoints)
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self._start_health_checks()
+        error = None
+        for endpoint in self.ranked_endpoints():
+            try:
+                return self._request(endpoint, method, params)
+            except Exception as e:
+                logger.debug(f"Request {method} to {endpoint.url} failed: {e}")
+                if method in NON_RETRIED_METHODS:
+                    raise
+                error = e
+        raise error
+
+    def _request(self, endpoint: Endpoint, method: RPCEndpoint, params: Any) -> RPCResponse:
+        start = time.monotonic()
+        try:
+            response = endpoint.provider.make_request(method, params)
+        except Exception:
+            with self._lock:
+                endpoint.record_failure(self.max_failures, self.ejection_time)
+            raise
+        with self._lock:
+            endpoint.record_success(time.monotonic() - start)
+        return response
+
+    def check_health(self):
+        """Measure the latency of all the endpoints, ejecting or readmitting them. Normally called by the thread."""
+        for endpoint in self.endpoints:
+            try:
+                self._request(endpoint, RPCEndpoint("eth_blockNumber"), [])
+            except Exception as e:
+                logger.debug(f"Health check of {endpoint.url} failed: {e}")
+
+    def _start_health_checks(self):
+        if self.health_check_interval is None or self._health_thread is not None:
+            return
+        with self._lock:
+            if self._health_thread is None:
+                self._health_thread = threading.Thread(
+                    target=self._run_health_checks, name="roles_royce-rpc", daemon=True
+                )
+                self._health_thread.start()
+
+    def _run_health_checks(self):
+        while True:
+            self.check_health()
+            time.sleep(self.health_check_interval)
+
+
+class HedgedProvider(JSONBaseProvider):
+    """Provider for latency critical reads, sending them to a second endpoint when the first one is slow.
+
+    Reads go to the best endpoint of the pool, and if there is no answer after the ``percentile`` of its recent
+    latencies, the same read is also sent to the next endpoint. The first successful response wins. Other requests,
+    e.g. sending transactions, are never duplicated and go through the pool as usual.
+
+    The latency statistics and the ejections are shared with the pool.
+
+    Args:
+        pool: Pooled provider with the endpoints, e.g. the primary and fallback RPC endpoints.
+        percentile: Percentile of the latencies of the first endpoint used as deadline before hedging.
+        default_delay: Deadline in seconds until there are enough latency samples.
+    """
+
+    _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="roles_royce-hedged")
+
+    def __init__(
+        self,
+        pool: PooledHTTPProvider,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        default_delay: float = DEFAULT_HEDGE_DELAY,
+    ):
+        super().__init__()
+        self.pool = pool
+        self.percentile = percentile
+        self.default_delay = default_delay
+
+    @property
+    def endpoint_uri(self) -> str:
+        return self.pool.endpoint_uri
+
+    def hedge_delay(self, endpoint: Endpoint) -> float:
+        """Seconds to wait for ``endpoint`` before sending the read to the next one."""
+        delay = endpoint.latency_percentile(self.percentile)
+        return self.default_delay if delay is None else delay
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method not in HEDGED_METHODS:
+            return self.pool.make_request(method, params)
+        self.pool._start_health_checks()
+        endpoints = self.pool.ranked_endpoints()
+        pending: set[Future] = set()
+        error = None
+        for position, endpoint in enumerate(endpoints):
+            pending.add(self._executor.submit(self.pool._request, endpoint, method, params))
+            last = position == len(endpoints) - 1
+            deadline = time.monotonic() + self.hedge_delay(endpoint)
+            # Wait until the deadline for a successful response, after the last endpoint wait for all the requests
+            while pending:
+                timeout = None if last else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = future.exception()
+                if not done:
+                    break
+        raise error
+
+
+_pools: dict[tuple, PooledHTTPProvider] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pooled_provider(urls: list[str], latency_ranked: bool = True, **kwargs) -> PooledHTTPProvider:
+    """Pooled provider for the URLs, shared by all the callers in the process. Empty URLs are ignored.
+
+    Args:
+        urls: RPC endpoint URLs, the primary one first.
+        latency_ranked: Route by latency instead of by order.
+        **kwargs: Other arguments for :class:`PooledHTTPProvider` when it is created.
+    """
+    urls = [url for url in urls if url]
+    key = (tuple(urls), latency_ranked)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = PooledHTTPProvider(urls, latency_ranked=latency_ranked, **kwargs)
+        return _pools[key]
+
+
+def get_pooled_web3(urls: list[str], latency_ranked: bool = True) -> Web3:
+    """Web3 object using the shared pooled provider of the URLs."""
+    return Web3(get_pooled_provider(urls, latency_ranked=latency_ranked))
+
+
+def hedged_web3(w3: Web3, percentile: float = DEFAULT_HEDGE_PERCENTILE) -> Web3:
+    """Web3 object for latency critical reads, hedging them between the endpoints of ``w3``'s pooled provider.
+
+    If ``w3`` doesn't use a :class:`PooledHTTPProvider` with several endpoints, it is returned unchanged.
+    """
+    if not isinstance(w3.provider, PooledHTTPProvider) or len(w3.provider.endpoints) < 2:
+        return w3
+    return Web3(HedgedProvider(w3.provider, percentile=percentile), middlewares=w3.middleware_onion.middlewares)
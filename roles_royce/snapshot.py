@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from web3 import Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+# Reads whose result only depends on the block, with the position of the block parameter
+PINNED_METHODS = {
+    "eth_call": 1,
+    "eth_getBalance": 1,
+    "eth_getCode": 1,
+    "eth_getStorageAt": 2,
+    "eth_getTransactionCount": 1,
+}
+# Reads that don't depend on the block, e.g. requested by Web3's validation middleware on every call
+CONSTANT_METHODS = {"eth_chainId"}
+# Block tags moving with the chain, they are replaced by the block of the snapshot
+MOVING_BLOCK_TAGS = {"latest", "pending", "safe", "finalized"}
+
+
+class ChainSnapshot:
+    """Consistent view of the chain state at a single block.
+
+    :attr:`w3` is a Web3 object sharing the provider and middlewares of the original one, where every read (contract
+    calls, balances, code and storage) made at ``latest`` or without a block is made at the snapshot's block instead.
+    The results are memoized by target address, calldata and block, so repeated reads while building a plan are only
+    requested once. Reads made explicitly at another block number are not pinned, but are memoized the same way.
+
+    Pass :attr:`w3` to the disassemblers, protocol utils or any code doing reads::
+
+        snapshot = ChainSnapshot(w3)
+        health_factor = SparkCDPManager(snapshot.w3, owner_address).get_health_factor()
+        txns = disassembler.exit_1(...)  # with a disassembler built with snapshot.w3
+
+    Args:
+        w3: Web3 object.
+        block: Block of the snapshot. Block tags like ``"latest"`` are resolved to the block number once.
+    """
+
+    def __init__(self, w3: Web3, block: int | str = "latest"):
+        if not isinstance(block, int):
+            block = w3.eth.get_block(block)["number"]
+        self.block = block
+        self.hits = 0
+        self.misses = 0
+        self._results: dict[Hashable, RPCResponse] = {}
+        self._lock = threading.Lock()
+        self.w3 = Web3(w3.provider, middlewares=w3.middleware_onion.middlewares)
+        self.w3.eth.default_block = block
+        self.w3.middleware_onion.add(self._middleware, "roles_royce_snapshot")
+
+    def clear(self):
+        """Forget the memoized results."""
+        with self._lock:
+            self._results.clear()
+
+    def _key(self, method: RPCEndpoint, params: list) -> Hashable:
+        if method == "eth_call":
+            tx, block = params[0], params[1]
+            data = tx.get("data") or tx.get("input") or "0x"
+            if isinstance(data, bytes):
+                data = "0x" + data.hex()
+            other_fields = tuple(sorted((k, str(v)) for k, v in tx.items() if k not in ("to", "data", "input")))
+            return method, str(tx.get("to", "")).lower(), data.lower(), block, other_fields
+        return (method,) + tuple(str(param).lower() for param in params)
+
+    def _middleware(self, make_request: Callable[[RPCEndpoint, Any], RPCResponse], w3: Web3):
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            position = PINNED_METHODS.get(method)
+            if position is None and method not in CONSTANT_METHODS:
+                return make_request(method, params)
+            params = list(params)
+            if position is not None and len(params) <= position:
+                params.append(hex(self.block))
+            elif position is not None and params[position] in MOVING_BLOCK_TAGS:
+                params[position] = hex(self.block)
+            key = self._key(method, params)
+            response = self._results.get(key)
+            if response is not None:
+                self.hits += 1
+                return response
+            self.misses += 1
+            response = make_request(method, params)
+            if "error" not in response:
+                with self._lock:
+                    self._results[key] = response
+            return response
+
+        return middleware
@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 from typing import Any, Dict, cast
 
@@ -10,7 +11,9 @@ from web3._utils.abi import map_abi_data
 from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.types import Address, ChecksumAddress, TxReceipt
 
-from roles_royce.evm_utils import erc20_abi
+from roles_royce import evm_utils
+from roles_royce.chain import get_blockchain
+from roles_royce.metadata_cache import get_token_decimals, get_token_symbol
 from roles_royce.utils import to_checksum_address
 
 
@@ -64,7 +67,9 @@ class EventLogDecoder:
         return Event(name=func_abi["name"], topic=HexBytes(selector), values=values)
 
 
-erc20_event_log_decoder = EventLogDecoder(Web3().eth.contract(abi=erc20_abi))
+@functools.cache
+def get_erc20_event_log_decoder() -> EventLogDecoder:
+    return EventLogDecoder(Web3().eth.contract(abi=evm_utils.get_abi("erc20_abi")))
 
 
 def get_token_amounts_from_transfer_events(
@@ -72,6 +77,7 @@ def get_token_amounts_from_transfer_events(
 ) -> (list[dict], str):
     transfers = []
     message = ""
+    erc20_event_log_decoder = get_erc20_event_log_decoder()
     for element in tx_receipt["logs"]:
         address = element["address"]
         event = erc20_event_log_decoder.decode_log(element)
@@ -83,10 +89,8 @@ def get_token_amounts_from_transfer_events(
         ):
             token_address = to_checksum_address(address)
             target_address = to_checksum_address(target_address)
-            token_contract = w3.eth.contract(address=token_address, abi=erc20_abi)
-            a = w3.eth.block_number
-            token_decimals = token_contract.functions.decimals().call()
-            token_symbol = token_contract.functions.symbol().call()
+            token_decimals = get_token_decimals(w3, token_address)
+            token_symbol = get_token_symbol(w3, token_address)
 
             transfer = event.values.copy()
             amount = transfer.pop("value") / (10**token_decimals)
@@ -132,7 +136,7 @@ def get_tx_executed_msg(tx_receipt: TxReceipt, chain: Blockchain) -> (str, str):
 def get_tx_receipt_message_with_transfers(
     tx_receipt: object, target_address: str | ChecksumAddress | Address, w3: Web3
 ) -> (str, str):
-    chain = Chain.get_blockchain_from_web3(w3)
+    chain = get_blockchain(w3)
     tx_executed_message, tx_executed_message_slack = get_tx_executed_msg(tx_receipt, chain)
     transfers, transfers_message = get_token_amounts_from_transfer_events(tx_receipt, target_address, w3)
 
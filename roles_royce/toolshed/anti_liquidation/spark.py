@@ -4,11 +4,13 @@ from enum import Enum
 
 from defabipedia.spark import Abis, ContractSpecs
 from defabipedia.tokens import erc20_contract
-from defabipedia.types import Blockchain, Chain
+from defabipedia.types import Blockchain
 from web3 import Web3
 from web3.types import Address, ChecksumAddress
 
 from roles_royce import roles
+from roles_royce.chain import get_blockchain
+from roles_royce.metadata_cache import get_token_decimals
 from roles_royce.protocols.eth import spark
 from roles_royce.protocols.eth.spark import RateMode
 from roles_royce.toolshed.protocol_utils.spark.utils import SparkToken, SparkUtils
@@ -80,7 +82,7 @@ class SparkCDPManager:
         if not self.owner_address:
             raise ValueError("'owner_address' must be filled.")
         self.owner_address = to_checksum_address(self.owner_address)
-        self.blockchain = Chain.get_blockchain_from_web3(self.w3)
+        self.blockchain = get_blockchain(self.w3)
         if self.token_addresses_block == "latest":
             self.token_addresses_block = self.w3.eth.block_number
         self.token_addresses = SparkUtils.get_spark_token_addresses(self.w3, block=self.token_addresses_block)
@@ -110,8 +112,7 @@ class SparkCDPManager:
         for element in spark_tokens:
             # Decimals
 
-            token_contract = erc20_contract(self.w3, element[SparkToken.UNDERLYING])
-            decimals = token_contract.functions.decimals().call(block_identifier=block)
+            decimals = get_token_decimals(self.w3, element[SparkToken.UNDERLYING])
 
             # Wallet balances
             wallet_data = protocol_data_provider_contract.functions.getUserReserveData(
@@ -226,7 +227,7 @@ class SparkCDPManager:
         if block == "latest":
             block = self.w3.eth.block_number
 
-        token_in_decimals = erc20_contract(self.w3, token_in_address).functions.decimals().call(block_identifier=block)
+        token_in_decimals = get_token_decimals(self.w3, token_in_address)
 
         health_factor = spark_cdp.health_factor
         balances_data = spark_cdp.balances_data
@@ -307,7 +308,7 @@ class SparkCDPManager:
         pool_addresses_provider_contract = ContractSpecs[self.blockchain].PoolAddressesProvider.contract(self.w3)
         lending_pool_address = pool_addresses_provider_contract.functions.getPool().call()
         allowance = token_in_contract.functions.allowance(self.owner_address, lending_pool_address).call()
-        blockchain = Chain.get_blockchain_from_web3(self.w3)
+        blockchain = get_blockchain(self.w3)
         if w3 is None:
             w3 = self.w3
 
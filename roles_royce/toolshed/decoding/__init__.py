@@ -0,0 +1,8 @@
+from .decoder import (
+    CalldataDecoder,
+    DecodedCall,
+    SelectorIndex,
+    decode_exec_transaction_with_role,
+    get_default_decoder,
+    unpack_multisend,
+)
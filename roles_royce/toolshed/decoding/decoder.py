@@ -0,0 +1,190 @@
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from eth_utils import to_checksum_address
+
+from roles_royce.protocols.base import ContractMethod, Operation
+from roles_royce.protocols.multisend import MultiSend
+from roles_royce.protocols.registry import SelectorRegistry, all_subclasses, get_selector_registry
+from roles_royce.protocols.roles_modifier import ExecTransactionWithRoleV1, ExecTransactionWithRoleV2
+
+logger = logging.getLogger(__name__)
+
+# operation (1 byte) + to (20 bytes) + value (32 bytes) + data length (32 bytes)
+MULTISEND_TX_HEADER_SIZE = 85
+
+
+def _selector_hex(selector: bytes) -> str:
+    return "0x" + selector.hex()
+
+
+def _data_to_bytes(data: str | bytes) -> bytes:
+    if isinstance(data, str):
+        return bytes.fromhex(data.removeprefix("0x"))
+    return bytes(data)
+
+
+class SelectorIndex:
+    """Index of ContractMethod classes by 4 bytes selector and target address."""
+
+    def __init__(self, methods: Iterable[type[ContractMethod]] = ()):
+        self._by_selector: dict[str, list[type[ContractMethod]]] = defaultdict(list)
+        self._by_selector_and_target: dict[tuple[str, str], type[ContractMethod]] = {}
+        for method in methods:
+            self.add(method)
+
+    @classmethod
+    def from_subclasses(cls, base: type[ContractMethod] = ContractMethod) -> "SelectorIndex":
+        """Index all the (already imported) subclasses of ``base``."""
+        return cls(all_subclasses(base))
+
+    def add(self, method: type[ContractMethod]):
+        if not method.name:
+            return
+        try:
+            selector = _selector_hex(method.get_encoder().selector)
+        except Exception as e:
+            logger.debug(f"Unable to index {method.__name__}: {e}")
+            return
+        if method not in self._by_selector[selector]:
+            self._by_selector[selector].append(method)
+        target = method.target_address
+        if isinstance(target, str) and target:
+            self._by_selector_and_target.setdefault((selector, target.lower()), method)
+
+    def lookup(self, selector: str, target: str | None = None) -> type[ContractMethod] | None:
+        """The ContractMethod class for the selector.
+
+        If ``target`` is given, a class with that fixed target address is preferred over other classes
+        with the same selector.
+        """
+        if target:
+            method = self._by_selector_and_target.get((selector, target.lower()))
+            if method:
+                return method
+        methods = self._by_selector.get(selector)
+        return methods[0] if methods else None
+
+    def __len__(self):
+        return sum(len(methods) for methods in self._by_selector.values())
+
+
+@dataclass
+class DecodedCall:
+    """A call decoded from its calldata.
+
+    Calls that wrap other calls (``execTransactionWithRole`` and ``multiSend``) have them decoded in ``calls``.
+    """
+
+    to: str | None
+    data: bytes
+    value: int = 0
+    operation: Operation = Operation.CALL
+    selector: str | None = None
+    method: type[ContractMethod] | None = None
+    inputs: dict | None = None
+    calls: list["DecodedCall"] = field(default_factory=list)
+
+    @property
+    def name(self) -> str | None:
+        return self.method.name if self.method else None
+
+    def flatten(self) -> list["DecodedCall"]:
+        """The innermost calls, the ones that are not wrappers of other calls."""
+        if not self.calls:
+            return [self]
+        return [call for inner_call in self.calls for call in inner_call.flatten()]
+
+
+def unpack_multisend(transactions: bytes) -> list[tuple[Operation, str, int, bytes]]:
+    """Unpack the ``transactions`` argument of ``multiSend`` into (operation, to, value, data) tuples."""
+    view = memoryview(transactions)
+    result = []
+    i = 0
+    while i < len(view):
+        if i + MULTISEND_TX_HEADER_SIZE > len(view):
+            raise ValueError(f"Malformed multisend transactions, truncated header at offset {i}")
+        operation = Operation(view[i])
+        to = to_checksum_address(bytes(view[i + 1 : i + 21]))
+        value = int.from_bytes(view[i + 21 : i + 53], "big")
+        data_length = int.from_bytes(view[i + 53 : i + 85], "big")
+        start = i + MULTISEND_TX_HEADER_SIZE
+        if start + data_length > len(view):
+            raise ValueError(f"Malformed multisend transactions, truncated data at offset {start}")
+        result.append((operation, to, value, bytes(view[start : start + data_length])))
+        i = start + data_length
+    return result
+
+
+class CalldataDecoder:
+    """Decodes calldata into :class:`DecodedCall` trees.
+
+    Each call is resolved to a ContractMethod class through a :class:`SelectorIndex`, by default the global
+    :class:`~roles_royce.protocols.registry.SelectorRegistry` of all the protocol modules, and calls to
+    ``execTransactionWithRole`` (Roles v1 and v2) and ``multiSend`` are unwrapped recursively.
+    """
+
+    WRAPPERS = (ExecTransactionWithRoleV1, ExecTransactionWithRoleV2, MultiSend)
+
+    def __init__(self, index: SelectorIndex | SelectorRegistry | None = None):
+        self.index = index or get_selector_registry()
+        self._wrappers = {_selector_hex(method.get_encoder().selector): method for method in self.WRAPPERS}
+
+    def decode(
+        self, to: str | None, data: str | bytes, value: int = 0, operation: Operation = Operation.CALL
+    ) -> DecodedCall:
+        """Decode a call to ``to`` with ``data`` as calldata."""
+        data = _data_to_bytes(data)
+        call = DecodedCall(to=to, data=data, value=value, operation=Operation(operation))
+        if len(data) < 4:
+            return call
+        call.selector = _selector_hex(data[:4])
+
+        wrapper = self._wrappers.get(call.selector)
+        call.method = wrapper or self.index.lookup(call.selector, to)
+        if call.method is None:
+            return call
+        try:
+            call.inputs = call.method.get_encoder().decode(data)
+        except Exception as e:
+            logger.debug(f"Unable to decode the calldata as {call.method.__name__}: {e}")
+            call.method = None
+            return call
+
+        if call.method is MultiSend:
+            call.calls = [
+                self.decode(to, data, value, operation)
+                for operation, to, value, data in unpack_multisend(call.inputs["transactions"])
+            ]
+        elif wrapper:
+            call.calls = [
+                self.decode(
+                    call.inputs["to"], call.inputs["data"], call.inputs["value"], operation=call.inputs["operation"]
+                )
+            ]
+        return call
+
+    def decode_exec_transaction_with_role(self, data: str | bytes, roles_mod_address: str | None = None) -> DecodedCall:
+        """Decode the calldata of an ``execTransactionWithRole`` call, with all its inner calls."""
+        call = self.decode(roles_mod_address, data)
+        if call.method not in (ExecTransactionWithRoleV1, ExecTransactionWithRoleV2):
+            raise ValueError(f"Calldata is not an execTransactionWithRole call: {call.selector}")
+        return call
+
+
+_default_decoder: CalldataDecoder | None = None
+
+
+def get_default_decoder() -> CalldataDecoder:
+    """A decoder shared in the process, created on first use."""
+    global _default_decoder
+    if _default_decoder is None:
+        _default_decoder = CalldataDecoder()
+    return _default_decoder
+
+
+def decode_exec_transaction_with_role(data: str | bytes, roles_mod_address: str | None = None) -> DecodedCall:
+    """Decode the calldata of an ``execTransactionWithRole`` call using the default decoder."""
+    return get_default_decoder().decode_exec_transaction_with_role(data, roles_mod_address)
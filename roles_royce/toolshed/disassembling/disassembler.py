@@ -1,10 +1,11 @@
 from dataclasses import dataclass, field
 
-from defabipedia.types import Blockchain, Chain
+from defabipedia.types import Blockchain
 from web3 import Web3
 from web3.types import Address, ChecksumAddress, TxParams, TxReceipt
 
 from roles_royce import roles
+from roles_royce.chain import get_blockchain
 from roles_royce.generic_method import Transactable
 from roles_royce.utils import to_checksum_address
 
@@ -21,7 +22,7 @@ class Disassembler:
     def __post_init__(self):
         self.avatar_safe_address = to_checksum_address(self.avatar_safe_address)
         self.roles_mod_address = to_checksum_address(self.roles_mod_address)
-        self.blockchain = Chain.get_blockchain_from_web3(self.w3)
+        self.blockchain = get_blockchain(self.w3)
 
     def send(self, txns: list[Transactable], private_key: str, w3: Web3 = None) -> TxReceipt:
         """Executes the multisend batched transaction built from the transactables.
@@ -66,6 +67,36 @@ class Disassembler:
             txns, role=self.role, account=account, roles_mod_address=self.roles_mod_address, web3=self.w3, block=block
         )
 
+    def check_many(
+        self,
+        txns_list: list[list[Transactable]],
+        block: int | str = "latest",
+        from_address: Address | ChecksumAddress | str | None = None,
+    ) -> list[roles.CheckResult]:
+        """Checks many independent candidate sets of transactables concurrently, see :func:`roles_royce.roles.check_many`.
+
+        Args:
+            txns_list (list[list[Transactable]]): List of candidate sets of transactions
+            block: int | str = 'latest': block number to check the transactions at
+            from_address (Address | ChecksumAddress | str, optional): from address that overrides the ones in txns.
+        Returns:
+            A CheckResult for each set, with the decoded Roles error of the ones that would revert.
+        """
+        if from_address:
+            account = from_address
+        elif self.signer_address:
+            account = self.signer_address
+        else:
+            raise ValueError("Either from_address or self.signer_address must be provided.")
+        return roles.check_many(
+            txns_list,
+            role=self.role,
+            account=account,
+            roles_mod_address=self.roles_mod_address,
+            web3=self.w3,
+            block=block,
+        )
+
     def build(self, txns: list[Transactable], from_address: Address | ChecksumAddress | str | None = None) -> TxParams:
         """Builds a multisend batched transaction from the transactables.
 
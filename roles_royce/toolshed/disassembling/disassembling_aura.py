@@ -6,6 +6,7 @@ from web3 import Web3
 from web3.types import ChecksumAddress
 
 from roles_royce.generic_method import Transactable
+from roles_royce.metadata_cache import cached_metadata
 from roles_royce.protocols.eth import aura
 from roles_royce.toolshed.disassembling.disassembling_balancer import (
     BalancerDisassembler,
@@ -39,7 +40,9 @@ class AuraDisassembler(Disassembler):
             address=aura_rewards_address, abi=Abis[self.blockchain].BaseRewardPool.abi
         )
         aura_token_amount = aura_rewards_contract.functions.balanceOf(self.avatar_safe_address).call()
-        bpt_address = aura_rewards_contract.functions.asset().call()
+        bpt_address = cached_metadata(
+            self.w3, "aura_asset", aura_rewards_address, aura_rewards_contract.functions.asset().call
+        )
 
         amount_to_redeem = int(Decimal(aura_token_amount) * Decimal(fraction))
 
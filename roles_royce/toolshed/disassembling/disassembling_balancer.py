@@ -8,6 +8,7 @@ from web3.exceptions import ContractLogicError
 
 from roles_royce.generic_method import Transactable
 from roles_royce.protocols import balancer
+from roles_royce.protocols.balancer.utils import get_bpt_pool_id, get_gauge_bpt_address
 from roles_royce.protocols.base import Address
 from roles_royce.utils import to_checksum_address
 
@@ -94,7 +95,7 @@ class BalancerDisassembler(Disassembler):
             if amount == 0:
                 return []
 
-            bpt_pool_id = "0x" + bpt_contract.functions.getPoolId().call().hex()
+            bpt_pool_id = get_bpt_pool_id(self.w3, bpt_address)
             bpt_pool_paused_state = bpt_contract.functions.getPausedState().call()
             # TODO: Not all pools have recovery mode, the following has to be improved
             try:
@@ -157,7 +158,7 @@ class BalancerDisassembler(Disassembler):
             if amount == 0:
                 return []
 
-            bpt_pool_id = "0x" + bpt_contract.functions.getPoolId().call().hex()
+            bpt_pool_id = get_bpt_pool_id(self.w3, bpt_address)
             bpt_pool_paused_state = bpt_contract.functions.getPausedState().call()
             # TODO: Not all pools have recovery mode, the following has to be improved
             try:
@@ -213,7 +214,7 @@ class BalancerDisassembler(Disassembler):
             if bpt_pool_recovery_mode is False:
                 raise ValueError("This pool is not in recovery mode.")
 
-            bpt_pool_id = "0x" + bpt_contract.functions.getPoolId().call().hex()
+            bpt_pool_id = get_bpt_pool_id(self.w3, bpt_address)
 
             amount = amount_to_redeem
             if amount is None:  # The amount to redeem might be calculated in a previous step
@@ -272,8 +273,7 @@ class BalancerDisassembler(Disassembler):
             )
             txns.append(unstake_gauge)
 
-            gauge_contract = self.w3.eth.contract(address=gauge_address, abi=Abis[self.blockchain].Gauge.abi)
-            bpt_address = gauge_contract.functions.lp_token().call()
+            bpt_address = get_gauge_bpt_address(self.w3, gauge_address)
 
             withdraw_balancer = self.exit_1_1(
                 percentage=fraction,
@@ -325,8 +325,7 @@ class BalancerDisassembler(Disassembler):
             unstake_gauge = balancer.Unstake(blockchain=self.blockchain, gauge_address=gauge_address, amount=amount)
             txns.append(unstake_gauge)
 
-            gauge_contract = self.w3.eth.contract(address=gauge_address, abi=Abis[self.blockchain].Gauge.abi)
-            bpt_address = gauge_contract.functions.lp_token().call()
+            bpt_address = get_gauge_bpt_address(self.w3, gauge_address)
 
             withdraw_balancer = self.exit_1_2(
                 percentage=fraction,
@@ -375,8 +374,7 @@ class BalancerDisassembler(Disassembler):
             unstake_gauge = balancer.Unstake(blockchain=self.blockchain, gauge_address=gauge_address, amount=amount)
             txns.append(unstake_gauge)
 
-            gauge_contract = self.w3.eth.contract(address=gauge_address, abi=Abis[self.blockchain].Gauge.abi)
-            bpt_address = gauge_contract.functions.lp_token().call()
+            bpt_address = get_gauge_bpt_address(self.w3, gauge_address)
 
             withdraw_balancer = self.exit_1_3(
                 percentage=fraction, exit_arguments=[{"bpt_address": bpt_address}], amount_to_redeem=amount
@@ -11,6 +11,7 @@ from web3 import Web3
 from web3.exceptions import ContractLogicError
 
 from roles_royce.generic_method import Transactable
+from roles_royce.metadata_cache import cached_metadata
 from roles_royce.protocols import cowswap
 from roles_royce.protocols.balancer.methods_general import ApproveForVault
 from roles_royce.protocols.balancer.methods_swap import ExactTokenInSingleSwap, QuerySwap, SingleSwap
@@ -57,10 +58,13 @@ class SwapDisassembler(Disassembler):
         return amount
 
     def get_pool_id(self, pool_address: Address) -> str:
-        return (
+        return cached_metadata(
+            self.w3,
+            "balancer_pool_id_bytes",
+            pool_address,
             self.w3.eth.contract(address=pool_address, abi=BalancerAbis[self.blockchain].UniversalBPT.abi)
             .functions.getPoolId()
-            .call()
+            .call,
         )
 
     def get_swap_pools(self, blockchain, protocol, token_in, token_out):
@@ -0,0 +1,9 @@
+from .conditions import Condition, Operator, ParameterType, Status
+from .role import (
+    Clearance,
+    ExecutionOptions,
+    FunctionPermission,
+    RolePermissions,
+    TargetPermission,
+    fetch_role_permissions,
+)
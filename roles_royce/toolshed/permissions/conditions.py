@@ -0,0 +1,396 @@
+import itertools
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+
+class ParameterType(IntEnum):
+    """Type of the parameter a Roles v2 condition applies to."""
+
+    NONE = 0
+    STATIC = 1
+    DYNAMIC = 2
+    TUPLE = 3
+    ARRAY = 4
+    CALLDATA = 5
+    ABI_ENCODED = 6
+
+
+class Operator(IntEnum):
+    """Roles v2 condition operators."""
+
+    PASS = 0
+    AND = 1
+    OR = 2
+    NOR = 3
+    MATCHES = 5
+    ARRAY_SOME = 6
+    ARRAY_EVERY = 7
+    ARRAY_SUBSET = 8
+    EQUAL_TO_AVATAR = 15
+    EQUAL_TO = 16
+    GREATER_THAN = 17
+    LESS_THAN = 18
+    SIGNED_INT_GREATER_THAN = 19
+    SIGNED_INT_LESS_THAN = 20
+    BITMASK = 21
+    CUSTOM = 22
+    WITHIN_ALLOWANCE = 28
+    ETHER_WITHIN_ALLOWANCE = 29
+    CALL_WITHIN_ALLOWANCE = 30
+
+
+class Status(IntEnum):
+    """The ``status`` of the Roles v2 ``ConditionViolation(uint8,bytes32)`` error."""
+
+    OK = 0
+    DELEGATE_CALL_NOT_ALLOWED = 1
+    TARGET_ADDRESS_NOT_ALLOWED = 2
+    FUNCTION_NOT_ALLOWED = 3
+    SEND_NOT_ALLOWED = 4
+    OR_VIOLATION = 5
+    NOR_VIOLATION = 6
+    PARAMETER_NOT_ALLOWED = 7
+    PARAMETER_LESS_THAN_ALLOWED = 8
+    PARAMETER_GREATER_THAN_ALLOWED = 9
+    PARAMETER_NOT_A_MATCH = 10
+    NOT_EVERY_ARRAY_ELEMENT_PASSES = 11
+    NO_ARRAY_ELEMENT_PASSES = 12
+    PARAMETER_NOT_SUBSET_OF_ALLOWED = 13
+    BITMASK_OVERFLOW = 14
+    BITMASK_NOT_ALLOWED = 15
+    CUSTOM_CONDITION_VIOLATION = 16
+    ALLOWANCE_EXCEEDED = 17
+    CALL_ALLOWANCE_EXCEEDED = 18
+    ETHER_ALLOWANCE_EXCEEDED = 19
+
+
+LOGICAL_OPERATORS = (Operator.AND, Operator.OR, Operator.NOR)
+
+# Operators that depend on state only the contracts have (allowance balances and custom checker contracts), they are
+# left to the on-chain check
+ON_CHAIN_OPERATORS = (
+    Operator.CUSTOM,
+    Operator.WITHIN_ALLOWANCE,
+    Operator.ETHER_WITHIN_ALLOWANCE,
+    Operator.CALL_WITHIN_ALLOWANCE,
+)
+
+ARRAY_SUBSET_MAX_ELEMENTS = 256
+
+
+class CalldataOutOfBounds(Exception):
+    """The calldata is shorter than what the condition tree says it holds."""
+
+
+def _to_bytes(value: str | bytes | None) -> bytes:
+    if not value:
+        return b""
+    if isinstance(value, str):
+        return bytes.fromhex(value.removeprefix("0x"))
+    return bytes(value)
+
+
+@dataclass
+class Condition:
+    """A node of a Roles v2 condition tree."""
+
+    param_type: ParameterType
+    operator: Operator
+    comp_value: bytes = b""
+    children: list["Condition"] = field(default_factory=list)
+
+    @classmethod
+    def from_flat(cls, conditions: list) -> "Condition":
+        """Build the tree from the ``ConditionFlat[]`` of ``scopeFunction``: (parent, paramType, operator, compValue)
+        tuples, or dicts with those keys as decoded by Web3, in breadth-first order, where the root is the first one and
+        is its own parent."""
+        conditions = [
+            (c["parent"], c["paramType"], c["operator"], c["compValue"]) if isinstance(c, Mapping) else tuple(c)
+            for c in conditions
+        ]
+        nodes = [
+            cls(ParameterType(param_type), Operator(operator), _to_bytes(comp_value))
+            for _, param_type, operator, comp_value in conditions
+        ]
+        for i, (parent, *_) in enumerate(conditions):
+            if i > 0:
+                nodes[parent].children.append(nodes[i])
+        return nodes[0]
+
+    @classmethod
+    def from_dict(cls, condition: dict) -> "Condition":
+        """Build the tree from nested dicts with ``paramType``, ``operator``, ``compValue`` and ``children`` keys, as
+        exported by the Roles app and subgraph."""
+        return cls(
+            ParameterType(condition["paramType"]),
+            Operator(condition["operator"]),
+            _to_bytes(condition.get("compValue")),
+            [cls.from_dict(child) for child in condition.get("children") or []],
+        )
+
+    @property
+    def type_node(self) -> "Condition | None":
+        """The node describing the type of the parameter the condition applies to, or None if it doesn't apply to a
+        parameter. Logical conditions apply to the parameter of their operands."""
+        if self.param_type != ParameterType.NONE:
+            return self
+        if self.operator in LOGICAL_OPERATORS:
+            for child in self.children:
+                node = child.type_node
+                if node is not None:
+                    return node
+        return None
+
+    @property
+    def structural_children(self) -> list["Condition"]:
+        return [child for child in self.children if child.type_node is not None]
+
+
+@dataclass
+class Payload:
+    """Location and size of a parameter in the calldata, with the ones of its components."""
+
+    location: int
+    size: int
+    children: list["Payload"] = field(default_factory=list)
+
+
+def _ceil32(n: int) -> int:
+    return (n + 31) // 32 * 32
+
+
+def _word(data: bytes, location: int) -> bytes:
+    if location + 32 > len(data):
+        raise CalldataOutOfBounds()
+    return data[location : location + 32]
+
+
+def _uint(data: bytes, location: int) -> int:
+    return int.from_bytes(_word(data, location), "big")
+
+
+def _is_static(node: Condition) -> bool:
+    if node.param_type == ParameterType.STATIC:
+        return True
+    if node.param_type == ParameterType.TUPLE:
+        return all(_is_static(child.type_node) for child in node.structural_children)
+    return False
+
+
+def _static_size(node: Condition) -> int:
+    if node.param_type == ParameterType.TUPLE:
+        return sum(_static_size(child.type_node) for child in node.structural_children)
+    return 32
+
+
+def _decode_block(data: bytes, base: int, nodes: list[Condition]) -> tuple[list[Payload], int]:
+    """Decode consecutive ABI encoded parameters, returns their payloads and where the block ends."""
+    payloads = []
+    head = base
+    end = base
+    for node in nodes:
+        if _is_static(node):
+            location = head
+            head += _static_size(node)
+        else:
+            location = base + _uint(data, head)
+            head += 32
+        payload = _decode(data, location, node)
+        payloads.append(payload)
+        end = max(end, head, payload.location + payload.size)
+    return payloads, end
+
+
+def _decode(data: bytes, location: int, node: Condition) -> Payload:
+    param_type = node.param_type
+    if param_type == ParameterType.STATIC:
+        _word(data, location)
+        return Payload(location, 32)
+    if param_type == ParameterType.TUPLE:
+        children, end = _decode_block(data, location, [child.type_node for child in node.structural_children])
+        return Payload(location, end - location, children)
+    if param_type == ParameterType.ARRAY:
+        length = _uint(data, location)
+        element = node.structural_children[0].type_node
+        children, end = _decode_block(data, location + 32, [element] * length)
+        return Payload(location, end - location, children)
+
+    # Dynamic, Calldata and AbiEncoded are bytes, the last two with ABI encoded parameters inside
+    length = _uint(data, location)
+    if location + 32 + length > len(data):
+        raise CalldataOutOfBounds()
+    payload = Payload(location, 32 + _ceil32(length))
+    if param_type in (ParameterType.CALLDATA, ParameterType.ABI_ENCODED):
+        start = location + 32 + (4 if param_type == ParameterType.CALLDATA else 0)
+        nodes = [child.type_node for child in node.structural_children]
+        payload.children, _ = _decode_block(data[: location + 32 + length], start, nodes)
+    return payload
+
+
+def decode_calldata(data: bytes, condition: Condition) -> Payload | None:
+    """Locate in the calldata of a function call the parameters that the condition tree of the function checks."""
+    node = condition.type_node
+    if node is None:
+        return None
+    start = 4 if node.param_type == ParameterType.CALLDATA else 0
+    children, _ = _decode_block(data, start, [child.type_node for child in node.structural_children])
+    return Payload(0, len(data), children)
+
+
+@dataclass
+class Context:
+    """What a condition is evaluated with, besides the parameter payload."""
+
+    data: bytes
+    value: int
+    avatar: str | None = None
+
+
+def _slice(context: Context, payload: Payload) -> bytes:
+    return context.data[payload.location : payload.location + payload.size]
+
+
+def _to_int(value: bytes, signed: bool = False) -> int:
+    return int.from_bytes(value.rjust(32, b"\0"), "big", signed=signed)
+
+
+def _compare(condition: Condition, payload: Payload, context: Context) -> Status:
+    operator = condition.operator
+    if operator == Operator.EQUAL_TO_AVATAR:
+        # Fail closed, a parameter can't be proven to be the avatar if the avatar is not known
+        if context.avatar is None:
+            return Status.PARAMETER_NOT_ALLOWED
+        expected = bytes.fromhex(context.avatar.removeprefix("0x")).rjust(32, b"\0")
+        return Status.OK if _slice(context, payload) == expected else Status.PARAMETER_NOT_ALLOWED
+    if operator == Operator.EQUAL_TO:
+        value = _slice(context, payload)
+        if condition.param_type == ParameterType.STATIC:
+            comp_value = condition.comp_value.rjust(32, b"\0")
+        else:
+            comp_value = condition.comp_value
+        return Status.OK if value == comp_value else Status.PARAMETER_NOT_ALLOWED
+
+    signed = operator in (Operator.SIGNED_INT_GREATER_THAN, Operator.SIGNED_INT_LESS_THAN)
+    value = _to_int(_slice(context, payload), signed)
+    comp_value = _to_int(condition.comp_value, signed)
+    if operator in (Operator.GREATER_THAN, Operator.SIGNED_INT_GREATER_THAN):
+        return Status.OK if value > comp_value else Status.PARAMETER_LESS_THAN_ALLOWED
+    return Status.OK if value < comp_value else Status.PARAMETER_GREATER_THAN_ALLOWED
+
+
+def _bitmask(condition: Condition, payload: Payload, context: Context) -> Status:
+    comp_value = condition.comp_value.ljust(32, b"\0")
+    value = _slice(context, payload)
+    if condition.param_type != ParameterType.STATIC:
+        value = value[32:]
+    shift = int.from_bytes(comp_value[:2], "big")
+    if shift >= len(value):
+        return Status.BITMASK_OVERFLOW
+    mask = int.from_bytes(comp_value[2:17], "big")
+    expected = int.from_bytes(comp_value[17:32], "big")
+    masked = int.from_bytes(value[shift : shift + 15].ljust(15, b"\0"), "big") & mask
+    return Status.OK if masked == expected else Status.BITMASK_NOT_ALLOWED
+
+
+def _all(statuses) -> Status | None:
+    """Status of conditions that must all pass: the first violation, unknown if any is unknown, otherwise OK."""
+    result = Status.OK
+    for status in statuses:
+        if status is None:
+            result = None
+        elif status != Status.OK:
+            return status
+    return result
+
+
+def _any(statuses, violation: Status) -> Status | None:
+    """Status of conditions where one must pass: OK if one passes, unknown if any is unknown, otherwise ``violation``."""
+    result = violation
+    for status in statuses:
+        if status == Status.OK:
+            return Status.OK
+        if status is None:
+            result = None
+    return result
+
+
+def _matches(condition: Condition, payload: Payload, context: Context) -> Status | None:
+    structural = condition.structural_children
+    if len(structural) != len(payload.children):
+        return Status.PARAMETER_NOT_A_MATCH
+    return _all(
+        itertools.chain(
+            (_evaluate(child, child_payload, context) for child, child_payload in zip(structural, payload.children)),
+            (_evaluate(child, None, context) for child in condition.children if child.type_node is None),
+        )
+    )
+
+
+def _array_subset(condition: Condition, payload: Payload, context: Context) -> Status | None:
+    if not payload.children or len(payload.children) > ARRAY_SUBSET_MAX_ELEMENTS:
+        return Status.PARAMETER_NOT_SUBSET_OF_ALLOWED
+    statuses = [[_evaluate(child, element, context) for child in condition.children] for element in payload.children]
+
+    def is_subset(passes) -> bool:
+        taken = set()
+        for element_statuses in statuses:
+            for i, status in enumerate(element_statuses):
+                if i not in taken and passes(status):
+                    taken.add(i)
+                    break
+            else:
+                return False
+        return True
+
+    if is_subset(lambda status: status == Status.OK):
+        return Status.OK
+    # The elements may be matched differently depending on the unknown conditions
+    if is_subset(lambda status: status is None or status == Status.OK):
+        return None
+    return Status.PARAMETER_NOT_SUBSET_OF_ALLOWED
+
+
+def _evaluate(condition: Condition, payload: Payload | None, context: Context) -> Status | None:
+    """Like :func:`evaluate`, but ``None`` if the result depends on the on-chain operators of the condition."""
+    operator = condition.operator
+    if operator == Operator.PASS:
+        return Status.OK
+    if operator in ON_CHAIN_OPERATORS:
+        return None
+    if operator == Operator.AND:
+        return _all(_evaluate(child, payload, context) for child in condition.children)
+    if operator == Operator.OR:
+        return _any((_evaluate(child, payload, context) for child in condition.children), Status.OR_VIOLATION)
+    if operator == Operator.NOR:
+        status = _any((_evaluate(child, payload, context) for child in condition.children), Status.NOR_VIOLATION)
+        if status is None:
+            return None
+        return Status.NOR_VIOLATION if status == Status.OK else Status.OK
+    if operator == Operator.MATCHES:
+        return _matches(condition, payload, context)
+    if operator == Operator.ARRAY_SOME:
+        return _any(
+            (_evaluate(condition.children[0], element, context) for element in payload.children),
+            Status.NO_ARRAY_ELEMENT_PASSES,
+        )
+    if operator == Operator.ARRAY_EVERY:
+        status = _all(_evaluate(condition.children[0], element, context) for element in payload.children)
+        if status is None or status == Status.OK:
+            return status
+        return Status.NOT_EVERY_ARRAY_ELEMENT_PASSES
+    if operator == Operator.ARRAY_SUBSET:
+        return _array_subset(condition, payload, context)
+    if operator == Operator.BITMASK:
+        return _bitmask(condition, payload, context)
+    return _compare(condition, payload, context)
+
+
+def evaluate(condition: Condition, payload: Payload | None, context: Context) -> Status:
+    """Evaluate a condition on the parameter located by ``payload``, the same way the Roles v2 contract does.
+
+    The on-chain operators can't be evaluated here, so a condition whose result depends on them is OK and left to the
+    on-chain check, even inside a ``NOR``.
+    """
+    status = _evaluate(condition, payload, context)
+    return Status.OK if status is None else status
@@ -0,0 +1,298 @@
+import json
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from eth_utils import event_abi_to_log_topic
+from web3 import Web3
+
+from roles_royce.evm_utils import get_abi
+from roles_royce.protocols.base import Operation
+from roles_royce.protocols.multisend import MultiSend
+from roles_royce.protocols.roles_modifier import ExecTransactionWithRoleV2
+from roles_royce.protocols.roles_modifier.contract_methods import to_v2_key
+from roles_royce.roles_modifier import TransactionWouldBeReverted
+from roles_royce.toolshed.decoding import unpack_multisend
+
+from .conditions import CalldataOutOfBounds, Condition, Context, Status, decode_calldata, evaluate
+
+MULTISEND_SELECTOR = "0x8d80ff0a"
+MULTISEND_UNWRAPPER = "0x93B7fCbc63ED8a3a24B59e1C3e6649D50B7427c0"
+# Unwrap adapters that the Roles v2 deployments set up for the MultiSend and MultiSendCallOnly contracts
+DEFAULT_UNWRAPPERS = {
+    ("0x38869bf66a61cf6bdb996a6ae40d5853fd43b526", MULTISEND_SELECTOR): MULTISEND_UNWRAPPER,
+    ("0x9641d764fc13c8b624c04430c7356c1c7c8102e2", MULTISEND_SELECTOR): MULTISEND_UNWRAPPER,
+}
+
+CONFIG_EVENTS = (
+    "AllowTarget",
+    "ScopeTarget",
+    "RevokeTarget",
+    "AllowFunction",
+    "ScopeFunction",
+    "RevokeFunction",
+    "AssignRoles",
+    "SetUnwrapAdapter",
+    "AvatarSet",
+    "RolesModSetup",
+)
+
+
+class Clearance(IntEnum):
+    NONE = 0
+    TARGET = 1
+    FUNCTION = 2
+
+
+class ExecutionOptions(IntEnum):
+    NONE = 0
+    SEND = 1
+    DELEGATE_CALL = 2
+    BOTH = 3
+
+
+def _enum(enum: type[IntEnum], value: int | str) -> IntEnum:
+    """Enum member from its value or from its name as written in the Roles app exports, e.g. ``"DelegateCall"``."""
+    if isinstance(value, str) and not value.isdigit():
+        return enum[value.replace("_", "").upper().replace("DELEGATECALL", "DELEGATE_CALL")]
+    return enum(int(value))
+
+
+def _selector(selector: str | bytes) -> str:
+    return selector.lower() if isinstance(selector, str) else "0x" + bytes(selector).hex()
+
+
+def _role_key(role: str | bytes) -> str:
+    return to_v2_key(role).lower() if isinstance(role, str) else "0x" + bytes(role).hex()
+
+
+def condition_violation(status: Status, info: bytes = b"\0" * 32) -> TransactionWouldBeReverted:
+    """The error that checking the transaction against the contract would raise."""
+    return TransactionWouldBeReverted("ConditionViolation(uint8,bytes32)", (int(status), info))
+
+
+@dataclass
+class FunctionPermission:
+    """A function of a scoped target: allowed with any calldata if ``wildcarded``, otherwise when its condition holds."""
+
+    options: ExecutionOptions = ExecutionOptions.NONE
+    wildcarded: bool = False
+    condition: Condition | None = None
+
+
+@dataclass
+class TargetPermission:
+    clearance: Clearance = Clearance.NONE
+    options: ExecutionOptions = ExecutionOptions.NONE
+    functions: dict[str, FunctionPermission] = field(default_factory=dict)
+
+
+@dataclass
+class RolePermissions:
+    """Offline copy of the permissions of a Roles v2 role, to check transactions without calling the node.
+
+    The checks follow the Roles v2 contract and raise the same
+    :class:`~roles_royce.roles_modifier.TransactionWouldBeReverted` errors that the static call would, so it can be
+    used as a pre-filter before :func:`roles_royce.roles.check`. Conditions that depend on on-chain state (allowances
+    and custom conditions) are not evaluated, the static call remains the final word for them.
+
+    Load it with :meth:`from_json` from a Roles app export, or with :meth:`from_events` / :func:`fetch_role_permissions`
+    from the configuration events of the roles modifier.
+
+    Args:
+        role_key: The role key, a bytes32 hex str.
+        targets: Permissions by lowercase target address.
+        members: Lowercase addresses of the modules that have the role, None if unknown.
+        unwrappers: Unwrap adapters by (lowercase target address, selector), for multi entrypoints like MultiSend.
+            Defaults to the adapters of the Roles v2 deployments.
+        avatar: Avatar of the roles modifier, to evaluate ``EqualToAvatar`` conditions, which fail if it is unknown.
+    """
+
+    role_key: str
+    targets: dict[str, TargetPermission] = field(default_factory=dict)
+    members: set[str] | None = None
+    unwrappers: dict[tuple[str, str], str] = field(default_factory=lambda: dict(DEFAULT_UNWRAPPERS))
+    avatar: str | None = None
+
+    @classmethod
+    def from_json(cls, export: dict | str, role_key: str | None = None) -> "RolePermissions":
+        """Load the role from a JSON export with ``key``, ``members`` and ``targets`` (each with ``address``,
+        ``clearance``, ``executionOptions`` and ``functions``), as the Roles app and subgraph provide, and optionally
+        the ``avatar`` of the roles modifier."""
+        if isinstance(export, str):
+            export = json.loads(export)
+        role = cls(role_key=_role_key(role_key or export["key"]), avatar=export.get("avatar"))
+        if export.get("members") is not None:
+            role.members = {
+                (member if isinstance(member, str) else member["address"]).lower() for member in export["members"]
+            }
+        for target in export.get("targets", []):
+            permission = TargetPermission(
+                clearance=_enum(Clearance, target["clearance"]),
+                options=_enum(ExecutionOptions, target.get("executionOptions", 0)),
+            )
+            for function in target.get("functions", []):
+                if function.get("condition"):
+                    condition = Condition.from_dict(function["condition"])
+                elif function.get("conditions"):
+                    condition = Condition.from_flat(function["conditions"])
+                else:
+                    condition = None
+                permission.functions[_selector(function["selector"])] = FunctionPermission(
+                    options=_enum(ExecutionOptions, function.get("executionOptions", 0)),
+                    wildcarded=function.get("wildcarded", condition is None),
+                    condition=condition,
+                )
+            role.targets[target["address"].lower()] = permission
+        return role
+
+    @classmethod
+    def from_events(cls, events: list, role: str | bytes) -> "RolePermissions":
+        """Replay the configuration events of the roles modifier, decoded and in chronological order.
+
+        The unwrap adapters are only the ones set by ``SetUnwrapAdapter`` events, like in the contract."""
+        role = cls(role_key=_role_key(role), members=set(), unwrappers={})
+        for event in events:
+            role.apply_event(event["event"], event["args"])
+        return role
+
+    def apply_event(self, name: str, args: dict):
+        """Update the permissions with a configuration event, events of other roles are ignored."""
+        if name == "SetUnwrapAdapter":
+            key = (args["to"].lower(), _selector(args["selector"]))
+            if int(args["adapter"], 16) == 0:
+                self.unwrappers.pop(key, None)
+            else:
+                self.unwrappers[key] = args["adapter"]
+            return
+        if name in ("AvatarSet", "RolesModSetup"):
+            self.avatar = args["newAvatar"] if name == "AvatarSet" else args["avatar"]
+            return
+        if name == "AssignRoles":
+            for role_key, member_of in zip(args["roleKeys"], args["memberOf"]):
+                if _role_key(role_key) == self.role_key:
+                    if self.members is None:
+                        self.members = set()
+                    if member_of:
+                        self.members.add(args["module"].lower())
+                    else:
+                        self.members.discard(args["module"].lower())
+            return
+        if name not in CONFIG_EVENTS or _role_key(args["roleKey"]) != self.role_key:
+            return
+
+        target = self.targets.setdefault(args["targetAddress"].lower(), TargetPermission())
+        # Like in the contract, revoking or re-scoping a target keeps the function permissions of the target
+        if name == "AllowTarget":
+            target.clearance, target.options = Clearance.TARGET, ExecutionOptions(args["options"])
+        elif name == "ScopeTarget":
+            target.clearance, target.options = Clearance.FUNCTION, ExecutionOptions.NONE
+        elif name == "RevokeTarget":
+            target.clearance, target.options = Clearance.NONE, ExecutionOptions.NONE
+        elif name == "AllowFunction":
+            target.functions[_selector(args["selector"])] = FunctionPermission(
+                ExecutionOptions(args["options"]), wildcarded=True
+            )
+        elif name == "ScopeFunction":
+            target.functions[_selector(args["selector"])] = FunctionPermission(
+                ExecutionOptions(args["options"]), condition=Condition.from_flat(args["conditions"])
+            )
+        elif name == "RevokeFunction":
+            target.functions.pop(_selector(args["selector"]), None)
+
+    def check_exec_transaction_with_role(self, calldata: str | bytes, module: str | None = None) -> bool:
+        """Check an ``execTransactionWithRole`` calldata sent by ``module``, e.g. ``PreparedRoleTx.calldata``.
+
+        Raises:
+            TransactionWouldBeReverted: With the error that the roles modifier would revert with.
+        """
+        encoder = ExecTransactionWithRoleV2.get_encoder()
+        if isinstance(calldata, str):
+            calldata = bytes.fromhex(calldata.removeprefix("0x"))
+        if calldata[:4] != encoder.selector:
+            raise ValueError("Calldata is not a Roles v2 execTransactionWithRole call")
+        inputs = encoder.decode(calldata)
+        if _role_key(inputs["role_key"]) != self.role_key:
+            raise ValueError(f"The permissions of the role {_role_key(inputs['role_key'])} are not loaded")
+        if module is not None and self.members is not None and module.lower() not in self.members:
+            raise TransactionWouldBeReverted("NoMembership()", None)
+        return self.check_transaction(inputs["to"], inputs["value"], inputs["data"], Operation(inputs["operation"]))
+
+    def check_transaction(self, to: str, value: int, data: str | bytes, operation: Operation = Operation.CALL) -> bool:
+        """Check a transaction of the avatar, unwrapping the multi entrypoint calls like the contract does.
+
+        Raises:
+            TransactionWouldBeReverted: With the error that the roles modifier would revert with.
+        """
+        if isinstance(data, str):
+            data = bytes.fromhex(data.removeprefix("0x"))
+        if (to.lower(), "0x" + data[:4].hex()) not in self.unwrappers:
+            self._check_single(to, value, data, operation)
+            return True
+
+        try:
+            if value != 0 or operation != Operation.DELEGATE_CALL:
+                raise ValueError("Unsupported mode")
+            transactions = unpack_multisend(MultiSend.get_encoder().decode(data)["transactions"])
+            if any(inner_operation != Operation.CALL for inner_operation, *_ in transactions):
+                raise ValueError("Unsupported mode")
+        except Exception as e:
+            raise TransactionWouldBeReverted("MalformedMultiEntrypoint()", None) from e
+        for _, inner_to, inner_value, inner_data in transactions:
+            self._check_single(inner_to, inner_value, inner_data, Operation.CALL)
+        return True
+
+    def _check_single(self, to: str, value: int, data: bytes, operation: Operation):
+        if 0 < len(data) < 4:
+            raise TransactionWouldBeReverted("FunctionSignatureTooShort()", None)
+        target = self.targets.get(to.lower())
+        if target is None or target.clearance == Clearance.NONE:
+            raise condition_violation(Status.TARGET_ADDRESS_NOT_ALLOWED)
+        if target.clearance == Clearance.TARGET:
+            self._check_options(value, operation, target.options)
+            return
+
+        selector = data[:4].ljust(4, b"\0")
+        function = target.functions.get("0x" + selector.hex())
+        if function is None:
+            raise condition_violation(Status.FUNCTION_NOT_ALLOWED, selector.ljust(32, b"\0"))
+        self._check_options(value, operation, function.options)
+        if function.wildcarded or function.condition is None:
+            return
+        try:
+            payload = decode_calldata(data, function.condition)
+        except CalldataOutOfBounds:
+            raise TransactionWouldBeReverted("CalldataOutOfBounds()", None)
+        status = evaluate(function.condition, payload, Context(data=data, value=value, avatar=self.avatar))
+        if status != Status.OK:
+            raise condition_violation(status)
+
+    @staticmethod
+    def _check_options(value: int, operation: Operation, options: ExecutionOptions):
+        if value > 0 and not options & ExecutionOptions.SEND:
+            raise condition_violation(Status.SEND_NOT_ALLOWED)
+        if operation == Operation.DELEGATE_CALL and not options & ExecutionOptions.DELEGATE_CALL:
+            raise condition_violation(Status.DELEGATE_CALL_NOT_ALLOWED)
+
+
+def fetch_role_permissions(
+    w3: Web3, roles_mod_address: str, role: str, from_block: int = 0, to_block: int | str = "latest"
+) -> RolePermissions:
+    """Load the permissions of a role from the configuration events of a Roles v2 modifier, with a single
+    ``eth_getLogs`` request. Use ``from_block`` with the deployment block if the node limits the range of the logs."""
+    contract = w3.eth.contract(roles_mod_address, abi=get_abi("roles_v2_abi"))
+    events_by_topic = {}
+    for name in CONFIG_EVENTS:
+        event = contract.events[name]()
+        events_by_topic[event_abi_to_log_topic(event.abi)] = event
+    logs = w3.eth.get_logs(
+        {
+            "address": contract.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [["0x" + topic.hex() for topic in events_by_topic]],
+        }
+    )
+    events = []
+    for log in sorted(logs, key=lambda log: (log["blockNumber"], log["logIndex"])):
+        events.append(events_by_topic[bytes(log["topics"][0])].process_log(log))
+    return RolePermissions.from_events(events, role)
@@ -9,6 +9,8 @@ from web3 import Web3
 from web3.types import Address, ChecksumAddress
 
 from roles_royce import roles
+from roles_royce.chain import get_blockchain
+from roles_royce.metadata_cache import get_token_decimals
 from roles_royce.protocols.eth import aave_v3
 from roles_royce.protocols.eth.aave_v3 import InterestRateMode
 from roles_royce.toolshed.protocol_utils.aave_v3.utils import AaveV3Token, AaveV3Utils
@@ -80,7 +82,7 @@ class AaveV3CDPManager:
         if not self.owner_address:
             raise ValueError("'owner_address' must be filled.")
         self.owner_address = to_checksum_address(self.owner_address)
-        self.blockchain = Chain.get_blockchain_from_web3(self.w3)
+        self.blockchain = get_blockchain(self.w3)
         if self.token_addresses_block == "latest":
             self.token_addresses_block = self.w3.eth.block_number
         self.token_addresses = AaveV3Utils.get_aave_v3_token_addresses(self.w3, block=self.token_addresses_block)
@@ -115,8 +117,7 @@ class AaveV3CDPManager:
 
         for element in aave_v3_tokens:
             # Decimals
-            token_contract = self.w3.eth.contract(address=element[AaveV3Token.UNDERLYING], abi=TokenAbis.ERC20.abi)
-            decimals = token_contract.functions.decimals().call(block_identifier=block)
+            decimals = get_token_decimals(self.w3, element[AaveV3Token.UNDERLYING])
 
             # Wallet balances
             wallet_data = protocol_data_provider_contract.functions.getUserReserveData(
@@ -235,11 +236,7 @@ class AaveV3CDPManager:
 
         if block == "latest":
             block = self.w3.eth.block_number
-        token_in_decimals = (
-            self.w3.eth.contract(address=token_in_address, abi=TokenAbis.ERC20.abi)
-            .functions.decimals()
-            .call(block_identifier=block)
-        )
+        token_in_decimals = get_token_decimals(self.w3, token_in_address)
 
         health_factor = aave_v3_cdp.health_factor
         balances_data = aave_v3_cdp.balances_data
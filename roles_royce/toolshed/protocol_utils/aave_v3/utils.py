@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from enum import Enum
 
 from defabipedia.aave_v3 import ContractSpecs
-from defabipedia.types import Chain
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
+
 
 class AaveV3Token(Enum):
     """An Enum to handle AaveV3 token types."""
@@ -23,7 +24,7 @@ class AaveV3Utils:
 
     @staticmethod
     def get_aave_v3_token_addresses(w3: Web3, block: int | str = "latest") -> list[dict]:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         protocol_data_provider_contract = w3.eth.contract(
             address=ContractSpecs[blockchain].ProtocolDataProvider.address,
             abi=ContractSpecs[blockchain].ProtocolDataProvider.abi,
@@ -2,9 +2,10 @@ from dataclasses import dataclass
 from enum import Enum
 
 import defabipedia
-from defabipedia.types import Chain
 from web3 import Web3
 
+from roles_royce.chain import get_blockchain
+
 
 class SparkToken(Enum):
     """An Enum to handle Spark token types."""
@@ -23,7 +24,7 @@ class SparkUtils:
 
     @staticmethod
     def get_chi(w3: Web3, block: int | str = "latest") -> int:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         maker_pot_contract = defabipedia.maker.ContractSpecs[blockchain].Pot.contract(w3)
         ts = w3.eth.get_block(block)["timestamp"]
         rho = maker_pot_contract.functions.rho().call(block_identifier=block)
@@ -35,7 +36,7 @@ class SparkUtils:
 
     @staticmethod
     def get_spark_token_addresses(w3: Web3, block: int | str = "latest") -> list[dict]:
-        blockchain = Chain.get_blockchain_from_web3(w3)
+        blockchain = get_blockchain(w3)
         protocol_data_provider_contract = defabipedia.spark.ContractSpecs[blockchain].ProtocolDataProvider.contract(w3)
         reserve_tokens = protocol_data_provider_contract.functions.getAllReservesTokens().call(block_identifier=block)
         spark_tokens = []
@@ -1,6 +1,10 @@
 import functools
 import logging
-from typing import List
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, List
 
 from defabipedia.types import Blockchain
 from eth_abi import abi
@@ -14,6 +18,51 @@ TENDERLY_DASHBOARD_URL = "https://dashboard.tenderly.co/"
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_READS = 8
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def get_cache_dir() -> Path:
+    """Directory where roles_royce persists its caches.
+
+    It can be set with the ``ROLES_ROYCE_CACHE_DIR`` environment variable, defaults to ``~/.cache/roles_royce``.
+    """
+    return Path(os.environ.get("ROLES_ROYCE_CACHE_DIR") or Path.home() / ".cache" / "roles_royce")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_READS, thread_name_prefix="roles_royce")
+    return _executor
+
+
+def _run_in_worker(call: Callable[[], Any]) -> Any:
+    _worker_state.active = True
+    try:
+        return call()
+    finally:
+        _worker_state.active = False
+
+
+def run_concurrently(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Run independent calls, usually RPC reads, concurrently and return their results by key.
+
+    The total latency is the one of the slowest call instead of the sum of all of them. A single call, or calls made
+    from inside another concurrent call, are run in the current thread so the pool can't deadlock waiting on itself.
+    If any call raises, the exception is propagated once all the calls are finished.
+    """
+    if len(calls) <= 1 or getattr(_worker_state, "active", False):
+        return {key: call() for key, call in calls.items()}
+    futures = {key: _get_executor().submit(_run_in_worker, call) for key, call in calls.items()}
+    wait(futures.values())
+    return {key: future.result() for key, future in futures.items()}
+
 
 @functools.lru_cache(maxsize=1000)
 def to_selector(short_signature):
@@ -9,6 +9,7 @@ from roles_royce.applications.execution_app.utils import (
     gear_up,
     start_the_engine,
 )
+from roles_royce.roles import _cached_roles_mod_multisend
 
 dao = "GnosisDAO"
 blockchain = "ETHEREUM"
@@ -57,6 +58,18 @@ def test_start_the_engine(monkeypatch):
         start_the_engine(env)  # RPC endpoints are 'DummyString'
 
 
+def test_start_the_engine_preloads_the_roles_mod_multisend(monkeypatch):
+    multisend = "0x8D29bE29923b68abfDD21e541b9374737B49cdAD"
+    monkeypatch.setenv("GNOSISDAO_ETHEREUM_ROLES_MOD_MULTISEND_ADDRESS", multisend.lower())
+    env = set_env(monkeypatch, "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80")
+    assert env.ROLES_MOD_MULTISEND_ADDRESS == multisend
+
+    env.MODE = Modes.PRODUCTION
+    with pytest.raises(Exception):
+        start_the_engine(env)  # RPC endpoints are 'DummyString'
+    assert _cached_roles_mod_multisend(1, roles_mod_address) == multisend
+
+
 def test_gear_up(monkeypatch, local_node_eth):
     private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
     env = set_env(monkeypatch, private_key)
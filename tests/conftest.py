@@ -1,4 +1,13 @@
 # FIXME: this is here because somehow pytest does not detect
 #  local_node_eth being in the same file as local_node_eth_replay
 
+import pytest
 from karpatkit.test_utils.fork import accounts, local_node_eth, local_node_gc
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cache_dir(tmp_path_factory):
+    """Keep the persistent caches, like the metadata cache, out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("ROLES_ROYCE_CACHE_DIR", str(tmp_path_factory.mktemp("roles_royce_cache")))
+        yield
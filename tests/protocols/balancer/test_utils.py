@@ -1,6 +1,10 @@
+from types import SimpleNamespace
+
 import pytest
 from karpatkit.test_utils.fork import local_node_eth_replay as local_node_eth
+from web3.exceptions import ContractLogicError
 
+from roles_royce import metadata_cache
 from roles_royce.protocols.balancer.types_and_enums import PoolKind
 from roles_royce.protocols.balancer.utils import Pool
 
@@ -21,6 +25,51 @@ def test_pool_kind(local_node_eth):
     assert Pool(w3=w3, pool_id=weighted_pool_pid).pool_kind() == PoolKind.WeightedPool
 
 
+class FakeBptFunctions:
+    """Functions of a metastable pool BPT, where every call fails with ``error`` while it is set."""
+
+    def __init__(self):
+        self.error = None
+
+    def _call(self, error):
+        def call():
+            raise self.error or error
+
+        return SimpleNamespace(call=call)
+
+    def getNormalizedWeights(self):
+        return self._call(ContractLogicError("execution reverted"))
+
+    def getBptIndex(self):
+        return self._call(ContractLogicError("execution reverted"))
+
+    def inRecoveryMode(self):
+        return self._call(ContractLogicError("execution reverted"))
+
+
+class FakeProvider:
+    pass
+
+
+def test_pool_kind_is_not_cached_after_value_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROLES_ROYCE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(metadata_cache, "_cache", None)
+    functions = FakeBptFunctions()
+    pool = Pool.__new__(Pool)
+    pool.w3 = SimpleNamespace(eth=SimpleNamespace(chain_id=1), provider=FakeProvider())
+    pool.pool_id = metastable_pool_pid
+    pool.bpt_contract = SimpleNamespace(functions=functions)
+
+    # The endpoint fails, the fallback kind is returned but not cached
+    functions.error = ValueError("rate limited")
+    assert pool.pool_kind() == PoolKind.MetaStablePool
+    assert metadata_cache.get_metadata_cache().get(1, "balancer_pool_kind", metastable_pool_pid) is None
+
+    functions.error = None
+    assert pool.pool_kind() == PoolKind.MetaStablePool
+    assert metadata_cache.get_metadata_cache().get(1, "balancer_pool_kind", metastable_pool_pid) == 1
+
+
 def test_pool_assets(local_node_eth):
     w3 = local_node_eth.w3
     local_node_eth.set_block(block)
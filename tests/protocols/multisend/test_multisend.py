@@ -1,8 +1,9 @@
 from defabipedia import Chain
 
 from roles_royce import Operation
+from roles_royce.generic_method import TxData
 from roles_royce.protocols import aura
-from roles_royce.protocols.multisend import MultiSend
+from roles_royce.protocols.multisend import MultiSend, MultiSendBuilder, encode_multisend_tx
 
 
 def test_exect_transaction_with_role():
@@ -16,3 +17,21 @@ def test_exect_transaction_with_role():
         == "0x8d80ff0a000000000000000000000000000000000000000000000000000000000000002000000000000000000000000000000000000000000000000000000000000001520000a7ba8ae7bca0b10a32ea1f8e2a1da980c6cad200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000044095ea7b3000000000000000000000000616e8bfa43f920657b3497dbf40d6b1a02d4608d000000000000000000000000000000000000000000000000000000000000007b00a57b8d98dae62b26ec3bcc4a365338157060b2340000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000006443a0d066000000000000000000000000000000000000000000000000000000000000007a000000000000000000000000000000000000000000001520745dac26a092bdab00000000000000000000000000000000000000000000000000000000000000010000000000000000000000000000"
     )
     assert multisend.contract_address == "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"
+
+
+def test_multisend_builder():
+    approve = aura.ApproveAURABal(amount=123)
+    deposit = aura.DepositBPT(pool_id=122, amount=99768376997984391577003)
+    call = TxData(contract_address=deposit.contract_address, data="0x", value=5)
+
+    builder = MultiSendBuilder(tx for tx in [approve, deposit])
+    builder.add_transactable(call)
+    assert len(builder) == 3
+    assert builder.encoded_txns == b"".join(
+        encode_multisend_tx(tx.operation, tx.contract_address, tx.value, tx.data) for tx in [approve, deposit, call]
+    )
+    assert builder.encoded_txns[-85:] == (
+        b"\x00" + bytes.fromhex(deposit.contract_address[2:]) + (5).to_bytes(32, "big") + (0).to_bytes(32, "big")
+    )
+    multisend = builder.build(blockchain=Chain.ETHEREUM)
+    assert multisend.data == MultiSend.from_transactables(Chain.ETHEREUM, [approve, deposit, call]).data
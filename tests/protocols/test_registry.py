@@ -0,0 +1,55 @@
+import pytest
+
+from roles_royce.protocols import registry
+from roles_royce.protocols.base import ApproveForToken
+from roles_royce.protocols.eth import lido
+from roles_royce.protocols.multisend import MultiSend
+from roles_royce.protocols.registry import SelectorRegistry, get_selector_registry
+from roles_royce.protocols.roles_modifier import ExecTransactionWithRoleV2
+
+APPROVE_SELECTOR = "0x095ea7b3"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROLES_ROYCE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(registry, "_registry", None)
+    return tmp_path
+
+
+def test_generate():
+    selector_registry = SelectorRegistry.generate()
+    assert selector_registry.lookup("0x8d80ff0a") is MultiSend
+    assert (
+        selector_registry.lookup("0x" + ExecTransactionWithRoleV2.get_encoder().selector.hex())
+        is ExecTransactionWithRoleV2
+    )
+    assert (
+        selector_registry.lookup(APPROVE_SELECTOR, target=lido.ApproveRelayerWstETH.token) is lido.ApproveRelayerWstETH
+    )
+    assert ApproveForToken in selector_registry.methods(APPROVE_SELECTOR)
+    assert (
+        selector_registry.lookup("0x" + lido.Wrap.get_encoder().selector.hex(), target=lido.Wrap.target_address)
+        is lido.Wrap
+    )
+    assert "0x00000000" not in selector_registry
+
+
+def test_disk_cache(cache_dir):
+    selector_registry = get_selector_registry()
+    assert get_selector_registry() is selector_registry
+    assert (cache_dir / "selector_registry.json").exists()
+
+    loaded = SelectorRegistry.load(cache_dir / "selector_registry.json")
+    assert loaded.fingerprint == selector_registry.fingerprint
+    assert loaded.entries == selector_registry.entries
+    assert loaded.lookup(APPROVE_SELECTOR, target=lido.ApproveRelayerWstETH.token) is lido.ApproveRelayerWstETH
+
+
+def test_stale_disk_cache_is_regenerated(cache_dir):
+    SelectorRegistry({APPROVE_SELECTOR: [("roles_royce.protocols.base:ApproveForToken", None)]}, "old").save(
+        cache_dir / "selector_registry.json"
+    )
+    selector_registry = get_selector_registry()
+    assert selector_registry.fingerprint != "old"
+    assert selector_registry.lookup("0x8d80ff0a") is MultiSend
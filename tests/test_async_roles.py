@@ -0,0 +1,268 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from defabipedia.multisend import ContractSpecs as MultiSendContractSpecs
+from defabipedia.types import Chain
+from eth_account import Account
+from web3 import Web3
+from web3.exceptions import ContractCustomError
+
+from roles_royce import async_roles, roles
+from roles_royce.async_roles import AsyncPreparedRoleTx, AsyncRolesMod
+from roles_royce.fee_oracle import get_fee_oracle
+from roles_royce.nonce_manager import NonceManager
+from roles_royce.protocols.base import ApproveForToken
+from roles_royce.roles_modifier import NORMAL_FEE_MULTIPLER, NORMAL_GAS_LIMIT_MULTIPLIER
+
+ROLE = 2
+ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
+ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+
+USDT = "0x4ECaBa5870353805a9F068101A40E0f32ed605C6"
+SPENDER = "0x7f90122BF0700F9E7e1F688fe926940E8839F353"
+NOT_ALLOWED_SPENDER = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+OLD_MULTISEND = "0x8D29bE29923b68abfDD21e541b9374737B49cdAD"
+PRIVATE_KEY = "0x" + "11" * 32
+USDT_APPROVE = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+
+
+class FakeProvider:
+    """Provider without URL, its chain id is memoized per instance."""
+
+
+class AsyncCountingEth:
+    """Fake async ``w3.eth`` counting the reads and the most reads in flight at the same time."""
+
+    def __init__(self):
+        self.reads = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _read(self, value):
+        self.reads += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Let the other reads start before answering
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return value
+
+    @property
+    def chain_id(self):
+        return self._read(100)
+
+    @property
+    def max_priority_fee(self):
+        return self._read(1000)
+
+    def get_block(self, block_identifier):
+        return self._read({"number": 1, "timestamp": time.time(), "baseFeePerGas": 50})
+
+    def estimate_gas(self, transaction, block_identifier=None):
+        return self._read(100_000)
+
+    def get_transaction_count(self, account, block_identifier="latest"):
+        return self._read(42)
+
+    async def send_raw_transaction(self, raw_transaction):
+        return bytes([raw_transaction["nonce"]])
+
+    def contract(self, address, abi):
+        return None
+
+
+class OfflineAsyncRolesMod(AsyncRolesMod):
+    def _sign_transaction(self, tx):
+        return SimpleNamespace(rawTransaction=tx)
+
+
+@pytest.fixture(autouse=True)
+def clear_fee_oracle():
+    get_fee_oracle().clear()
+    yield
+    get_fee_oracle().clear()
+
+
+def test_build_reads_concurrently():
+    roles = AsyncRolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=AsyncCountingEth(), provider=FakeProvider()),
+        account=ACCOUNT,
+    )
+    tx = asyncio.run(roles.build(contract_address=USDT, data=USDT_APPROVE))
+    # The latest block, priority fee, gas estimation and nonce are read at the same time
+    assert roles.w3.eth.max_in_flight == 4
+    assert tx == {
+        "value": 0,
+        "chainId": 100,
+        "gas": int(100_000 * NORMAL_GAS_LIMIT_MULTIPLIER),
+        "maxFeePerGas": 1000 + int(50 * NORMAL_FEE_MULTIPLER),
+        "maxPriorityFeePerGas": 1000,
+        "nonce": 42,
+        "to": ROLES_MOD_ADDRESS,
+        "data": roles.encode(USDT, USDT_APPROVE),
+    }
+    # The chain id and the fee data of the block are shared with the next builds
+    reads = roles.w3.eth.reads
+    asyncio.run(roles.build(contract_address=USDT, data=USDT_APPROVE))
+    assert roles.w3.eth.reads == reads + 2
+
+
+def test_concurrent_executions_with_nonce_manager():
+    roles = OfflineAsyncRolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=AsyncCountingEth(), provider=FakeProvider()),
+        account=ACCOUNT,
+        nonce_manager=NonceManager(ACCOUNT),
+    )
+
+    async def execute_many():
+        return await asyncio.gather(
+            *(roles.execute(contract_address=USDT, data=USDT_APPROVE, check=False) for _ in range(5))
+        )
+
+    tx_hashes = asyncio.run(execute_many())
+    # The reads of several executions are in flight at the same time
+    assert roles.w3.eth.max_in_flight > 4
+    assert sorted(tx_hashes) == [bytes([nonce]).hex() for nonce in range(42, 47)]
+
+
+class FakeEth:
+    """Fake ``w3.eth`` of a roles v1 modifier where approvals to ``NOT_ALLOWED_SPENDER`` revert."""
+
+    account = Account
+    chain_id = 100
+    max_priority_fee = 1000
+
+    def __init__(self):
+        self.multisend_reads = 0
+
+    def get_block(self, block_identifier):
+        return {"number": 1, "timestamp": int(time.time()), "baseFeePerGas": 50}
+
+    def call(self, transaction, block_identifier="latest"):
+        if NOT_ALLOWED_SPENDER[2:].lower() in transaction["data"]:
+            no_membership = Web3.keccak(text="NoMembership()").hex()[:10]
+            raise ContractCustomError(no_membership, data=no_membership)
+        return b""
+
+    def estimate_gas(self, transaction, block_identifier=None):
+        self.call(transaction, block_identifier)
+        return 100_000
+
+    def get_transaction_count(self, account, block_identifier="latest"):
+        return 42
+
+    def send_raw_transaction(self, raw_transaction):
+        return Web3.keccak(raw_transaction)
+
+    def wait_for_transaction_receipt(self, tx_hash):
+        return {"transactionHash": tx_hash, "status": 1}
+
+    def multisend(self):
+        self.multisend_reads += 1
+        return OLD_MULTISEND
+
+    def contract(self, address, abi):
+        return SimpleNamespace(functions=SimpleNamespace(multisend=lambda: SimpleNamespace(call=self.multisend)))
+
+
+class AsyncFakeEth:
+    """Async ``w3.eth`` answering like :class:`FakeEth`."""
+
+    account = Account
+
+    def __init__(self):
+        self.sync = FakeEth()
+
+    def __getattr__(self, name):
+        value = getattr(self.sync, name)
+        if callable(value):
+
+            async def method(*args, **kwargs):
+                return value(*args, **kwargs)
+
+            return method
+
+        async def read():
+            return value
+
+        return read()
+
+    def contract(self, address, abi):
+        async def call():
+            return self.sync.multisend()
+
+        return SimpleNamespace(functions=SimpleNamespace(multisend=lambda: SimpleNamespace(call=call)))
+
+
+@pytest.fixture
+def w3s(monkeypatch):
+    """A sync and an async fake Web3 of the same chain, without cached roles modifier multisends."""
+    monkeypatch.setattr(roles, "_roles_mod_multisends", {})
+    sync_w3 = SimpleNamespace(eth=FakeEth(), provider=SimpleNamespace(endpoint_uri="http://sync-node"))
+    async_w3 = SimpleNamespace(eth=AsyncFakeEth(), provider=SimpleNamespace(endpoint_uri="http://async-node"))
+    return sync_w3, async_w3
+
+
+def approvals(*spenders):
+    return [ApproveForToken(token=USDT, spender=spender, amount=1000) for spender in spenders]
+
+
+def test_prepared_role_tx_matches_sync_version(w3s):
+    sync_w3, async_w3 = w3s
+    txs = approvals(SPENDER, SPENDER)
+    prepared = asyncio.run(AsyncPreparedRoleTx.create(txs, ROLE, ROLES_MOD_ADDRESS, async_w3, account=ACCOUNT))
+    # The MultiSend is replaced by the one of the roles v1 modifier
+    assert prepared.to == OLD_MULTISEND
+    assert async_w3.eth.sync.multisend_reads == 1
+    sync_prepared = roles.PreparedRoleTx(txs, ROLE, ROLES_MOD_ADDRESS, sync_w3, account=ACCOUNT)
+    assert (prepared.to, prepared.data, prepared.calldata) == (
+        sync_prepared.to,
+        sync_prepared.data,
+        sync_prepared.calldata,
+    )
+    assert asyncio.run(prepared.check())
+    assert asyncio.run(prepared.estimate_gas()) == sync_prepared.estimate_gas()
+    assert asyncio.run(prepared.build()) == sync_prepared.build()
+
+
+def test_use_old_multisend_if_needed(w3s):
+    sync_w3, async_w3 = w3s
+    multisend = MultiSendContractSpecs[Chain.GNOSIS].MultiSend.address
+    for _ in range(2):
+        assert asyncio.run(async_roles.use_old_multisend_if_needed(async_w3, ROLES_MOD_ADDRESS, multisend)) == (
+            OLD_MULTISEND
+        )
+    assert asyncio.run(async_roles.use_old_multisend_if_needed(async_w3, ROLES_MOD_ADDRESS, USDT)) == USDT
+    # The answer is cached and shared with the sync version
+    assert async_w3.eth.sync.multisend_reads == 1
+    assert roles.use_old_multisend_if_needed(sync_w3, ROLES_MOD_ADDRESS, multisend) == OLD_MULTISEND
+    assert sync_w3.eth.multisend_reads == 0
+
+
+def test_functions_match_sync_versions(w3s):
+    sync_w3, async_w3 = w3s
+    args = dict(role=ROLE, roles_mod_address=ROLES_MOD_ADDRESS)
+    assert asyncio.run(async_roles.build(approvals(SPENDER), account=ACCOUNT, web3=async_w3, **args)) == roles.build(
+        approvals(SPENDER), account=ACCOUNT, web3=sync_w3, **args
+    )
+    assert asyncio.run(async_roles.check(approvals(SPENDER), account=ACCOUNT, web3=async_w3, **args))
+    assert roles.check(approvals(SPENDER), account=ACCOUNT, web3=sync_w3, **args)
+
+    txs_list = [approvals(SPENDER), approvals(NOT_ALLOWED_SPENDER), approvals(SPENDER, SPENDER)]
+    results = asyncio.run(async_roles.check_many(txs_list, account=ACCOUNT, web3=async_w3, **args))
+    sync_results = roles.check_many(txs_list, account=ACCOUNT, web3=sync_w3, **args)
+    assert [result.passed for result in results] == [result.passed for result in sync_results] == [True, False, True]
+    assert results[1].error.args == sync_results[1].error.args == ("NoMembership()", None)
+
+    receipt = asyncio.run(async_roles.send(approvals(SPENDER), private_key=PRIVATE_KEY, web3=async_w3, **args))
+    assert receipt == roles.send(approvals(SPENDER), private_key=PRIVATE_KEY, web3=sync_w3, **args)
+    tx_hash = asyncio.run(
+        async_roles.send(approvals(SPENDER), private_key=PRIVATE_KEY, web3=async_w3, wait_for_receipt=False, **args)
+    )
+    assert tx_hash == receipt["transactionHash"]
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from defabipedia.types import Chain
+
+from roles_royce.chain import clear_chain_cache, get_blockchain, get_chain_id
+
+
+class CountingEth:
+    def __init__(self, chain_id):
+        self._chain_id = chain_id
+        self.calls = 0
+
+    @property
+    def chain_id(self):
+        self.calls += 1
+        return self._chain_id
+
+
+def test_chain_id_is_memoized_per_provider_url():
+    clear_chain_cache()
+    provider = SimpleNamespace(endpoint_uri="http://gnosis-node")
+    w3 = SimpleNamespace(eth=CountingEth(100), provider=provider)
+    assert get_chain_id(w3) == 100
+    assert get_blockchain(w3) == Chain.GNOSIS
+    assert w3.eth.calls == 1
+
+    # A new Web3 instance for the same URL doesn't request the chain id again
+    other_w3 = SimpleNamespace(eth=CountingEth(100), provider=SimpleNamespace(endpoint_uri="http://gnosis-node"))
+    assert get_chain_id(other_w3) == 100
+    assert other_w3.eth.calls == 0
+
+    # If the URL of the provider changes the chain id is requested again
+    provider.endpoint_uri = "http://eth-node"
+    w3.eth._chain_id = 1
+    assert get_blockchain(w3) == Chain.ETHEREUM
+    assert w3.eth.calls == 2
+
+
+def test_chain_id_is_memoized_per_provider_without_url():
+    clear_chain_cache()
+
+    class Provider:
+        pass
+
+    w3 = SimpleNamespace(eth=CountingEth(1), provider=Provider())
+    assert get_chain_id(w3) == 1
+    assert get_chain_id(w3) == 1
+    assert w3.eth.calls == 1
+    assert get_chain_id(SimpleNamespace(eth=CountingEth(100), provider=Provider())) == 100
@@ -1,7 +1,10 @@
 import json
+from unittest.mock import patch
+
+from web3 import Web3
 
 from roles_royce.constants import ETHAddr
-from roles_royce.protocols.base import AvatarAddress, ContractMethod
+from roles_royce.protocols.base import AvatarAddress, ContractMethod, MethodEncoder
 
 AVATAR_ADDRESS = "0x0EFcCBb9E2C09Ea29551879bd9Da32362b32fc89"
 
@@ -157,3 +160,41 @@ def test_method_values():
 def test_method_inputs():
     method = DepositToken(asset=ETHAddr.WETH, amount=10, avatar=AVATAR_ADDRESS)
     assert method.inputs == {"asset": ETHAddr.WETH, "amount": 10, "on_behalf_of": AVATAR_ADDRESS, "referral_code": 0}
+
+
+def test_method_encoder_is_cached_per_class():
+    class MyWithdraw(DepositToken):
+        name = "withdraw"
+
+    method = DepositToken(asset=ETHAddr.WETH, amount=10, avatar=AVATAR_ADDRESS)
+    assert method.data.startswith("0xe8eda9df")
+    assert DepositToken.get_encoder() is DepositToken(asset=ETHAddr.WETH, amount=1, avatar=AVATAR_ADDRESS).get_encoder()
+    assert MyWithdraw.get_encoder() is not DepositToken.get_encoder()
+    assert MyWithdraw.get_encoder().short_signature == "withdraw(address,uint256,address,uint16)"
+    assert method.data == Web3().eth.contract(abi=method.abi).encode_abi(fn_name="deposit", args=method.args_list)
+
+
+def test_encode_many():
+    class MyWithdraw(DepositToken):
+        name = "withdraw"
+
+    methods = [
+        DepositToken(asset=ETHAddr.WETH, amount=10, avatar=AVATAR_ADDRESS),
+        MyWithdraw(asset=ETHAddr.DAI, amount=2**200, avatar=AVATAR_ADDRESS),
+        DepositToken(asset=ETHAddr.USDC, amount=0, avatar=ETHAddr.ZERO),
+    ]
+    assert ContractMethod.encode_many(methods) == [method.data for method in methods]
+    assert ContractMethod.encode_many([]) == []
+
+
+def test_method_inputs_do_not_encode():
+    method = DepositToken(asset=ETHAddr.WETH, amount=10, avatar=AVATAR_ADDRESS)
+    with patch.object(MethodEncoder, "encode", side_effect=AssertionError("inputs should not encode")):
+        assert method.inputs == {
+            "asset": ETHAddr.WETH,
+            "amount": 10,
+            "on_behalf_of": AVATAR_ADDRESS,
+            "referral_code": 0,
+        }
+    encoder = DepositToken.get_encoder()
+    assert method.inputs == encoder.decode(method.data)
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+from roles_royce import evm_utils
+
+# Generous limit for the self import time of evm_utils, in microseconds. It used to be a 200 KB module of strings.
+MAX_EVM_UTILS_IMPORT_TIME_US = 20_000
+
+
+def test_resources():
+    for name in evm_utils.ABIS:
+        abi = getattr(evm_utils, name)
+        assert json.loads(abi) == evm_utils.get_abi(name)
+    for name in evm_utils.BYTECODES:
+        assert bytes.fromhex(getattr(evm_utils, name))
+    assert evm_utils.get_abi("erc20_abi") is evm_utils.get_abi("erc20_abi")
+    from roles_royce.evm_utils import roles_v2_abi
+
+    assert roles_v2_abi == evm_utils.get_resource("roles_v2_abi")
+
+
+def test_import_does_not_load_resources():
+    code = (
+        "import roles_royce.roles, roles_royce.toolshed.alerting.utils\n"
+        "from roles_royce import evm_utils\n"
+        "assert evm_utils.get_resource.cache_info().currsize == 0, 'EVM resources loaded at import time'\n"
+    )
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    # Lines are like "import time:       123 |        456 | roles_royce.evm_utils"
+    evm_utils_line = next(line for line in result.stderr.splitlines() if line.endswith(" roles_royce.evm_utils"))
+    self_time_us = int(evm_utils_line.split("|")[0].split(":")[1])
+    assert self_time_us < MAX_EVM_UTILS_IMPORT_TIME_US
@@ -0,0 +1,60 @@
+import time
+from types import SimpleNamespace
+
+from roles_royce.fee_oracle import FeeOracle
+
+
+class FakeEth:
+    def __init__(self, block_number, timestamp):
+        self.block_number = block_number
+        self.timestamp = timestamp
+        self.reads = 0
+
+    def get_block(self, block_identifier):
+        self.reads += 1
+        return {"number": self.block_number, "timestamp": self.timestamp, "baseFeePerGas": 100}
+
+    @property
+    def max_priority_fee(self):
+        self.reads += 1
+        return 7
+
+
+def make_w3(block_number, timestamp):
+    return SimpleNamespace(eth=FakeEth(block_number, timestamp), provider=SimpleNamespace(endpoint_uri="http://node"))
+
+
+def test_fees_are_fetched_once_per_block():
+    oracle = FeeOracle(block_time=60)
+    w3 = make_w3(block_number=10, timestamp=int(time.time()))
+    fees = oracle.get(w3)
+    assert (fees.block_number, fees.base_fee_per_gas, fees.max_priority_fee) == (10, 100, 7)
+    assert fees.max_fee_per_gas(1.2) == 7 + 120
+    for _ in range(10):
+        assert oracle.get(w3) is fees
+    assert w3.eth.reads == 2
+
+    # Other Web3 instances of the same endpoint share the cache
+    assert oracle.get(make_w3(block_number=10, timestamp=0)) is fees
+
+    # A new head invalidates the cached block
+    oracle.on_new_head(w3, 11)
+    w3.eth.block_number = 11
+    assert oracle.get(w3).block_number == 11
+    assert w3.eth.reads == 4
+
+
+def test_fees_expire_with_the_block_time():
+    oracle = FeeOracle(block_time=5)
+    w3 = make_w3(block_number=10, timestamp=int(time.time()) - 10)
+    oracle.get(w3)
+    oracle.get(w3)
+    assert w3.eth.reads == 4
+
+    # The block time is learnt from consecutive heads
+    w3.eth.block_number, w3.eth.timestamp = 12, int(time.time()) + 100
+    oracle.get(w3)
+    assert oracle._block_times["http://node"] == (100 + 10) / 2
+
+    oracle.clear()
+    assert not oracle._block_times and oracle.cached(w3) is None
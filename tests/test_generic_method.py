@@ -0,0 +1,64 @@
+import tracemalloc
+from dataclasses import dataclass
+
+import pytest
+
+from roles_royce import EncodedTx, Operation, to_encoded_txs
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.base import ApproveForToken
+
+TOKEN = "0x4ECaBa5870353805a9F068101A40E0f32ed605C6"
+SPENDER = "0x7f90122BF0700F9E7e1F688fe926940E8839F353"
+N_TRANSACTABLES = 10_000
+
+
+@dataclass(kw_only=True)
+class DictTxData:
+    """The shape of TxData before it used slots."""
+
+    contract_address: str
+    data: str
+    operation: Operation = Operation.CALL
+    value: int = 0
+
+
+def allocated_bytes(build) -> int:
+    """Bytes allocated by ``build`` and still alive, the strings shared by the objects are not accounted."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(objects) == N_TRANSACTABLES
+    return after - before
+
+
+def test_to_encoded_txs():
+    methods = [ApproveForToken(token=TOKEN, spender=SPENDER, amount=i) for i in range(3)]
+    encoded = to_encoded_txs(methods + [TxData(contract_address=TOKEN, data="0x", value=1)])
+    assert encoded[:3] == [(TOKEN, method.data, Operation.CALL, 0) for method in methods]
+    assert encoded[3] == EncodedTx(TOKEN, "0x", Operation.CALL, 1)
+    assert EncodedTx.from_transactable(methods[0]) == encoded[0]
+    with pytest.raises(AttributeError):
+        encoded[0].value = 1
+
+
+def test_memory_footprint():
+    """TxData and EncodedTx don't carry a per instance ``__dict__``, so large plans can be held in memory."""
+    for transactable in [TxData(contract_address=TOKEN, data="0x"), EncodedTx(TOKEN, "0x")]:
+        assert not hasattr(transactable, "__dict__")
+
+    data = ApproveForToken(token=TOKEN, spender=SPENDER, amount=1).data
+    contract_methods = allocated_bytes(
+        lambda: [ApproveForToken(token=TOKEN, spender=SPENDER, amount=1) for _ in range(N_TRANSACTABLES)]
+    )
+    dict_tx_data = allocated_bytes(
+        lambda: [DictTxData(contract_address=TOKEN, data=data) for _ in range(N_TRANSACTABLES)]
+    )
+    slots_tx_data = allocated_bytes(lambda: [TxData(contract_address=TOKEN, data=data) for _ in range(N_TRANSACTABLES)])
+    encoded_txs = allocated_bytes(lambda: [EncodedTx(TOKEN, data) for _ in range(N_TRANSACTABLES)])
+    assert slots_tx_data < dict_tx_data * 0.8
+    assert encoded_txs < dict_tx_data * 0.9
+    assert encoded_txs < contract_methods / 4
@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+
+from roles_royce import metadata_cache
+from roles_royce.metadata_cache import MetadataCache, cached_metadata, get_metadata_cache
+
+TOKEN = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+
+
+def test_values_are_persisted(tmp_path):
+    path = tmp_path / "metadata.sqlite"
+    cache = MetadataCache(path)
+    cache.set(1, "decimals", TOKEN, 18)
+    cache.set(1, "balancer_pool_id_bytes", TOKEN, b"\x01\x02")
+    cache.set(100, "assets", TOKEN, ("0x01", "0x02"))
+
+    cache = MetadataCache(path)
+    assert cache.get(1, "decimals", TOKEN.lower()) == 18
+    assert cache.get(1, "balancer_pool_id_bytes", TOKEN) == b"\x01\x02"
+    assert cache.get(100, "assets", TOKEN) == ["0x01", "0x02"]
+    # Values are per chain
+    assert cache.get(100, "decimals", TOKEN) is None
+
+    # Returned values are copies
+    cache.get(100, "assets", TOKEN).pop()
+    assert cache.get(100, "assets", TOKEN) == ["0x01", "0x02"]
+
+    cache.clear()
+    assert MetadataCache(path).get(1, "decimals", TOKEN) is None
+
+
+@pytest.fixture
+def global_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROLES_ROYCE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(metadata_cache, "_cache", None)
+    yield get_metadata_cache()
+
+
+def test_cached_metadata(global_cache, tmp_path):
+    assert global_cache.path == tmp_path / "metadata.sqlite"
+    w3 = SimpleNamespace(
+        eth=SimpleNamespace(chain_id=1), provider=SimpleNamespace(endpoint_uri="http://metadata-cache-test")
+    )
+    reads = []
+
+    def fetch():
+        reads.append(TOKEN)
+        return (TOKEN, 6)
+
+    assert cached_metadata(w3, "pool", TOKEN, fetch) == [TOKEN, 6]
+    assert cached_metadata(w3, "pool", TOKEN, fetch) == [TOKEN, 6]
+    assert len(reads) == 1
+
+    def fail():
+        raise ValueError("Pool does not exist")
+
+    with pytest.raises(ValueError):
+        cached_metadata(w3, "pool", "missing", fail)
+    assert global_cache.get(1, "pool", "missing") is None
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import abi
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from roles_royce.multicall import AGGREGATE3_SELECTOR, MULTICALL3_ADDRESS, MulticallBatch
+from roles_royce.protocols.base import ContractMethod
+
+TOKEN = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+BROKEN_TOKEN = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+OWNER = "0x849D52316331967b6fF1198e5E32A0eB168D039d"
+ERC20_ABI = [
+    {
+        "name": "totalSupply",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    }
+]
+
+
+class BalanceOf(ContractMethod):
+    name = "balanceOf"
+    in_signature = [("owner", "address")]
+    out_signature = [("balance", "uint256")]
+
+    def __init__(self, token: str, owner: str):
+        super().__init__()
+        self.target_address = token
+        self.args.owner = owner
+
+
+class Reserves(ContractMethod):
+    name = "getReserves"
+    in_signature = []
+    out_signature = [("reserve0", "uint112"), ("reserve1", "uint112"), ("token", "address")]
+    target_address = TOKEN
+
+
+class FakeEth:
+    """Fake ``w3.eth`` answering Multicall3 ``aggregate3`` calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def answer(self, target: str, data: bytes) -> tuple[bool, bytes]:
+        if target == BROKEN_TOKEN:
+            return False, b""
+        if data[:4] == BalanceOf.get_encoder().selector:
+            (owner,) = abi.decode(["address"], data[4:])
+            return True, abi.encode(["uint256"], [int(owner, 16) % 1000])
+        if data[:4] == Reserves.get_encoder().selector:
+            return True, abi.encode(["uint112", "uint112", "address"], [1, 2, OWNER])
+        return True, abi.encode(["uint256"], [42])
+
+    def call(self, tx, block_identifier="latest"):
+        self.calls.append((tx, block_identifier))
+        if tx["to"] != MULTICALL3_ADDRESS:
+            success, data = self.answer(tx["to"], tx["data"])
+            if not success:
+                raise ContractLogicError("execution reverted")
+            return data
+        assert tx["data"][:4] == AGGREGATE3_SELECTOR
+        (calls,) = abi.decode(["(address,bool,bytes)[]"], tx["data"][4:])
+        results = [self.answer(Web3.to_checksum_address(target), data) for target, _, data in calls]
+        return abi.encode(["(bool,bytes)[]"], [results])
+
+
+@pytest.fixture
+def w3():
+    return SimpleNamespace(eth=FakeEth(), codec=Web3().codec)
+
+
+def test_batch(w3):
+    total_supply = Web3().eth.contract(address=TOKEN, abi=ERC20_ABI).functions.totalSupply()
+    with MulticallBatch(w3, block_identifier=100) as batch:
+        balance = BalanceOf(TOKEN, OWNER).call(w3)
+        reserves = Reserves().call(w3)
+        supply = batch.add_function(total_supply)
+        broken = BalanceOf(BROKEN_TOKEN, OWNER).call(w3)
+        assert not balance.done and len(batch) == 4
+
+    assert len(w3.eth.calls) == 1
+    assert w3.eth.calls[0][1] == 100
+    assert balance.value == int(OWNER, 16) % 1000
+    reserve0, reserve1, token = reserves
+    assert (reserve0, reserve1, token) == (1, 2, OWNER)
+    assert supply.value == 42
+    with pytest.raises(ContractLogicError):
+        broken.value
+
+
+def test_reading_a_result_flushes_the_batch(w3):
+    with MulticallBatch(w3, max_calls=2):
+        balances = [BalanceOf(TOKEN, owner).call(w3) for owner in [OWNER, TOKEN, BROKEN_TOKEN]]
+        assert balances[2].value == int(BROKEN_TOKEN, 16) % 1000
+        assert len(w3.eth.calls) == 2
+    # An aggregate3 call with the first two reads and a direct call for the last one
+    assert [tx["to"] for tx, _ in w3.eth.calls] == [MULTICALL3_ADDRESS, TOKEN]
+    assert [balance.value for balance in balances[:2]] == [int(OWNER, 16) % 1000, int(TOKEN, 16) % 1000]
+
+
+def test_decoding_error(w3):
+    class WrongOutput(ContractMethod):
+        name = "name"
+        out_signature = [("name", "string")]
+        target_address = TOKEN
+
+    with MulticallBatch(w3) as batch:
+        result = WrongOutput().call(w3)
+    with pytest.raises(BadFunctionCallOutput):
+        result.value
+    assert len(batch) == 0
+
+
+def test_failed_request(w3):
+    eth_call = w3.eth.call
+
+    def call(tx, block_identifier="latest"):
+        if len(w3.eth.calls) == 0:
+            w3.eth.calls.append((tx, block_identifier))
+            raise ConnectionError("Connection refused")
+        return eth_call(tx, block_identifier)
+
+    w3.eth.call = call
+    with pytest.raises(ConnectionError):
+        with MulticallBatch(w3, max_calls=2):
+            balances = [BalanceOf(TOKEN, owner).call(w3) for owner in [OWNER, TOKEN, BROKEN_TOKEN]]
+    # Every result of the failed request raises the error, the other request is still made
+    for balance in balances[:2]:
+        with pytest.raises(ConnectionError):
+            balance.value
+    assert balances[2].value == int(BROKEN_TOKEN, 16) % 1000
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from roles_royce.nonce_manager import NonceManager
+
+ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+
+
+class FakeEth:
+    def __init__(self, pending_count):
+        self.pending_count = pending_count
+        self.calls = 0
+
+    def get_transaction_count(self, account, block_identifier="latest"):
+        assert block_identifier == "pending"
+        self.calls += 1
+        return self.pending_count
+
+
+def test_nonces_are_unique_across_threads():
+    w3 = SimpleNamespace(eth=FakeEth(pending_count=10))
+    manager = NonceManager(ACCOUNT)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nonces = list(executor.map(lambda _: manager.next_nonce(w3), range(100)))
+    assert sorted(nonces) == list(range(10, 110))
+    assert w3.eth.calls == 1
+
+
+def test_release_and_resync():
+    w3 = SimpleNamespace(eth=FakeEth(pending_count=5))
+    manager = NonceManager(ACCOUNT)
+
+    with pytest.raises(ValueError):
+        with manager.reserve(w3) as nonce:
+            assert nonce == 5
+            raise ValueError("send failed")
+    # The last nonce is given back
+    assert manager.next_nonce(w3) == 5
+    assert w3.eth.calls == 1
+
+    first = manager.next_nonce(w3)
+    assert manager.next_nonce(w3) == 7
+    # A nonce released while later ones are in use fills the gap before any new nonce
+    manager.release(first)
+    assert [manager.next_nonce(w3), manager.next_nonce(w3)] == [6, 8]
+    # Releasing the top nonces moves the counter back
+    manager.release(6)
+    manager.release(8)
+    manager.release(7)
+    assert [manager.next_nonce(w3) for _ in range(4)] == [6, 7, 8, 9]
+    assert w3.eth.calls == 1
+
+    manager.resync()
+    w3.eth.pending_count = 20
+    assert manager.next_nonce(w3) == 20
@@ -1,8 +1,14 @@
-from defabipedia.types import Chain
+import threading
+from types import SimpleNamespace
+
 from defabipedia.multisend import ContractSpecs as MultiSendContractSpecs
+from defabipedia.types import Chain
+from web3 import Web3
+from web3.exceptions import ContractCustomError
 
-from roles_royce import GenericMethodTransaction, Operation, roles
+from roles_royce import GenericMethodTransaction, Operation, encode_batch, roles
 from roles_royce.constants import GCAddr
+from roles_royce.protocols.base import ApproveForToken
 from roles_royce.utils import multi_or_one
 
 CURVE_USDC_USDT_REWARD_GAUGE = "0x7f90122BF0700F9E7e1F688fe926940E8839F353"
@@ -55,6 +61,16 @@ def test_multi_or_one_multi():
     )
 
 
+def test_encode_batch():
+    approve_method = ApproveForToken(token=GCAddr.USDT, spender=CURVE_USDC_USDT_REWARD_GAUGE, amount=1000)
+    assert encode_batch([approve, approve_method, add_liquidity]) == [
+        approve.data,
+        approve_method.data,
+        add_liquidity.data,
+    ]
+    assert approve_method.data == approve.data
+
+
 def test_check_one(local_node_gc):
     ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
     ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
@@ -81,3 +97,85 @@ def test_check_multi(local_node_gc):
         block=27586992,
     )
     assert status
+
+
+def test_prepared_role_tx(local_node_gc):
+    ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
+    ACCOUNT = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+    prepared = roles.PreparedRoleTx(
+        txs=[approve, add_liquidity],
+        role=2,
+        roles_mod_address=ROLES_MOD_ADDRESS,
+        web3=local_node_gc.w3,
+        account=ACCOUNT,
+    )
+    assert prepared.check(block=27586992)
+    assert prepared.estimate_gas(block=27586992) > 0
+    tx = prepared.build()
+    assert tx["data"] == prepared.calldata
+    assert tx["to"] == ROLES_MOD_ADDRESS
+    assert tx["from"] == ACCOUNT
+
+
+def test_use_old_multisend_if_needed_is_cached(monkeypatch):
+    # Don't leak the cached answers to other tests
+    monkeypatch.setattr(roles, "_roles_mod_multisends", {})
+    calls = []
+
+    class FakeContract:
+        def __init__(self, address, abi):
+            self.functions = self
+            self.address = address
+
+        def multisend(self):
+            return self
+
+        def call(self):
+            calls.append(self.address)
+            return "0x8D29bE29923b68abfDD21e541b9374737B49cdAD"
+
+    roles_mod_address = "0x1cFB0CD7B1111bf2054615C7C491a15C4A3303cc"
+    w3 = SimpleNamespace(
+        eth=SimpleNamespace(chain_id=100, contract=FakeContract), provider=SimpleNamespace(endpoint_uri="http://gnosis")
+    )
+    multisend = MultiSendContractSpecs[Chain.GNOSIS].MultiSend.address
+    for _ in range(3):
+        assert (
+            roles.use_old_multisend_if_needed(w3, roles_mod_address, multisend)
+            == "0x8D29bE29923b68abfDD21e541b9374737B49cdAD"
+        )
+    assert calls == [roles_mod_address]
+    # Other targets don't need the lookup
+    assert roles.use_old_multisend_if_needed(w3, roles_mod_address, GCAddr.USDT) == GCAddr.USDT
+
+    # Preloaded roles modifiers don't make any call
+    preloaded = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
+    roles.preload_roles_mod_multisend(preloaded, multisend)
+    assert roles.use_old_multisend_if_needed(w3, preloaded, multisend) == multisend
+    assert calls == [roles_mod_address]
+
+
+def test_check_many():
+    no_membership = Web3.keccak(text="NoMembership()").hex()[:10]
+    # The static calls only return once the three of them are in flight
+    barrier = threading.Barrier(3, timeout=5)
+
+    def call(transaction, block_identifier="latest"):
+        barrier.wait()
+        if add_liquidity.data[2:10] in transaction["data"]:
+            raise ContractCustomError(no_membership, data=no_membership)
+        return b""
+
+    w3 = SimpleNamespace(
+        eth=SimpleNamespace(chain_id=100, call=call, contract=lambda address, abi: None),
+        provider=SimpleNamespace(endpoint_uri="http://gnosis-check-many"),
+    )
+    results = roles.check_many(
+        [[approve], [add_liquidity], [approve]],
+        role=2,
+        account="0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD",
+        roles_mod_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503",
+        web3=w3,
+    )
+    assert [result.passed for result in results] == [True, False, True]
+    assert results[1].error.args == ("NoMembership()", None)
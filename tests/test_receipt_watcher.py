@@ -0,0 +1,103 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from roles_royce.fee_oracle import FeeOracle
+from roles_royce.receipt_watcher import ReceiptWatcher, _Pending
+
+
+class FakeChain:
+    """Fake ``w3.eth`` where transactions are mined with :meth:`mine`."""
+
+    def __init__(self):
+        self.blocks = [[]]
+        self.receipt_requests = []
+        # Transactions whose receipt is not indexed yet the first time it is requested
+        self.unindexed = set()
+        self._lock = threading.Lock()
+
+    def mine(self, *tx_hashes):
+        with self._lock:
+            self.blocks.append(list(tx_hashes))
+
+    @property
+    def block_number(self):
+        return len(self.blocks) - 1
+
+    def get_block(self, block_identifier):
+        return {"number": block_identifier, "transactions": self.blocks[block_identifier]}
+
+    def get_transaction_receipt(self, tx_hash):
+        self.receipt_requests.append(tx_hash)
+        if tx_hash in self.unindexed:
+            self.unindexed.remove(tx_hash)
+            raise TransactionNotFound(tx_hash)
+        for number, block in enumerate(self.blocks):
+            if tx_hash in block:
+                return {"transactionHash": tx_hash, "blockNumber": number, "status": 1}
+        raise TransactionNotFound(tx_hash)
+
+
+def tx_hash(n: int) -> bytes:
+    return n.to_bytes(32, "big")
+
+
+def make_w3(chain: FakeChain):
+    return SimpleNamespace(eth=chain, provider=SimpleNamespace(endpoint_uri="http://node"))
+
+
+def test_receipts_of_many_transactions():
+    chain = FakeChain()
+    watcher = ReceiptWatcher(make_w3(chain), poll_interval=0.01, timeout=5, fee_oracle=FeeOracle())
+    chain.mine(tx_hash(0))
+    received = []
+    futures = [watcher.watch(tx_hash(n), callback=received.append) for n in range(3)]
+    # Newly watched transactions are checked directly, the mined one is found
+    assert futures[0].result(timeout=1)["blockNumber"] == 1
+    while len(chain.receipt_requests) < 3:
+        time.sleep(0.01)
+
+    chain.mine(tx_hash(2), tx_hash(10))
+    chain.mine()
+    chain.mine(tx_hash(1))
+    assert [future.result(timeout=1)["blockNumber"] for future in futures] == [1, 4, 2]
+    assert sorted(receipt["transactionHash"] for receipt in received) == [tx_hash(0), tx_hash(1), tx_hash(2)]
+    # Receipts of the transactions that are not watched are never requested
+    assert tx_hash(10) not in chain.receipt_requests
+    assert watcher.pending == 0
+
+
+def test_timeout():
+    chain = FakeChain()
+    watcher = ReceiptWatcher(make_w3(chain), poll_interval=0.01, timeout=5, fee_oracle=FeeOracle())
+    with pytest.raises(TimeExhausted):
+        watcher.wait(tx_hash(1), timeout=0.05)
+    assert watcher.pending == 0
+
+
+def test_new_heads_are_reported_to_the_fee_oracle():
+    chain, oracle = FakeChain(), FeeOracle()
+    w3 = make_w3(chain)
+    watcher = ReceiptWatcher(w3, poll_interval=0.01, fee_oracle=oracle)
+    chain.mine()
+    chain.mine(tx_hash(1))
+    watcher.wait(tx_hash(1), timeout=1)
+    assert oracle._heads["http://node"] == 2
+
+
+def test_receipts_not_indexed_yet_are_requested_again():
+    chain = FakeChain()
+    watcher = ReceiptWatcher(make_w3(chain), fee_oracle=FeeOracle())
+    # Watched without starting the polling thread, so the test drives the polls
+    watcher._pending[tx_hash(1)] = _Pending(timeout=5)
+    watcher.poll()
+    chain.mine(tx_hash(1))
+    chain.unindexed.add(tx_hash(1))
+    # The transaction is in the new block but its receipt is not available yet
+    watcher.poll()
+    assert watcher.pending == 1
+    watcher.poll()
+    assert watcher.pending == 0
@@ -1,17 +1,26 @@
+import threading
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from karpatkit.test_utils.fork import local_node_gc_replay as local_node_gc
+from web3 import Web3
+from web3.exceptions import ContractCustomError
 
+from roles_royce.fee_oracle import BlockFees, FeeOracle
+from roles_royce.nonce_manager import NonceManager
 from roles_royce.roles_modifier import (
     AGGRESIVE_FEE_MULTIPLER,
     AGGRESIVE_GAS_LIMIT_MULTIPLIER,
+    BASE_FEE_MAX_CHANGE,
     NORMAL_FEE_MULTIPLER,
     NORMAL_GAS_LIMIT_MULTIPLIER,
+    FeeHistoryGasStrategy,
     GasStrategies,
     RolesMod,
     TransactionWouldBeReverted,
     set_gas_strategy,
+    update_gas_fees_parameters_and_nonce,
 )
 
 ROLE = 2
@@ -95,7 +104,7 @@ def test_gas_strategy(local_node_gc):
     estimated_gas = 100
     base_fee_per_gas = 50
     with patch.object(RolesModTester, "estimate_gas", lambda *args, **kwargs: estimated_gas):
-        with patch.object(RolesModTester, "get_base_fee_per_gas", lambda *args, **kwargs: base_fee_per_gas):
+        with patch.object(FeeOracle, "cached", lambda *args, **kwargs: BlockFees(0, 0, base_fee_per_gas, 0)):
             roles = RolesModTester(
                 role=ROLE, contract_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503", w3=w3, account=ACCOUNT
             )
@@ -109,7 +118,7 @@ def test_gas_strategy(local_node_gc):
     estimated_gas = 100
     base_fee_per_gas = 50
     with patch.object(RolesModTester, "estimate_gas", lambda *args, **kwargs: estimated_gas):
-        with patch.object(RolesModTester, "get_base_fee_per_gas", lambda *args, **kwargs: base_fee_per_gas):
+        with patch.object(FeeOracle, "cached", lambda *args, **kwargs: BlockFees(0, 0, base_fee_per_gas, 0)):
             roles = RolesModTester(
                 role=ROLE, contract_address="0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503", w3=w3, account=ACCOUNT
             )
@@ -117,3 +126,200 @@ def test_gas_strategy(local_node_gc):
             assert tx["gas"] == estimated_gas * AGGRESIVE_GAS_LIMIT_MULTIPLIER
             assert tx["maxPriorityFeePerGas"] == 2000
             assert tx["maxFeePerGas"] == 2000 + base_fee_per_gas * AGGRESIVE_FEE_MULTIPLER
+
+
+@pytest.mark.parametrize("role", [ROLE, "BALANCER-MANAGER"])
+def test_encode_matches_contract_abi(role):
+    w3 = Web3()
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    roles = RolesMod(role=role, contract_address=ROLES_MOD_ADDRESS, w3=w3, account=ACCOUNT)
+    expected = roles.contract.encodeABI(
+        fn_name="execTransactionWithRole",
+        args=[USDT, roles.value, usdt_approve, roles.operation, roles.role, roles.should_revert],
+    )
+    assert roles.encode(USDT, usdt_approve) == expected
+
+
+class FakeProvider:
+    """Provider without URL, its chain id is memoized per instance."""
+
+
+class FakeEth:
+    """Fake ``w3.eth`` answering the reads of a build.
+
+    With a ``barrier``, reads only return once all its parties are waiting, so reads that are not made concurrently
+    break it. The chain id is memoized, its reads are counted instead.
+    """
+
+    def __init__(self, barrier: threading.Barrier | None = None):
+        self.barrier = barrier
+        self.chain_id_reads = 0
+
+    def _read(self, value):
+        if self.barrier is not None:
+            self.barrier.wait()
+        return value
+
+    @property
+    def chain_id(self):
+        self.chain_id_reads += 1
+        return 100
+
+    @property
+    def max_priority_fee(self):
+        return self._read(1000)
+
+    def get_block(self, block_identifier):
+        return self._read({"number": 1, "timestamp": 0, "baseFeePerGas": 50})
+
+    def estimate_gas(self, transaction, block_identifier=None):
+        return self._read(100_000)
+
+    def get_transaction_count(self, account, block_identifier="latest"):
+        return self._read(42)
+
+    def contract(self, address, abi):
+        return None
+
+
+def test_build_reads_concurrently():
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    # The latest block, priority fee, gas estimation and nonce are read at the same time
+    eth = FakeEth(barrier=threading.Barrier(4, timeout=5))
+    roles = RolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=eth, provider=FakeProvider()),
+        account=ACCOUNT,
+    )
+    tx = roles.build(contract_address=USDT, data=usdt_approve)
+    assert tx["chainId"] == 100
+    assert tx["nonce"] == 42
+    assert tx["gas"] == int(100_000 * NORMAL_GAS_LIMIT_MULTIPLIER)
+    assert tx["maxPriorityFeePerGas"] == 1000
+    assert tx["maxFeePerGas"] == 1000 + int(50 * NORMAL_FEE_MULTIPLER)
+    assert tx["data"] == roles.encode(USDT, usdt_approve)
+    # The chain id is only requested once per provider
+    eth.barrier = threading.Barrier(2, timeout=5)
+    roles.build(contract_address=USDT, data=usdt_approve, max_priority_fee=1000, max_fee_per_gas=2000)
+    assert eth.chain_id_reads == 1
+
+    eth.barrier = threading.Barrier(3, timeout=5)
+    tx = update_gas_fees_parameters_and_nonce(roles.w3, {"from": ACCOUNT})
+    assert tx == {
+        "from": ACCOUNT,
+        "maxFeePerGas": 1000 + int(50 * NORMAL_FEE_MULTIPLER),
+        "maxPriorityFeePerGas": 1000,
+        "nonce": 42,
+    }
+
+
+class OfflineRolesMod(RolesMod):
+    """Records the sent transactions instead of signing and sending them, the first ``failures`` sends fail."""
+
+    def __init__(self, *args, failures: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+        self.sent = []
+
+    def _sign_transaction(self, tx):
+        return SimpleNamespace(rawTransaction=tx)
+
+    def _send_raw_transaction(self, raw_transaction):
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("replacement transaction underpriced")
+        self.sent.append(raw_transaction)
+        return bytes([raw_transaction["nonce"]])
+
+
+def test_execute_with_nonce_manager():
+    usdt_approve = "0x095ea7b30000000000000000000000007f90122bf0700f9e7e1f688fe926940e8839f35300000000000000000000000000000000000000000000000000000000000003e8"
+    manager = NonceManager(ACCOUNT)
+    eth = FakeEth()
+    roles = OfflineRolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=eth, provider=FakeProvider()),
+        account=ACCOUNT,
+        nonce_manager=manager,
+        failures=1,
+    )
+    # A failed send may have been broadcast, the nonce is not reused and the manager resyncs from the node
+    with pytest.raises(ValueError):
+        roles.execute(contract_address=USDT, data=usdt_approve, check=False)
+    assert manager._next_nonce is None
+    for _ in range(2):
+        roles.execute(contract_address=USDT, data=usdt_approve, check=False)
+    assert [tx["nonce"] for tx in roles.sent] == [42, 43]
+
+    # A nonce is given back if the transaction couldn't be built, and handed out again
+    with patch.object(eth, "estimate_gas", side_effect=ValueError("execution reverted")):
+        with pytest.raises(ValueError):
+            roles.execute(contract_address=USDT, data=usdt_approve, check=False)
+    roles.execute(contract_address=USDT, data=usdt_approve, check=False)
+    assert [tx["nonce"] for tx in roles.sent] == [42, 43, 44]
+
+
+def test_fee_history_gas_strategy():
+    fee_history = {
+        "oldestBlock": 10,
+        "baseFeePerGas": [100, 110, 120, 128],
+        # The empty block reward is not taken into account
+        "reward": [[0], [30], [10]],
+        "gasUsedRatio": [0.0, 0.9, 0.7],
+    }
+    strategy = FeeHistoryGasStrategy(max_base_fee_increases=2)
+    assert strategy.fees(fee_history) == (30, 30 + int(128 * BASE_FEE_MAX_CHANGE**2))
+    assert strategy.fees(fee_history, max_priority_fee=5) == (5, 5 + int(128 * BASE_FEE_MAX_CHANGE**2))
+
+    fee_history["reward"] = [[0], [0], [0]]
+    assert FeeHistoryGasStrategy(min_priority_fee=1).fees(fee_history)[0] == 1
+
+
+def test_build_with_fee_history_gas_strategy():
+    class FeeHistoryEth(FakeEth):
+        def fee_history(self, block_count, newest_block, reward_percentiles):
+            assert (block_count, newest_block, reward_percentiles) == (5, "latest", [75])
+            return {"baseFeePerGas": [40, 50], "reward": [[1000]]}
+
+        def get_block(self, block_identifier):
+            raise AssertionError("The fee history strategy doesn't need the latest block")
+
+    strategy = FeeHistoryGasStrategy(block_count=5, reward_percentile=75, max_base_fee_increases=0)
+    roles = RolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=FeeHistoryEth(), provider=FakeProvider()),
+        account=ACCOUNT,
+        gas_strategy=strategy,
+    )
+    tx = roles.build(contract_address=USDT, data="0x095ea7b3")
+    assert tx["maxPriorityFeePerGas"] == 1000
+    assert tx["maxFeePerGas"] == 1050
+    assert tx["gas"] == int(100_000 * strategy.limit_multiplier)
+
+
+def test_execute_checks_with_the_gas_estimation():
+    no_membership = Web3.keccak(text="NoMembership()").hex()[:10]
+
+    class RevertingEth(FakeEth):
+        def estimate_gas(self, transaction, block_identifier=None):
+            raise ContractCustomError(no_membership, data=no_membership)
+
+        def call(self, transaction, block_identifier=None):
+            raise AssertionError("The check must not make a separate eth_call")
+
+    roles = OfflineRolesMod(
+        role=ROLE,
+        contract_address=ROLES_MOD_ADDRESS,
+        w3=SimpleNamespace(eth=RevertingEth(), provider=FakeProvider()),
+        account=ACCOUNT,
+    )
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        roles.execute(contract_address=USDT, data="0x095ea7b3")
+    assert e.value.args == ("NoMembership()", None)
+    assert roles.sent == []
+
+    with pytest.raises(TransactionWouldBeReverted):
+        roles.check_and_estimate_gas(contract_address=USDT, data="0x095ea7b3")
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+import requests
+from web3 import Web3
+
+from roles_royce.rpc_pool import HedgedProvider, PooledHTTPProvider, get_pooled_provider, hedged_web3
+
+
+class FakeEndpointProvider:
+    """Endpoint answering its block number, with a ``release`` event it only answers once the event is set."""
+
+    def __init__(self, block_number: int, working: bool = True, release: threading.Event | None = None):
+        self.block_number = block_number
+        self.working = working
+        self.release = release
+        self.requests = 0
+
+    def make_request(self, method, params):
+        self.requests += 1
+        if self.release is not None:
+            assert self.release.wait(timeout=5), "The request was never released"
+        if not self.working:
+            raise requests.exceptions.ConnectionError("Connection refused")
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block_number)}
+
+
+def make_pool(*providers, **kwargs) -> PooledHTTPProvider:
+    pool = PooledHTTPProvider([f"http://node{i}" for i in range(len(providers))], health_check_interval=None, **kwargs)
+    for endpoint, provider in zip(pool.endpoints, providers):
+        endpoint.provider = provider
+    return pool
+
+
+def test_failover_and_ejection():
+    primary, fallback = FakeEndpointProvider(1, working=False), FakeEndpointProvider(2)
+    pool = make_pool(primary, fallback, max_failures=2)
+    w3 = Web3(pool)
+    assert w3.eth.block_number == 2
+    assert pool.is_healthy("http://node0")
+    assert w3.eth.block_number == 2
+    assert not pool.is_healthy("http://node0")
+    # Once ejected, the primary is not tried anymore
+    assert w3.eth.block_number == 2
+    assert primary.requests == 2
+
+    # A successful health check readmits it
+    primary.working = True
+    pool.check_health()
+    assert pool.is_healthy("http://node0")
+
+
+def test_transactions_are_not_sent_twice():
+    primary, fallback = FakeEndpointProvider(1, working=False), FakeEndpointProvider(2)
+    pool = make_pool(primary, fallback)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        pool.make_request("eth_sendRawTransaction", ["0x01"])
+    assert (primary.requests, fallback.requests) == (1, 0)
+
+
+def test_latency_ranking():
+    pool = make_pool(FakeEndpointProvider(1), FakeEndpointProvider(2))
+    pool.endpoints[0].latency, pool.endpoints[1].latency = 0.5, 0.1
+    assert Web3(pool).eth.block_number == 2
+
+    pool.latency_ranked = False
+    assert Web3(pool).eth.block_number == 1
+
+
+def test_no_working_endpoint():
+    pool = make_pool(FakeEndpointProvider(1, working=False), FakeEndpointProvider(2, working=False))
+    assert not Web3(pool).is_connected()
+
+
+def test_shared_pools():
+    provider = get_pooled_provider(["http://localhost:1", ""], health_check_interval=None)
+    assert [endpoint.url for endpoint in provider.endpoints] == ["http://localhost:1"]
+    assert get_pooled_provider(["http://localhost:1"]) is provider
+    assert get_pooled_provider(["http://localhost:1"], latency_ranked=False) is not provider
+
+
+def test_hedged_reads():
+    # The primary endpoint doesn't answer until the fallback one has
+    release = threading.Event()
+    primary, fallback = FakeEndpointProvider(1, release=release), FakeEndpointProvider(2)
+    w3 = Web3(HedgedProvider(make_pool(primary, fallback), default_delay=0.01))
+    assert w3.eth.block_number == 2
+    assert (primary.requests, fallback.requests) == (1, 1)
+    release.set()
+
+    # The deadline is the percentile of the recent latencies of the first endpoint
+    pool = make_pool(primary, fallback)
+    pool.endpoints[0].latencies.extend([5] * 99 + [60])
+    hedged = HedgedProvider(pool, percentile=90)
+    assert hedged.hedge_delay(pool.endpoints[0]) == 5
+    assert Web3(hedged).eth.block_number == 1
+    # The primary answered before the deadline, the read is not sent to the fallback endpoint
+    assert fallback.requests == 1
+
+
+def test_hedged_failures():
+    primary, fallback = FakeEndpointProvider(1, working=False), FakeEndpointProvider(2, working=False)
+    w3 = Web3(HedgedProvider(make_pool(primary, fallback)))
+    assert not w3.is_connected()
+    fallback.working = True
+    assert w3.eth.block_number == 2
+
+
+def test_hedged_web3_needs_a_pool():
+    w3 = Web3(make_pool(FakeEndpointProvider(1)))
+    assert hedged_web3(w3) is w3
+    w3 = Web3(make_pool(FakeEndpointProvider(1), FakeEndpointProvider(2)))
+    assert isinstance(hedged_web3(w3).provider, HedgedProvider)
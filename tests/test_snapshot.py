@@ -0,0 +1,74 @@
+from eth_abi import abi
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from roles_royce.multicall import MulticallBatch
+from roles_royce.protocols.base import ContractMethod
+from roles_royce.snapshot import ChainSnapshot
+
+TOKEN = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+OWNER = "0x849D52316331967b6fF1198e5E32A0eB168D039d"
+
+
+class BalanceOf(ContractMethod):
+    name = "balanceOf"
+    in_signature = [("owner", "address")]
+    out_signature = [("balance", "uint256")]
+    target_address = TOKEN
+
+    def __init__(self, owner: str):
+        super().__init__()
+        self.args.owner = owner
+
+
+class FakeProvider(BaseProvider):
+    """Chain at block 20 where balances are the block number of the read."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == "eth_getBlockByNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": {"number": "0x14", "transactions": []}}
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        if method == "eth_call":
+            block = 20 if params[1] == "latest" else int(params[1], 16)
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x" + abi.encode(["uint256"], [block]).hex()}
+        if method == "eth_getBalance":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(int(params[1], 16) * 10)}
+        raise NotImplementedError(method)
+
+
+def test_reads_are_pinned_and_memoized():
+    provider = FakeProvider()
+    snapshot = ChainSnapshot(Web3(provider), block=12)
+    assert BalanceOf(OWNER).call(snapshot.w3) == 12
+    assert BalanceOf(OWNER).call(snapshot.w3, block_identifier="latest") == 12
+    assert snapshot.w3.eth.get_balance(OWNER) == 120
+    assert snapshot.w3.eth.get_balance(OWNER, "latest") == 120
+    assert [method for method, _ in provider.requests] == ["eth_chainId", "eth_call", "eth_getBalance"]
+    assert snapshot.misses == 3
+
+    # Explicit blocks are respected
+    assert BalanceOf(OWNER).call(snapshot.w3, block_identifier=5) == 5
+    # Multicall batches are pinned too
+    with MulticallBatch(snapshot.w3):
+        balance = BalanceOf(TOKEN).call(snapshot.w3)
+    assert balance.value == 12
+
+    snapshot.clear()
+    assert BalanceOf(OWNER).call(snapshot.w3) == 12
+    assert [method for method, _ in provider.requests].count("eth_call") == 4
+
+
+def test_block_tag_is_resolved_once():
+    provider = FakeProvider()
+    snapshot = ChainSnapshot(Web3(provider))
+    assert snapshot.block == 20
+    assert BalanceOf(OWNER).call(snapshot.w3) == 20
+    assert provider.requests[-1][1][1] == "0x14"
+    # The original Web3 object is unchanged
+    assert Web3(provider).eth.default_block == "latest"
@@ -0,0 +1,101 @@
+import pytest
+from defabipedia import Chain
+
+from roles_royce.constants import ETHAddr
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.base import ApproveForToken, ContractMethod, Operation
+from roles_royce.protocols.multisend import MultiSend
+from roles_royce.protocols.roles_modifier import ExecTransactionWithRoleV1, ExecTransactionWithRoleV2
+from roles_royce.toolshed.decoding import CalldataDecoder, SelectorIndex, unpack_multisend
+
+ROLES_MOD_ADDRESS = "0x8C33ee6E439C874713a9912f3D3debfF1Efb90Da"
+SPENDER = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+
+
+class Deposit(ContractMethod):
+    name = "deposit"
+    in_signature = [("amount", "uint256"), ("receiver", "address")]
+    target_address = ETHAddr.sDAI
+
+    def __init__(self, amount: int, receiver: str):
+        super().__init__()
+        self.args.amount = amount
+        self.args.receiver = receiver
+
+
+class OtherDeposit(Deposit):
+    target_address = ETHAddr.WETH
+
+
+@pytest.fixture
+def decoder():
+    return CalldataDecoder(SelectorIndex([ApproveForToken, Deposit, OtherDeposit]))
+
+
+def test_selector_index():
+    index = SelectorIndex([ApproveForToken, Deposit, OtherDeposit])
+    assert len(index) == 3
+    assert index.lookup("0x095ea7b3") is ApproveForToken
+    assert index.lookup("0x6e553f65") is Deposit
+    assert index.lookup("0x6e553f65", target=ETHAddr.WETH.lower()) is OtherDeposit
+    assert index.lookup("0x12345678") is None
+
+
+def test_decode_exec_transaction_with_role_multisend(decoder):
+    approve = ApproveForToken(token=ETHAddr.DAI, spender=ETHAddr.sDAI, amount=100)
+    deposit = Deposit(amount=100, receiver=SPENDER)
+    transfer = TxData(contract_address=SPENDER, data="0x", value=7)
+    multisend = MultiSend.from_transactables(Chain.ETHEREUM, [approve, deposit, transfer])
+    exec_tx = ExecTransactionWithRoleV2(
+        roles_mod_address=ROLES_MOD_ADDRESS,
+        role="MY-ROLE",
+        to=multisend.contract_address,
+        data=multisend.data,
+        operation=multisend.operation,
+        value=0,
+    )
+
+    call = decoder.decode_exec_transaction_with_role(exec_tx.data, ROLES_MOD_ADDRESS)
+    assert call.method is ExecTransactionWithRoleV2
+    assert call.inputs["role_key"].rstrip(b"\x00") == b"MY-ROLE"
+    assert len(call.calls) == 1
+    multisend_call = call.calls[0]
+    assert multisend_call.method is MultiSend
+    assert multisend_call.operation == Operation.DELEGATE_CALL
+
+    approve_call, deposit_call, transfer_call = call.flatten()
+    assert approve_call.method is ApproveForToken
+    assert approve_call.to == ETHAddr.DAI
+    assert approve_call.inputs == {"spender": ETHAddr.sDAI, "amount": 100}
+    assert deposit_call.method is Deposit
+    assert deposit_call.inputs == deposit.inputs
+    assert transfer_call.selector is None
+    assert transfer_call.value == 7
+
+
+def test_decode_exec_transaction_with_role_v1(decoder):
+    deposit = OtherDeposit(amount=1, receiver=SPENDER)
+    exec_tx = ExecTransactionWithRoleV1(
+        roles_mod_address=ROLES_MOD_ADDRESS,
+        role=3,
+        to=deposit.contract_address,
+        data=deposit.data,
+        operation=0,
+        value=0,
+    )
+    call = decoder.decode_exec_transaction_with_role(exec_tx.data)
+    assert call.method is ExecTransactionWithRoleV1
+    assert call.inputs["role"] == 3
+    assert call.calls[0].method is OtherDeposit
+
+    with pytest.raises(ValueError):
+        decoder.decode_exec_transaction_with_role(deposit.data)
+
+
+def test_unpack_multisend():
+    multisend = MultiSend.from_transactables(
+        Chain.ETHEREUM, [TxData(contract_address=SPENDER, data="0x1234", operation=Operation.DELEGATE_CALL)]
+    )
+    assert unpack_multisend(multisend.args.transactions) == [(Operation.DELEGATE_CALL, SPENDER, 0, b"\x12\x34")]
+    with pytest.raises(ValueError):
+        unpack_multisend(multisend.args.transactions[:-1])
@@ -0,0 +1,51 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from web3 import Web3
+from web3.exceptions import ContractCustomError
+
+from roles_royce.constants import GCAddr
+from roles_royce.protocols.base import ApproveForToken
+from roles_royce.toolshed.disassembling.disassembler import Disassembler
+
+AVATAR = "0x849D52316331967b6fF1198e5E32A0eB168D039d"
+ROLES_MOD_ADDRESS = "0xB6CeDb9603e7992A5d42ea2246B3ba0a21342503"
+SIGNER = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+SPENDER = "0x7f90122BF0700F9E7e1F688fe926940E8839F353"
+NOT_ALLOWED_SPENDER = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+
+
+def test_check_many():
+    no_membership = Web3.keccak(text="NoMembership()").hex()[:10]
+    # The static calls only return once the three of them are in flight
+    barrier = threading.Barrier(3, timeout=5)
+    callers = []
+
+    def call(transaction, block_identifier="latest"):
+        barrier.wait()
+        callers.append((transaction["from"], block_identifier))
+        if NOT_ALLOWED_SPENDER[2:].lower() in transaction["data"]:
+            raise ContractCustomError(no_membership, data=no_membership)
+        return b""
+
+    w3 = SimpleNamespace(
+        eth=SimpleNamespace(chain_id=100, call=call, contract=lambda address, abi: None),
+        provider=SimpleNamespace(endpoint_uri="http://gnosis-disassembler"),
+    )
+    disassembler = Disassembler(
+        w3=w3, avatar_safe_address=AVATAR, roles_mod_address=ROLES_MOD_ADDRESS, role=2, signer_address=SIGNER
+    )
+    txns_list = [[ApproveForToken(GCAddr.USDT, spender, 1000)] for spender in [SPENDER, NOT_ALLOWED_SPENDER, SPENDER]]
+    results = disassembler.check_many(txns_list, block=100)
+    assert [result.passed for result in results] == [True, False, True]
+    assert results[1].error.args == ("NoMembership()", None)
+    assert callers == [(SIGNER, 100)] * 3
+
+    results = disassembler.check_many(txns_list[:1] * 3, from_address=AVATAR)
+    assert all(result.passed for result in results)
+    assert callers[3:] == [(AVATAR, "latest")] * 3
+
+    disassembler.signer_address = None
+    with pytest.raises(ValueError):
+        disassembler.check_many(txns_list)
@@ -0,0 +1,338 @@
+import eth_abi
+import pytest
+from defabipedia import Chain
+from eth_utils import event_abi_to_log_topic
+from web3 import Web3
+
+from roles_royce.constants import ETHAddr
+from roles_royce.evm_utils import get_abi
+from roles_royce.generic_method import TxData
+from roles_royce.protocols.base import ApproveForToken, ContractMethod, Operation
+from roles_royce.protocols.multisend import MultiSendBuilder
+from roles_royce.protocols.roles_modifier import ExecTransactionWithRoleV2
+from roles_royce.roles_modifier import TransactionWouldBeReverted
+from roles_royce.toolshed.permissions import Condition, Operator, ParameterType, RolePermissions, Status
+
+ROLES_MOD_ADDRESS = "0x8C33ee6E439C874713a9912f3D3debfF1Efb90Da"
+MODULE = "0x7e19DE37A31E40eec58977CEA36ef7fB70e2c5CD"
+MULTISEND = "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"
+SPENDER = "0xBA12222222228d8Ba445958a75a0704d566BF2C8"
+ROUTER = "0x5b2364fD757E262253423373E4D57C5c011Ad7F4"
+ZERO_INFO = b"\0" * 32
+
+
+def word(value: int | str) -> str:
+    if isinstance(value, str):
+        return "0x" + value.removeprefix("0x").lower().rjust(64, "0")
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+class Swap(ContractMethod):
+    name = "swap"
+    in_signature = [("amount", "uint256"), ("path", "address[]")]
+    target_address = ROUTER
+
+    def __init__(self, amount: int, path: list[str]):
+        super().__init__()
+        self.args.amount = amount
+        self.args.path = path
+
+
+EXPORT = {
+    "key": "MyRole",
+    "members": [MODULE],
+    "targets": [
+        {"address": ETHAddr.sDAI, "clearance": "Target", "executionOptions": "None"},
+        {
+            "address": ETHAddr.DAI,
+            "clearance": 2,
+            "executionOptions": 0,
+            "functions": [
+                {
+                    "selector": "0x095ea7b3",
+                    "executionOptions": 0,
+                    "wildcarded": False,
+                    "condition": {
+                        "paramType": 5,
+                        "operator": 5,
+                        "children": [
+                            {"paramType": 1, "operator": 16, "compValue": word(SPENDER)},
+                            {"paramType": 1, "operator": 18, "compValue": word(1000)},
+                        ],
+                    },
+                }
+            ],
+        },
+        {
+            "address": ROUTER,
+            "clearance": "Function",
+            "executionOptions": "None",
+            "functions": [
+                {
+                    "selector": Swap.get_encoder().selector,
+                    "executionOptions": "Send",
+                    "conditions": [
+                        [0, 5, 5, "0x"],
+                        [0, 1, 0, "0x"],
+                        [0, 4, 7, "0x"],
+                        [2, 0, 2, "0x"],
+                        [3, 1, 16, word(ETHAddr.DAI)],
+                        [3, 1, 16, word(ETHAddr.WETH)],
+                    ],
+                }
+            ],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def role():
+    return RolePermissions.from_json(EXPORT)
+
+
+def assert_reverts_with(error, *args):
+    assert error.value.args == args
+
+
+def test_condition_from_flat():
+    condition = Condition.from_flat(EXPORT["targets"][2]["functions"][0]["conditions"])
+    assert (condition.param_type, condition.operator) == (ParameterType.CALLDATA, Operator.MATCHES)
+    assert [child.param_type for child in condition.children] == [ParameterType.STATIC, ParameterType.ARRAY]
+    or_condition = condition.children[1].children[0]
+    assert or_condition.operator == Operator.OR
+    assert or_condition.type_node.param_type == ParameterType.STATIC
+    assert or_condition.children[1].comp_value == bytes.fromhex(word(ETHAddr.WETH)[2:])
+
+
+def test_scoped_function(role):
+    assert role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 999).data)
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, ROUTER, 999).data)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.PARAMETER_NOT_ALLOWED, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 1000).data)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.PARAMETER_GREATER_THAN_ALLOWED, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, "0x095ea7b3" + word(SPENDER)[2:])
+    assert_reverts_with(e, "CalldataOutOfBounds()", None)
+
+
+def test_array_conditions(role):
+    assert role.check_transaction(ROUTER, 10, Swap(100, [ETHAddr.WETH, ETHAddr.DAI]).data)
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ROUTER, 0, Swap(100, [ETHAddr.WETH, ETHAddr.USDC]).data)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.NOT_EVERY_ARRAY_ELEMENT_PASSES, ZERO_INFO))
+
+
+def test_on_chain_operators_are_left_to_the_contract():
+    # approve(SPENDER, amount) where the amount is neither within an allowance nor 1000
+    amount_condition = {
+        "paramType": 0,
+        "operator": Operator.NOR,
+        "children": [
+            {"paramType": 1, "operator": Operator.WITHIN_ALLOWANCE, "compValue": word(1)},
+            {"paramType": 1, "operator": Operator.EQUAL_TO, "compValue": word(1000)},
+        ],
+    }
+    export = {
+        "key": "MyRole",
+        "members": [MODULE],
+        "targets": [
+            {
+                "address": ETHAddr.DAI,
+                "clearance": "Function",
+                "executionOptions": "None",
+                "functions": [
+                    {
+                        "selector": "0x095ea7b3",
+                        "executionOptions": "None",
+                        "condition": {
+                            "paramType": 5,
+                            "operator": 5,
+                            "children": [
+                                {"paramType": 1, "operator": 16, "compValue": word(SPENDER)},
+                                amount_condition,
+                            ],
+                        },
+                    }
+                ],
+            }
+        ],
+    }
+    role = RolePermissions.from_json(export)
+    # The allowance can only be checked on chain, so it is not a NOR violation here
+    assert role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 999).data)
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 1000).data)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.NOR_VIOLATION, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, ROUTER, 999).data)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.PARAMETER_NOT_ALLOWED, ZERO_INFO))
+
+
+def test_targets_functions_and_options(role):
+    assert role.check_transaction(ETHAddr.sDAI, 0, "0x12345678")
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.sDAI, 1, "0x")
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.SEND_NOT_ALLOWED, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.sDAI, 0, "0x", operation=Operation.DELEGATE_CALL)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.DELEGATE_CALL_NOT_ALLOWED, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.USDC, 0, "0x")
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.TARGET_ADDRESS_NOT_ALLOWED, ZERO_INFO))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, "0xa9059cbb")
+    info = bytes.fromhex("a9059cbb").ljust(32, b"\0")
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.FUNCTION_NOT_ALLOWED, info))
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(ETHAddr.DAI, 0, "0x0102")
+    assert_reverts_with(e, "FunctionSignatureTooShort()", None)
+
+
+def test_exec_transaction_with_role_multisend(role):
+    def exec_calldata(txs):
+        multisend = MultiSendBuilder(txs).build(Chain.ETHEREUM, target_address=MULTISEND)
+        return ExecTransactionWithRoleV2(
+            roles_mod_address=ROLES_MOD_ADDRESS,
+            role="MyRole",
+            to=multisend.contract_address,
+            data=multisend.data,
+            operation=multisend.operation,
+            value=0,
+        ).data
+
+    allowed = exec_calldata(
+        [ApproveForToken(ETHAddr.DAI, SPENDER, 10), TxData(contract_address=ETHAddr.sDAI, data="0x")]
+    )
+    assert role.check_exec_transaction_with_role(allowed, module=MODULE)
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_exec_transaction_with_role(allowed, module=SPENDER)
+    assert_reverts_with(e, "NoMembership()", None)
+
+    not_allowed = exec_calldata([ApproveForToken(ETHAddr.DAI, SPENDER, 10), ApproveForToken(ETHAddr.USDC, SPENDER, 10)])
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_exec_transaction_with_role(not_allowed, module=MODULE)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.TARGET_ADDRESS_NOT_ALLOWED, ZERO_INFO))
+
+    # The MultiSend is only unwrapped when it is delegate called
+    multisend = MultiSendBuilder([ApproveForToken(ETHAddr.DAI, SPENDER, 10)]).build(Chain.ETHEREUM, MULTISEND)
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(MULTISEND, 0, multisend.data, operation=Operation.CALL)
+    assert_reverts_with(e, "MalformedMultiEntrypoint()", None)
+
+
+def test_from_events():
+    role_key = bytes.fromhex(RolePermissions.from_json(EXPORT).role_key[2:])
+    other_role_key = b"\1" * 32
+    approve_conditions = [
+        (0, 5, 5, b""),
+        (0, 1, 16, bytes.fromhex(word(SPENDER)[2:])),
+        (0, 1, 0, b""),
+    ]
+    events = [
+        {"event": "AssignRoles", "args": {"module": MODULE, "roleKeys": [role_key], "memberOf": [True]}},
+        {"event": "AllowTarget", "args": {"roleKey": role_key, "targetAddress": ETHAddr.sDAI, "options": 1}},
+        {"event": "AllowTarget", "args": {"roleKey": other_role_key, "targetAddress": ETHAddr.USDC, "options": 3}},
+        {"event": "ScopeTarget", "args": {"roleKey": role_key, "targetAddress": ETHAddr.DAI}},
+        {
+            "event": "ScopeFunction",
+            "args": {
+                "roleKey": role_key,
+                "targetAddress": ETHAddr.DAI,
+                "selector": bytes.fromhex("095ea7b3"),
+                "conditions": approve_conditions,
+                "options": 0,
+            },
+        },
+        {
+            "event": "AllowFunction",
+            "args": {
+                "roleKey": role_key,
+                "targetAddress": ETHAddr.DAI,
+                "selector": bytes.fromhex("a9059cbb"),
+                "options": 0,
+            },
+        },
+        {
+            "event": "RevokeFunction",
+            "args": {"roleKey": role_key, "targetAddress": ETHAddr.DAI, "selector": bytes.fromhex("a9059cbb")},
+        },
+    ]
+    role = RolePermissions.from_events(events, role_key)
+    assert role.members == {MODULE.lower()}
+    assert role.check_transaction(ETHAddr.sDAI, 5, "0x")
+    assert role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 2**200).data)
+    for to, data in [
+        (ETHAddr.USDC, "0x"),
+        (ETHAddr.DAI, ApproveForToken(ETHAddr.DAI, ROUTER, 1).data),
+        (ETHAddr.DAI, "0xa9059cbb" + eth_abi.encode(["address", "uint256"], [SPENDER, 1]).hex()),
+    ]:
+        with pytest.raises(TransactionWouldBeReverted):
+            role.check_transaction(to, 0, data)
+
+
+def test_from_decoded_logs():
+    role_key = bytes.fromhex(RolePermissions.from_json(EXPORT).role_key[2:])
+    contract = Web3().eth.contract(ROLES_MOD_ADDRESS, abi=get_abi("roles_v2_abi"))
+    event = contract.events.ScopeFunction()
+    conditions = [(0, 5, 5, b""), (0, 1, 16, bytes.fromhex(word(SPENDER)[2:])), (0, 1, 0, b"")]
+    log = {
+        "address": ROLES_MOD_ADDRESS,
+        "topics": [event_abi_to_log_topic(event.abi)],
+        "data": eth_abi.encode(
+            ["bytes32", "address", "bytes4", "(uint8,uint8,uint8,bytes)[]", "uint8"],
+            [role_key, ETHAddr.DAI, bytes.fromhex("095ea7b3"), conditions, 0],
+        ),
+        "blockNumber": 1,
+        "blockHash": b"\0" * 32,
+        "transactionHash": b"\0" * 32,
+        "transactionIndex": 0,
+        "logIndex": 0,
+    }
+    decoded = event.process_log(log)
+    scope_target = {"event": "ScopeTarget", "args": {"roleKey": role_key, "targetAddress": ETHAddr.DAI}}
+    role = RolePermissions.from_events([scope_target, decoded], role_key)
+    assert role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, SPENDER, 1).data)
+    with pytest.raises(TransactionWouldBeReverted):
+        role.check_transaction(ETHAddr.DAI, 0, ApproveForToken(ETHAddr.DAI, ROUTER, 1).data)
+
+
+def test_unwrappers_and_avatar_from_events():
+    role_key = b"\1" * 32
+    events = [
+        {"event": "ScopeTarget", "args": {"roleKey": role_key, "targetAddress": ETHAddr.DAI}},
+        {
+            "event": "ScopeFunction",
+            "args": {
+                "roleKey": role_key,
+                "targetAddress": ETHAddr.DAI,
+                "selector": bytes.fromhex("095ea7b3"),
+                "conditions": [(0, 5, 5, b""), (0, 1, 15, b""), (0, 1, 0, b"")],
+                "options": 0,
+            },
+        },
+    ]
+    role = RolePermissions.from_events(events, role_key)
+    multisend = MultiSendBuilder([ApproveForToken(ETHAddr.DAI, SPENDER, 10)]).build(Chain.ETHEREUM, MULTISEND)
+    # Without a SetUnwrapAdapter event the MultiSend is checked as a target
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(MULTISEND, 0, multisend.data, operation=Operation.DELEGATE_CALL)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.TARGET_ADDRESS_NOT_ALLOWED, ZERO_INFO))
+
+    role.apply_event(
+        "SetUnwrapAdapter",
+        {
+            "to": MULTISEND,
+            "selector": bytes.fromhex("8d80ff0a"),
+            "adapter": "0x93B7fCbc63ED8a3a24B59e1C3e6649D50B7427c0",
+        },
+    )
+    # EqualToAvatar fails while the avatar is unknown
+    with pytest.raises(TransactionWouldBeReverted) as e:
+        role.check_transaction(MULTISEND, 0, multisend.data, operation=Operation.DELEGATE_CALL)
+    assert_reverts_with(e, "ConditionViolation(uint8,bytes32)", (Status.PARAMETER_NOT_ALLOWED, ZERO_INFO))
+
+    role.apply_event("AvatarSet", {"previousAvatar": ROUTER, "newAvatar": SPENDER})
+    assert role.check_transaction(MULTISEND, 0, multisend.data, operation=Operation.DELEGATE_CALL)